@@ -0,0 +1,56 @@
+"""
+Time ApiClient.response_deserialize on small responses, where the fixed cost
+outside JSON parsing and pydantic (type lookup, charset parsing) shows up.
+
+Run from the repository root: python benchmarks/bench_deserializers.py [iterations]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lighter  # noqa: E402
+from payloads import simple_order  # noqa: E402
+
+
+class StubResponse:
+    status = 200
+
+    def __init__(self, payload):
+        self.data = json.dumps(payload).encode("utf-8")
+
+    def getheader(self, name, default=None):
+        return "application/json; charset=utf-8"
+
+    def getheaders(self):
+        return {}
+
+
+CASES = [
+    ("List[SimpleOrder] (20 items)", "List[SimpleOrder]", [simple_order(i, 3024.12 + i) for i in range(20)]),
+    ("NextNonce", "NextNonce", {"code": 200, "nonce": 4242}),
+    ("RespSendTx", "RespSendTx", {"code": 200, "tx_hash": "0x" + "ab" * 32, "predicted_execution_time_ms": 1760000000000}),
+]
+
+
+async def main(iterations: int):
+    for mode in ("record", "model"):
+        client = lighter.ApiClient(response_mode=mode)
+        try:
+            for label, response_type, payload in CASES:
+                response, types_map = StubResponse(payload), {"200": response_type}
+                client.response_deserialize(response, types_map)  # compile once
+                started_at = time.perf_counter()
+                for _ in range(iterations):
+                    client.response_deserialize(response, types_map)
+                print(f"{mode:6} {label:30} {(time.perf_counter() - started_at) / iterations * 1e6:6.1f}us")
+        finally:
+            await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000))
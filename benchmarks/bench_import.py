@@ -0,0 +1,58 @@
+"""
+Import cost of the lighter package in fresh interpreters: bare `import lighter`,
+and importing it plus resolving the names the bot uses.
+
+Run from the repository root: python benchmarks/bench_import.py [runs]
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, resource, sys, time
+started_at = time.perf_counter()
+import lighter
+{resolve}
+elapsed = time.perf_counter() - started_at
+print(json.dumps({{
+    "seconds": elapsed,
+    "modules": len(sys.modules),
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "eth_account": "eth_account" in sys.modules,
+}}))
+"""
+
+SCENARIOS = [
+    ("import lighter", ""),
+    (
+        "import lighter and resolve the bot's names",
+        "lighter.SignerClient, lighter.OrderApi, lighter.TransactionApi, lighter.WsClient, "
+        "lighter.OrderBookOrders, lighter.DetailedAccounts, lighter.nonce_manager",
+    ),
+]
+
+
+def probe(resolve: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(resolve=resolve)],
+        capture_output=True, text=True, check=True, cwd=ROOT,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(runs: int):
+    for label, resolve in SCENARIOS:
+        results = [probe(resolve) for _ in range(runs)]
+        seconds = sorted(result["seconds"] for result in results)
+        last = results[-1]
+        print(f"{label}")
+        print(f"  {seconds[0]:.2f}-{seconds[-1]:.2f}s over {runs} runs, {last['modules']} modules, "
+              f"max RSS {last['max_rss_mb']:.1f}MB, eth_account {'loaded' if last['eth_account'] else 'not loaded'}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
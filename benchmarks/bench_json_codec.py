@@ -0,0 +1,43 @@
+"""
+Time lighter.json_codec loads/dumps per backend on websocket frames shaped like
+the recorded order_book and account_all updates.
+
+Run from the repository root: python benchmarks/bench_json_codec.py [iterations]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lighter import json_codec  # noqa: E402
+from payloads import account_all_frame, order_book_frame  # noqa: E402
+
+FRAMES = [
+    ("order_book update, 100 levels per side", order_book_frame(100)),
+    ("account_all update, 30 positions", account_all_frame(30)),
+]
+
+
+def per_call(func, arg, iterations: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        func(arg)
+    return (time.perf_counter() - started_at) / iterations * 1e6
+
+
+def main(iterations: int):
+    backends = [name for name in json_codec.BACKENDS if name != "orjson" or json_codec.orjson is not None]
+    for label, frame in FRAMES:
+        text = json_codec.dumps(frame)
+        print(f"{label}, {len(text) / 1000:.1f}kB")
+        for backend in backends:
+            json_codec.set_backend(backend)
+            loads = per_call(json_codec.loads, text, iterations)
+            dumps = per_call(json_codec.dumps, frame, iterations)
+            print(f"  {backend:7} loads {loads:6.1f}us, dumps {dumps:6.1f}us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3000)
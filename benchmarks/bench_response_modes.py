@@ -0,0 +1,54 @@
+"""
+Time lighter.ApiClient.deserialize in model, record and dict response modes,
+including JSON parsing and reading the fields the bot uses.
+
+Run from the repository root: python benchmarks/bench_response_modes.py [iterations]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lighter  # noqa: E402
+from payloads import detailed_accounts, order_book_orders  # noqa: E402
+
+
+def best_price(book, mode):
+    return book["asks"][0]["price"] if mode == "dict" else book.asks[0].price
+
+
+def position_fields(accounts, mode):
+    if mode == "dict":
+        return [(p["market_id"], p["sign"], p["position"]) for p in accounts["accounts"][0]["positions"]]
+    return [(p.market_id, p.sign, p.position) for p in accounts.accounts[0].positions]
+
+
+CASES = [
+    ("OrderBookOrders, 50 asks + 50 bids, best price", "OrderBookOrders", order_book_orders(50), best_price),
+    ("DetailedAccounts, 30 positions, id/sign/size", "DetailedAccounts", detailed_accounts(30), position_fields),
+]
+
+
+async def main(iterations: int):
+    clients = {mode: lighter.ApiClient(response_mode=mode) for mode in ("model", "record", "dict")}
+    try:
+        for label, response_type, payload, read in CASES:
+            text = json.dumps(payload)
+            print(label)
+            for mode, client in clients.items():
+                read(client.deserialize(text, response_type, "application/json"), mode)  # warm caches
+                started_at = time.perf_counter()
+                for _ in range(iterations):
+                    read(client.deserialize(text, response_type, "application/json"), mode)
+                print(f"  {mode:7} {(time.perf_counter() - started_at) / iterations * 1e6:7.1f}us per response")
+    finally:
+        for client in clients.values():
+            await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -0,0 +1,73 @@
+"""
+Per-call overhead of SignerClient's process_api_key_and_nonce decorator,
+compared with the previous implementation that bound the signature on every call.
+
+Run from the repository root: python benchmarks/bench_signer_decorator.py [calls]
+"""
+
+import asyncio
+import inspect
+import os
+import sys
+import time
+from functools import wraps
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lighter.signer_client import CODE_OK, process_api_key_and_nonce  # noqa: E402
+
+OK = SimpleNamespace(code=CODE_OK)
+
+
+def bind_per_call(func):
+    """The decorator before it resolved the parameter layout at decoration time"""
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        bound_args = inspect.signature(func).bind(self, *args, **kwargs)
+        bound_args.apply_defaults()
+        api_key_index = bound_args.arguments.get("api_key_index", -1)
+        nonce = bound_args.arguments.get("nonce", -1)
+        if api_key_index == -1 and nonce == -1:
+            api_key_index, nonce = self.nonce_manager.next_nonce()
+        partial_arguments = {k: v for k, v in bound_args.arguments.items() if k not in ("self", "nonce", "api_key_index")}
+        return await func(self, **partial_arguments, nonce=nonce, api_key_index=api_key_index)
+    return wrapper
+
+
+class FixedNonceManager:
+    async def ready(self):
+        pass
+
+    def next_nonce(self):
+        return 0, 1
+
+
+async def create_order(self, market_index, client_order_index, base_amount, price, is_ask, order_type,
+                       time_in_force, reduce_only=False, trigger_price=0, order_expiry=-1, nonce=-1, api_key_index=-1):
+    return None, OK, None
+
+
+class Client:
+    nonce_manager = FixedNonceManager()
+    current = process_api_key_and_nonce(create_order)
+    previous = bind_per_call(create_order)
+
+
+async def measure(method, calls: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(calls):
+        await method(1, 2, 1000, 3000, True, 0, 1, reduce_only=True)
+    return (time.perf_counter() - started_at) / calls * 1e6
+
+
+async def main(calls: int):
+    client = Client()
+    baseline = await measure(lambda *a, **k: create_order(client, *a, **k), calls)
+    for name in ("previous", "current"):
+        per_call = await measure(getattr(client, name), calls)
+        print(f"{name:9} {per_call - baseline:6.2f}us decorator overhead per call")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
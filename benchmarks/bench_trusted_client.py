@@ -0,0 +1,68 @@
+"""
+Per-call overhead of generated Lighter API methods on a validating and a trusted
+ApiClient. call_api and response_deserialize are stubbed, so only argument
+validation and request serialization are timed.
+
+Run from the repository root: python benchmarks/bench_trusted_client.py [calls]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lighter  # noqa: E402
+from lighter.api_response import ApiResponse  # noqa: E402
+
+
+class StubResponse:
+    status = 200
+    response = None
+
+    async def read(self):
+        return b"{}"
+
+
+async def call_api(*args, **kwargs):
+    return StubResponse()
+
+
+def response_deserialize(response_data, response_types_map=None):
+    return ApiResponse(status_code=200, data=None, headers=None, raw_data=b"{}")
+
+
+CALLS = [
+    ("order_book_orders", lighter.OrderApi, "order_book_orders", dict(market_id=0, limit=50)),
+    ("order_book_orders_with_http_info", lighter.OrderApi, "order_book_orders_with_http_info", dict(market_id=0, limit=50)),
+    ("send_tx", lighter.TransactionApi, "send_tx", dict(tx_type=14, tx_info="{}")),
+    ("send_tx_without_preload_content", lighter.TransactionApi, "send_tx_without_preload_content", dict(tx_type=14, tx_info="{}")),
+]
+
+
+async def measure(method, kwargs, calls: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(calls):
+        await method(**kwargs)
+    return (time.perf_counter() - started_at) / calls * 1e6
+
+
+async def main(calls: int):
+    clients = {trusted: lighter.ApiClient(trusted=trusted) for trusted in (False, True)}
+    try:
+        for client in clients.values():
+            client.call_api = call_api
+            client.response_deserialize = response_deserialize
+        for label, api_class, name, kwargs in CALLS:
+            validated, trusted = [
+                await measure(getattr(api_class(clients[flag]), name), kwargs, calls) for flag in (False, True)
+            ]
+            print(f"{label:34} validated {validated:5.1f}us -> trusted {trusted:5.1f}us")
+    finally:
+        for client in clients.values():
+            await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000))
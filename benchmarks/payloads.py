@@ -0,0 +1,71 @@
+"""Synthetic Lighter REST and websocket payloads shaped like recorded responses, shared by the benchmarks"""
+
+
+def simple_order(index: int, price: float) -> dict:
+    return {
+        "order_index": index, "order_id": str(index), "owner_account_index": 1000 + index,
+        "initial_base_amount": "1.2500", "remaining_base_amount": "0.6200",
+        "price": f"{price:.2f}", "order_expiry": 1760000000000 + index,
+    }
+
+
+def order_book_orders(levels: int = 50) -> dict:
+    """OrderBookOrders response with `levels` asks and bids"""
+    return {
+        "code": 200, "total_asks": levels, "total_bids": levels,
+        "asks": [simple_order(i, 3024.12 + i * 0.01) for i in range(levels)],
+        "bids": [simple_order(levels + i, 3024.11 - i * 0.01) for i in range(levels)],
+    }
+
+
+def account_position(market_id: int) -> dict:
+    return {
+        "market_id": market_id, "symbol": f"M{market_id}", "initial_margin_fraction": "20.00",
+        "open_order_count": 1, "pending_order_count": 0, "position_tied_order_count": 0,
+        "sign": 1 if market_id % 2 else -1, "position": "0.5000", "avg_entry_price": "3024.12",
+        "position_value": "1512.06", "unrealized_pnl": "1.20", "realized_pnl": "0.00",
+        "liquidation_price": "3500.00", "total_funding_paid_out": "0.01", "margin_mode": 0,
+        "allocated_margin": "0",
+    }
+
+
+def detailed_accounts(positions: int = 30) -> dict:
+    """DetailedAccounts response for one account with `positions` open positions"""
+    return {
+        "code": 200, "total": 1,
+        "accounts": [{
+            "code": 200, "account_type": 0, "index": 12, "l1_address": "0x" + "ab" * 20, "cancel_all_time": 0,
+            "total_order_count": 3, "total_isolated_order_count": 0, "pending_order_count": 0,
+            "available_balance": "100.00", "status": 1, "collateral": "150.00", "account_index": 12,
+            "name": "", "description": "", "can_invite": True, "referral_points_percentage": "0",
+            "positions": [account_position(i) for i in range(positions)],
+            "total_asset_value": "151.20", "cross_asset_value": "151.20", "pool_info": None, "shares": [],
+        }],
+    }
+
+
+def order_book_frame(levels: int = 100) -> dict:
+    """update/order_book websocket frame with `levels` price levels per side"""
+    return {
+        "type": "update/order_book",
+        "channel": "order_book:0",
+        "offset": 4101,
+        "order_book": {
+            "code": 0,
+            "asks": [{"price": f"{3024.12 + i * 0.01:.2f}", "size": f"{1.25 + i:.4f}"} for i in range(levels)],
+            "bids": [{"price": f"{3024.11 - i * 0.01:.2f}", "size": f"{0.75 + i:.4f}"} for i in range(levels)],
+            "offset": 4101,
+        },
+    }
+
+
+def account_all_frame(positions: int = 30) -> dict:
+    """update/account_all websocket frame with `positions` positions keyed by market id"""
+    return {
+        "type": "update/account_all",
+        "channel": "account_all:12",
+        "account": 12,
+        "positions": {str(i): account_position(i) for i in range(positions)},
+        "trades": {},
+        "funding_histories": {},
+    }
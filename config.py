@@ -3,6 +3,7 @@
 # =============================================================================
 # Merged configuration for both Lighter Protocol and Pacifica Finance
 
+import importlib.util
 import os
 from typing import Dict, List
 from dotenv import load_dotenv
@@ -63,6 +64,9 @@ PACIFICA_WS_URL = "wss://ws.pacifica.fi/ws"
 # Pacifica private key (Solana wallet)
 PACIFICA_PRIVATE_KEY = get_env_str("PACIFICA_PRIVATE_KEY")
 
+# Serialize signed Pacifica payloads with orjson (requires orjson, see orjson_canonical_json for where it diverges)
+PACIFICA_ORJSON_SIGNING = get_env_bool("PACIFICA_ORJSON_SIGNING", False)
+
 # =============================================================================
 # TRADING CONFIGURATION
 # =============================================================================
@@ -137,15 +141,70 @@ DEFAULT_SLIPPAGE = get_env_float("DEFAULT_SLIPPAGE", 0.01)
 # Order timeout (seconds)
 ORDER_TIMEOUT = get_env_int("ORDER_TIMEOUT", 30)
 
+# =============================================================================
+# MARKET DATA CONFIGURATION
+# =============================================================================
+# Maximum age of a streamed Pacifica price before it is rejected (seconds)
+PACIFICA_PRICE_MAX_AGE = get_env_float("PACIFICA_PRICE_MAX_AGE", 10.0)
+
+# Maximum age of the streamed Lighter top of book before falling back to REST (seconds)
+LIGHTER_BOOK_MAX_AGE = get_env_float("LIGHTER_BOOK_MAX_AGE", 10.0)
+
+# How long to wait for the first streamed price during startup (seconds)
+MARKET_DATA_STARTUP_TIMEOUT = get_env_float("MARKET_DATA_STARTUP_TIMEOUT", 10.0)
+
+# Deadline for fetching all quote inputs from both venues in a cycle (seconds)
+QUOTE_DEADLINE = get_env_float("QUOTE_DEADLINE", 5.0)
+
+# How often cached market metadata (decimals, margin fractions, lot sizes) is refreshed (seconds)
+MARKET_REGISTRY_TTL = get_env_int("MARKET_REGISTRY_TTL", 900)
+
+# How often the Pacifica account balance, margin and positions are polled (seconds)
+PACIFICA_ACCOUNT_POLL_INTERVAL = get_env_float("PACIFICA_ACCOUNT_POLL_INTERVAL", 5.0)
+
+# Maximum age of cached Pacifica account state before sizing ignores it (seconds)
+PACIFICA_ACCOUNT_MAX_AGE = get_env_float("PACIFICA_ACCOUNT_MAX_AGE", 30.0)
+
+# =============================================================================
+# CONNECTION POOL CONFIGURATION
+# =============================================================================
+# Maximum simultaneous connections to the Lighter API, shared by every Lighter component
+LIGHTER_CONNECTIONS_PER_HOST = get_env_int("LIGHTER_CONNECTIONS_PER_HOST", 20)
+
+# How long an idle Lighter connection is kept open for reuse (seconds)
+LIGHTER_KEEPALIVE_TIMEOUT = get_env_float("LIGHTER_KEEPALIVE_TIMEOUT", 60.0)
+
 # =============================================================================
 # POSITION VERIFICATION SETTINGS
 # =============================================================================
 POSITION_VERIFICATION_RETRIES = get_env_int("POSITION_VERIFICATION_RETRIES", 3)
-POSITION_VERIFICATION_DELAY = get_env_int("POSITION_VERIFICATION_DELAY", 5)
+
+# Hard deadline for the venue to report a close order as filled (seconds)
+FILL_CONFIRMATION_TIMEOUT = get_env_float("FILL_CONFIRMATION_TIMEOUT", 10.0)
 
 # Startup configuration
 CLOSE_EXISTING_POSITIONS_ON_START = get_env_bool("CLOSE_EXISTING_POSITIONS_ON_START", True)
 
+# Maximum number of positions closed at the same time during startup cleanup
+STARTUP_CLOSE_CONCURRENCY = get_env_int("STARTUP_CLOSE_CONCURRENCY", 4)
+
+# Total deadline for startup cleanup across both DEXes (seconds)
+STARTUP_CLOSE_TIMEOUT = get_env_float("STARTUP_CLOSE_TIMEOUT", 120.0)
+
+# =============================================================================
+# WARM START CONFIGURATION
+# =============================================================================
+# Snapshot of market metadata, nonces and open positions used for fast restarts.
+# Defaults to one file per env file next to the bot, like start_bot.py's pid and log files;
+# relative paths are resolved against the bot directory
+_snapshot_suffix = "" if env_file == ".env" else "_" + os.path.basename(env_file).lstrip('.').replace('.', '_')
+STATE_SNAPSHOT_FILE = get_env_str("STATE_SNAPSHOT_FILE", f"dual_dex_bot{_snapshot_suffix}_state.json")
+if not os.path.isabs(STATE_SNAPSHOT_FILE):
+    STATE_SNAPSHOT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), STATE_SNAPSHOT_FILE)
+
+# Snapshots older than this are ignored and the bot does a full cold start (seconds)
+STATE_SNAPSHOT_MAX_AGE = get_env_float("STATE_SNAPSHOT_MAX_AGE", 600.0)
+
 # =============================================================================
 # VALIDATION
 # =============================================================================
@@ -161,6 +220,9 @@ def validate_config():
     if not PACIFICA_PRIVATE_KEY:
         errors.append("PACIFICA_PRIVATE_KEY is required")
     
+    if PACIFICA_ORJSON_SIGNING and importlib.util.find_spec("orjson") is None:
+        errors.append("PACIFICA_ORJSON_SIGNING requires the orjson package")
+    
     if PACIFICA_PRIVATE_KEY and len(PACIFICA_PRIVATE_KEY) < 32:
         errors.append("PACIFICA_PRIVATE_KEY appears to be invalid (too short)")
     
@@ -188,6 +250,43 @@ def validate_config():
     if ACCOUNT_BALANCE <= 0:
         errors.append("ACCOUNT_BALANCE must be greater than 0")
     
+    # Validate market data settings
+    if PACIFICA_PRICE_MAX_AGE <= 0:
+        errors.append("PACIFICA_PRICE_MAX_AGE must be greater than 0")
+    
+    if LIGHTER_BOOK_MAX_AGE <= 0:
+        errors.append("LIGHTER_BOOK_MAX_AGE must be greater than 0")
+    
+    if QUOTE_DEADLINE <= 0:
+        errors.append("QUOTE_DEADLINE must be greater than 0")
+    
+    if MARKET_REGISTRY_TTL <= 0:
+        errors.append("MARKET_REGISTRY_TTL must be greater than 0")
+    
+    if PACIFICA_ACCOUNT_POLL_INTERVAL <= 0:
+        errors.append("PACIFICA_ACCOUNT_POLL_INTERVAL must be greater than 0")
+    
+    if PACIFICA_ACCOUNT_MAX_AGE <= 0:
+        errors.append("PACIFICA_ACCOUNT_MAX_AGE must be greater than 0")
+    
+    if FILL_CONFIRMATION_TIMEOUT <= 0:
+        errors.append("FILL_CONFIRMATION_TIMEOUT must be greater than 0")
+    
+    if STARTUP_CLOSE_CONCURRENCY < 1:
+        errors.append("STARTUP_CLOSE_CONCURRENCY must be at least 1")
+    
+    if STARTUP_CLOSE_TIMEOUT <= 0:
+        errors.append("STARTUP_CLOSE_TIMEOUT must be greater than 0")
+    
+    if STATE_SNAPSHOT_MAX_AGE < 0:
+        errors.append("STATE_SNAPSHOT_MAX_AGE must be 0 or greater")
+    
+    if LIGHTER_CONNECTIONS_PER_HOST <= 0:
+        errors.append("LIGHTER_CONNECTIONS_PER_HOST must be greater than 0")
+    
+    if LIGHTER_KEEPALIVE_TIMEOUT <= 0:
+        errors.append("LIGHTER_KEEPALIVE_TIMEOUT must be greater than 0")
+    
     # Validate proxy configuration (MANDATORY)
     if USE_PROXY and not PROXY_URL:
         errors.append("PROXY_URL is required when USE_PROXY is true. Proxy usage is mandatory for this bot.")
@@ -34,70 +34,42 @@ import fcntl
 import signal
 import sys
 import uuid
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
-import json
+from types import MappingProxyType
+from typing import List, Dict, Mapping, NamedTuple, Optional, Tuple
 
 # Import both SDKs
 import lighter
-import requests
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.signature import Signature
-import base58
-
-
-def sign_message(header, payload, keypair):
-    """Sign a message using the keypair"""
-    message = prepare_message(header, payload)
-    message_bytes = message.encode("utf-8")
-    signature = keypair.sign_message(message_bytes)
-    return (message, base58.b58encode(bytes(signature)).decode("ascii"))
-
-
-def prepare_message(header, payload):
-    """Prepare message for signing"""
-    if (
-        "type" not in header
-        or "timestamp" not in header
-        or "expiry_window" not in header
-    ):
-        raise ValueError("Header must have type, timestamp, and expiry_window")
-
-    data = {
-        **header,
-        "data": payload,
-    }
-
-    message = sort_json_keys(data)
-    message = json.dumps(message, separators=(",", ":"))
-    return message
 
+from lighter_stream import LighterAccountStream, LighterOrderBookStream, LighterPosition
+from market_registry import MarketRegistry
+from pacifica_client import (
+    PacificaAccountState, PacificaApiError, PacificaClient, PacificaOrderResult, PacificaPosition
+)
+from pacifica_signing import canonical_json, orjson_canonical_json
+from pacifica_stream import PacificaPriceStream
+from state_snapshot import StateSnapshot, WARM_START_READY_TIMEOUT
 
-def sort_json_keys(value):
-    """Sort JSON keys recursively"""
-    if isinstance(value, dict):
-        sorted_dict = {}
-        for key in sorted(value.keys()):
-            sorted_dict[key] = sort_json_keys(value[key])
-        return sorted_dict
-    elif isinstance(value, list):
-        return [sort_json_keys(item) for item in value]
-    else:
-        return value
 
 # Import configuration
 from config import (
     # Lighter config
     LIGHTER_MAINNET_URL, LIGHTER_API_KEY_PRIVATE_KEY, LIGHTER_ACCOUNT_INDEX, LIGHTER_API_KEY_INDEX,
     # Pacifica config  
-    PACIFICA_MAINNET_URL, PACIFICA_PRIVATE_KEY,
+    PACIFICA_MAINNET_URL, PACIFICA_WS_URL, PACIFICA_PRIVATE_KEY, PACIFICA_ORJSON_SIGNING,
     # Common config
     ACCOUNT_BALANCE, MIN_POSITION_PERCENT, MAX_POSITION_PERCENT, MIN_POSITION_HOLD_MINUTES, MAX_POSITION_HOLD_MINUTES,
     MIN_WAIT_BETWEEN_CYCLES, MAX_WAIT_BETWEEN_CYCLES, ALLOWED_TRADING_PAIRS, MANUAL_LEVERAGE,
     USE_PROXY, PROXY_URL, LOG_LEVEL, LOG_TO_FILE, LOG_FILE, ORDER_TIMEOUT,
-    CLOSE_EXISTING_POSITIONS_ON_START, POSITION_VERIFICATION_RETRIES, POSITION_VERIFICATION_DELAY,
-    DEFAULT_SLIPPAGE
+    CLOSE_EXISTING_POSITIONS_ON_START, STARTUP_CLOSE_CONCURRENCY, STARTUP_CLOSE_TIMEOUT,
+    POSITION_VERIFICATION_RETRIES, FILL_CONFIRMATION_TIMEOUT,
+    DEFAULT_SLIPPAGE, PACIFICA_PRICE_MAX_AGE, LIGHTER_BOOK_MAX_AGE, MARKET_DATA_STARTUP_TIMEOUT,
+    MARKET_REGISTRY_TTL, QUOTE_DEADLINE, PACIFICA_ACCOUNT_POLL_INTERVAL, PACIFICA_ACCOUNT_MAX_AGE,
+    STATE_SNAPSHOT_FILE, STATE_SNAPSHOT_MAX_AGE, LIGHTER_CONNECTIONS_PER_HOST, LIGHTER_KEEPALIVE_TIMEOUT
 )
 
 
@@ -125,6 +97,11 @@ class TradingStats:
             'failed_cycles': 0,
             'start_time': datetime.now()
         }
+        # Seconds from the first close order until the venue reported the position flat
+        self.close_latencies = {
+            'lighter': [],
+            'pacifica': []
+        }
         
     def record_lighter_trade(self, success: bool):
         """Record a Lighter trade"""
@@ -150,6 +127,16 @@ class TradingStats:
         else:
             self.cycle_stats['failed_cycles'] += 1
             
+    def record_close_latency(self, venue: str, seconds: float):
+        """Record how long a position close took to confirm"""
+        self.close_latencies[venue].append(seconds)
+        
+    def _close_latency_summary(self, venue: str) -> str:
+        latencies = self.close_latencies[venue]
+        if not latencies:
+            return "n/a"
+        return f"avg {sum(latencies) / len(latencies):.2f}s, max {max(latencies):.2f}s ({len(latencies)} closes)"
+            
     def get_summary(self) -> str:
         """Get trading statistics summary"""
         runtime = datetime.now() - self.cycle_stats['start_time']
@@ -159,6 +146,7 @@ class TradingStats:
 ⏱️ Runtime: {runtime}
 📈 Lighter: {self.lighter_stats['trades']} trades ({self.lighter_stats['successful']} successful)
 📈 Pacifica: {self.pacifica_stats['trades']} trades ({self.pacifica_stats['successful']} successful)
+⏱️ Close latency: Lighter {self._close_latency_summary('lighter')}, Pacifica {self._close_latency_summary('pacifica')}
 """
 
 
@@ -202,6 +190,72 @@ class PositionManager:
         """Clear all positions"""
         self.lighter_position = None
         self.pacifica_position = None
+        
+    def to_dict(self) -> Dict:
+        """Serialize position bookkeeping for the state snapshot"""
+        def encode(position):
+            if position is None:
+                return None
+            return {**position, 'opened_at': position['opened_at'].isoformat()}
+            
+        return {
+            'lighter_position': encode(self.lighter_position),
+            'pacifica_position': encode(self.pacifica_position),
+            'cycle_start_time': self.cycle_start_time.isoformat() if self.cycle_start_time else None
+        }
+        
+    def restore(self, data: Dict):
+        """Restore position bookkeeping saved by to_dict()"""
+        def decode(position):
+            if position is None:
+                return None
+            return {**position, 'opened_at': datetime.fromisoformat(position['opened_at'])}
+            
+        self.lighter_position = decode(data.get('lighter_position'))
+        self.pacifica_position = decode(data.get('pacifica_position'))
+        cycle_start_time = data.get('cycle_start_time')
+        self.cycle_start_time = datetime.fromisoformat(cycle_start_time) if cycle_start_time else None
+
+
+class QuoteTiming(NamedTuple):
+    """When a quote input arrived (monotonic seconds) and how long it took to fetch"""
+    received_at: float
+    latency: float
+
+
+@dataclass(frozen=True)
+class QuoteSnapshot:
+    """All venue inputs needed to size and place a hedged pair of orders"""
+    symbol: str
+    lighter_market_index: int
+    lighter_details: Mapping
+    lighter_price_scaled: int
+    lighter_price: float
+    pacifica_price: float
+    pacifica_balance: Optional[float]
+    pacifica_balance_age: Optional[float]
+    started_at: float
+    lighter_timing: QuoteTiming
+    pacifica_timing: QuoteTiming
+    
+    @property
+    def time_to_quote(self) -> float:
+        """Seconds from the start of acquisition until the last price arrived"""
+        return max(self.lighter_timing.received_at, self.pacifica_timing.received_at) - self.started_at
+
+
+@dataclass
+class LegResult:
+    """Outcome of one leg of a hedged order pair with send/ack times (monotonic seconds)"""
+    venue: str
+    success: bool
+    sent_at: float
+    acked_at: float
+    error: Optional[str] = None
+    
+    @property
+    def latency(self) -> float:
+        return self.acked_at - self.sent_at
 
 
 class DualDexTradingBot:
@@ -216,17 +270,38 @@ class DualDexTradingBot:
         self.lighter_client = None
         self.lighter_api_client = None
         self.lighter_order_api = None
-        self.lighter_available_markets = []
+        self.lighter_book_stream = None
+        self.lighter_account_stream = None
         
         # Pacifica components
-        self.pacifica_session = None
+        self.pacifica_client = None
         self.pacifica_keypair = None
         self.pacifica_wallet_address = None
+        self.pacifica_price_stream = None
+        self.pacifica_account_state = None
+        
+        # Shared market metadata for both DEXes
+        self.market_registry = None
+        
+        # Warm-start snapshot of markets, nonces and open positions
+        self.state_snapshot = StateSnapshot(
+            STATE_SNAPSHOT_FILE, STATE_SNAPSHOT_MAX_AGE, self._snapshot_identity(), logger=self.logger
+        )
+        self.warm_start = False
+        self.last_cycle = None
+        self._warm_start_task = None
+        self._warm_start_failed = False
+        self._reconcile_needed = False
         
         # Control flags
         self.running = False
         self.pid_file = "dual_dex_bot.pid"
         
+    @property
+    def lighter_available_markets(self) -> List[Dict]:
+        """Traded Lighter markets from the market registry"""
+        return self.market_registry.lighter_markets if self.market_registry else []
+        
     def _setup_logging(self):
         """Setup logging configuration"""
         logger = logging.getLogger(__name__)
@@ -266,51 +341,118 @@ class DualDexTradingBot:
         """Initialize both DEX connections"""
         self.logger.info("🚀 Initializing Dual DEX Trading Bot...")
         
+        # A fresh snapshot lets startup skip the blocking REST round trips
+        state = self.state_snapshot.load()
+        if state is not None and not self.state_snapshot.is_fresh(state):
+            self.logger.info(f"⏭️ State snapshot is {self.state_snapshot.age(state):.0f}s old, doing a cold start")
+            state = None
+        if state is not None and not self._is_valid_warm_state(state):
+            state = None
+        self.warm_start = state is not None
+        if self.warm_start:
+            self.logger.info(f"♨️ Warm start from state snapshot saved {self.state_snapshot.age(state):.0f}s ago")
+        
         # Initialize Lighter
-        await self._initialize_lighter()
+        await self._initialize_lighter(state)
         
         # Initialize Pacifica
-        await self._initialize_pacifica()
+        await self._initialize_pacifica(state)
+        
+        if self.warm_start:
+            self.position_manager.restore(state.get('positions') or {})
+            self.last_cycle = state.get('last_cycle')
+            # Check the restored state against both venues while trading resumes
+            self._warm_start_task = asyncio.create_task(self._validate_warm_start(), name="warm-start-validation")
+        
+        # Keep market metadata fresh in the background
+        self.market_registry.start()
         
         self.logger.info("✅ Both DEX connections initialized successfully")
         
-    async def _initialize_lighter(self):
-        """Initialize Lighter Protocol connection"""
+    async def _initialize_lighter(self, state: Optional[Dict] = None):
+        """Initialize Lighter Protocol connection, from a warm-start snapshot when one is given"""
         try:
             self.logger.info("🔗 Connecting to Lighter Protocol...")
             
             # Configure SSL settings and proxy
             config = lighter.Configuration(host=LIGHTER_MAINNET_URL)
             config.verify_ssl = False
+            lighter_proxy = PROXY_URL if USE_PROXY and PROXY_URL else None
+            
+            # One connection pool for every Lighter component, idle connections stay open between cycles
+            config.connection_pool_maxsize_per_host = LIGHTER_CONNECTIONS_PER_HOST
+            config.keepalive_timeout = LIGHTER_KEEPALIVE_TIMEOUT
             
-            if USE_PROXY and PROXY_URL:
-                config.proxy = PROXY_URL
+            if lighter_proxy:
+                config.proxy = lighter_proxy
                 self.logger.info(f"Using proxy for Lighter: {PROXY_URL}")
             
-            self.lighter_api_client = lighter.ApiClient(configuration=config)
+            # Hot polling responses skip pydantic validation, fields are read straight off the JSON,
+            # and the bot's own typed calls skip argument validation
+            self.lighter_api_client = lighter.ApiClient(
+                configuration=config,
+                response_mode="record",
+                fast_response_types=("OrderBookOrders", "DetailedAccounts"),
+                trusted=True,
+            )
             
             self.lighter_client = lighter.SignerClient(
                 url=LIGHTER_MAINNET_URL,
                 private_key=LIGHTER_API_KEY_PRIVATE_KEY,
                 account_index=LIGHTER_ACCOUNT_INDEX,
                 api_key_index=LIGHTER_API_KEY_INDEX,
+                nonce_management_type=lighter.nonce_manager.NonceManagerType.ASYNC,
+                api_client=self.lighter_api_client,
             )
             
-            # Replace SignerClient's ApiClient with our configured one
-            await self.lighter_client.api_client.close()
-            self.lighter_client.api_client = self.lighter_api_client
-            self.lighter_client.tx_api = lighter.TransactionApi(self.lighter_api_client)
-            self.lighter_client.order_api = lighter.OrderApi(self.lighter_api_client)
+            # Load nonces for every api key up front and keep them synced in the background,
+            # on a warm start the saved high-water marks are verified against the API before the first signed tx
+            if state is not None:
+                self.lighter_client.nonce_manager.restore(state.get('nonces') or {})
+            await self.lighter_client.nonce_manager.start(initial_fetch=state is None)
             
-            self.lighter_order_api = lighter.OrderApi(self.lighter_api_client)
+            self.lighter_order_api = self.lighter_client.order_api
             
-            # Verify connection
-            err = self.lighter_client.check_client()
-            if err:
-                raise Exception(f"Lighter client verification failed: {err}")
+            # Verify connection (a warm start verifies in the background)
+            if state is None:
+                err = self.lighter_client.check_client()
+                if err:
+                    raise Exception(f"Lighter client verification failed: {err}")
                 
             # Load markets
-            await self._load_lighter_markets()
+            await self._load_lighter_markets(state.get('markets') if state is not None else None)
+            ready_timeout = WARM_START_READY_TIMEOUT if state is not None else MARKET_DATA_STARTUP_TIMEOUT
+            
+            # Stream top of book for every traded market
+            self.lighter_book_stream = LighterOrderBookStream(
+                LIGHTER_MAINNET_URL,
+                [m['index'] for m in self.lighter_available_markets],
+                logger=self.logger,
+                price_decimals={
+                    m['index']: self.market_registry.lighter_details(m['index'])['price_decimals']
+                    for m in self.lighter_available_markets
+                },
+                proxy=lighter_proxy,
+            )
+            self.lighter_book_stream.start()
+            if not await self.lighter_book_stream.wait_ready(ready_timeout):
+                self.logger.warning("⚠️ Lighter order book stream not ready, prices will use REST until it catches up")
+                
+            # Stream account positions so close paths can wait on fills instead of polling
+            self.lighter_account_stream = LighterAccountStream(
+                LIGHTER_MAINNET_URL,
+                LIGHTER_ACCOUNT_INDEX,
+                lighter.AccountApi(self.lighter_api_client),
+                logger=self.logger,
+                proxy=lighter_proxy,
+            )
+            self.lighter_account_stream.start()
+            if not await self.lighter_account_stream.wait_ready(ready_timeout):
+                self.logger.warning("⚠️ Lighter account stream not ready, resyncing positions over REST")
+                try:
+                    await self.lighter_account_stream.resync()
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Lighter position resync failed: {e}")
             
             self.logger.info("✅ Lighter Protocol connected successfully")
             
@@ -318,8 +460,8 @@ class DualDexTradingBot:
             self.logger.error(f"❌ Failed to initialize Lighter: {e}")
             raise
             
-    async def _initialize_pacifica(self):
-        """Initialize Pacifica Finance connection"""
+    async def _initialize_pacifica(self, state: Optional[Dict] = None):
+        """Initialize Pacifica Finance connection, from a warm-start snapshot when one is given"""
         try:
             self.logger.info("🔗 Connecting to Pacifica Finance...")
             
@@ -331,44 +473,65 @@ class DualDexTradingBot:
             self.pacifica_keypair = Keypair.from_base58_string(PACIFICA_PRIVATE_KEY)
             self.pacifica_wallet_address = str(self.pacifica_keypair.pubkey())
             
-            # Setup session with proxy
-            self.pacifica_session = requests.Session()
-            if USE_PROXY and PROXY_URL:
-                self.pacifica_session.proxies = {
-                    'http': PROXY_URL,
-                    'https': PROXY_URL
-                }
+            # Setup async client with proxy
+            pacifica_proxy = PROXY_URL if USE_PROXY and PROXY_URL else None
+            self.pacifica_client = PacificaClient(
+                PACIFICA_MAINNET_URL,
+                self.pacifica_keypair,
+                proxy=pacifica_proxy,
+                timeout=ORDER_TIMEOUT,
+                logger=self.logger,
+                # orjson only when opted in, the stdlib encoder matches prepare_message for every payload
+                json_encoder=orjson_canonical_json if PACIFICA_ORJSON_SIGNING else canonical_json,
+            )
+            if pacifica_proxy:
                 self.logger.info(f"Using proxy for Pacifica: {PROXY_URL}")
             
+            # Start the long-lived price subscription and wait for the first quotes
+            self.pacifica_price_stream = PacificaPriceStream(PACIFICA_WS_URL, logger=self.logger, proxy=pacifica_proxy)
+            self.pacifica_price_stream.start()
+            ready_timeout = WARM_START_READY_TIMEOUT if state is not None else MARKET_DATA_STARTUP_TIMEOUT
+            if not await self.pacifica_price_stream.wait_ready(ready_timeout):
+                self.logger.warning("⚠️ No Pacifica prices received yet, stream will keep retrying in the background")
+            
+            # Load Pacifica lot sizes (restored with the Lighter markets on a warm start)
+            if state is None:
+                await self.market_registry.load_pacifica()
+            
+            # Keep balance, margin and positions cached for sizing
+            self.pacifica_account_state = PacificaAccountState(
+                self.pacifica_client,
+                PACIFICA_ACCOUNT_POLL_INTERVAL,
+                logger=self.logger,
+            )
+            if state is None:
+                try:
+                    await self.pacifica_account_state.refresh()
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Could not load Pacifica account state, poller will keep retrying: {e}")
+            self.pacifica_account_state.start()
+            
             self.logger.info(f"✅ Pacifica Finance connected successfully (Wallet: {self.pacifica_wallet_address[:8]}...)")
             
         except Exception as e:
             self.logger.error(f"❌ Failed to initialize Pacifica: {e}")
             raise
             
-    async def _load_lighter_markets(self):
-        """Load available Lighter markets"""
+    async def _load_lighter_markets(self, snapshot: Optional[Dict] = None):
+        """Load available Lighter markets and their details into the market registry, or restore them from a snapshot"""
         try:
             self.logger.info("📊 Loading Lighter markets...")
-            order_books = await self.lighter_order_api.order_books()
-            
-            self.lighter_available_markets = []
-            for market in order_books.order_books:
-                market_info = {
-                    'index': market.market_id,
-                    'symbol': market.symbol,
-                    'status': market.status,
-                    'min_base_amount': market.min_base_amount,
-                    'min_quote_amount': market.min_quote_amount,
-                }
-                
-                # Filter by allowed trading pairs and active status
-                if (market.symbol in ALLOWED_TRADING_PAIRS and 
-                    market.status.lower() == 'active'):
-                    self.lighter_available_markets.append(market_info)
-                    
-            if not self.lighter_available_markets:
-                raise Exception("No available Lighter markets found")
+            self.market_registry = MarketRegistry(
+                self.lighter_order_api,
+                self._fetch_pacifica_market_info,
+                ALLOWED_TRADING_PAIRS,
+                MARKET_REGISTRY_TTL,
+                logger=self.logger,
+            )
+            if snapshot is not None:
+                self.market_registry.restore(snapshot)
+            else:
+                await self.market_registry.load_lighter()
                 
             self.logger.info(f"📊 Loaded {len(self.lighter_available_markets)} Lighter markets: {[m['symbol'] for m in self.lighter_available_markets]}")
             
@@ -376,28 +539,59 @@ class DualDexTradingBot:
             self.logger.error(f"❌ Failed to load Lighter markets: {e}")
             raise
             
-    async def _get_lighter_market_details(self, market_index: int) -> Optional[Dict]:
-        """Get detailed Lighter market information"""
-        try:
-            details_response = await self.lighter_order_api.order_book_details(market_index)
-            details = details_response.order_book_details[0]
-            
-            return {
-                'symbol': details.symbol,
-                'price_decimals': details.price_decimals,
-                'size_decimals': details.size_decimals,
-                'default_imf': details.default_initial_margin_fraction,
-                'min_imf': details.min_initial_margin_fraction,
-                'default_leverage': 10000 / details.default_initial_margin_fraction,
-                'max_leverage': 10000 / details.min_initial_margin_fraction,
-            }
-        except Exception as e:
-            self.logger.error(f"Failed to get Lighter market details for {market_index}: {e}")
+    async def _fetch_pacifica_market_info(self) -> List[Dict]:
+        """Fetch Pacifica market info (lot and tick sizes) for the market registry"""
+        return await self.pacifica_client.get_market_info()
+            
+    def _get_lighter_market(self, symbol: str) -> Optional[Dict]:
+        """Get a traded Lighter market by symbol from the market registry"""
+        return self.market_registry.lighter_market(symbol)
+            
+    def _get_lighter_market_details(self, market_index: int) -> Optional[Dict]:
+        """Get detailed Lighter market information from the market registry"""
+        details = self.market_registry.lighter_details(market_index)
+        if details is None:
+            self.logger.error(f"Failed to get Lighter market details for {market_index}")
+        return details
+            
+    def _get_lighter_stream_price(self, market_index: int, is_ask: bool, market_details: Dict) -> Optional[Tuple[int, float]]:
+        """Get current market price from the streamed Lighter top of book without I/O"""
+        if not self.lighter_book_stream:
+            return None
+        book = self.lighter_book_stream.get_top_of_book(market_index, LIGHTER_BOOK_MAX_AGE)
+        if book is None:
+            return None
+            
+        # For ask orders (short positions) use bid price, for bid orders (long positions) use ask price
+        price_usd = book.best_bid if is_ask else book.best_ask
+        if price_usd is None:
             return None
+        return self._apply_lighter_slippage(price_usd, is_ask, market_details)
+            
+    def _apply_lighter_slippage(self, price_usd: float, is_ask: bool, market_details: Dict) -> Tuple[int, float]:
+        """Scale a Lighter price to its internal format and apply slippage tolerance"""
+        # Convert to internal format (scaled by price_decimals)
+        price_decimals = market_details.get('price_decimals', 5)
+        price_scaled = int(price_usd * (10 ** price_decimals))
+        
+        # Apply slippage tolerance
+        if is_ask:
+            price_scaled = int(price_scaled * (1 - DEFAULT_SLIPPAGE))
+            price_usd = price_usd * (1 - DEFAULT_SLIPPAGE)
+        else:
+            price_scaled = int(price_scaled * (1 + DEFAULT_SLIPPAGE))
+            price_usd = price_usd * (1 + DEFAULT_SLIPPAGE)
+            
+        return price_scaled, price_usd
             
     async def _get_lighter_market_price(self, market_index: int, is_ask: bool, market_details: Dict) -> Optional[Tuple[int, float]]:
-        """Get current market price from Lighter - matches working SDK implementation"""
+        """Get current market price from Lighter - streamed book first, REST when stale or disconnected"""
+        price_result = self._get_lighter_stream_price(market_index, is_ask, market_details)
+        if price_result is not None:
+            return price_result
+            
         try:
+            self.logger.debug(f"Lighter book stream stale for market {market_index}, using REST")
             order_book = await self.lighter_order_api.order_book_orders(market_index, 1)
             
             if is_ask and order_book.bids:
@@ -411,103 +605,109 @@ class DualDexTradingBot:
                 return None
                 
             # Convert price string to float for USD display
-            price_usd = float(price_str)
-            
-            # Convert to internal format (scaled by price_decimals)
-            price_decimals = market_details.get('price_decimals', 5)
-            price_scaled = int(price_usd * (10 ** price_decimals))
-            
-            # Apply slippage tolerance
-            if is_ask:
-                price_scaled = int(price_scaled * (1 - DEFAULT_SLIPPAGE))
-                price_usd = price_usd * (1 - DEFAULT_SLIPPAGE)
-            else:
-                price_scaled = int(price_scaled * (1 + DEFAULT_SLIPPAGE))
-                price_usd = price_usd * (1 + DEFAULT_SLIPPAGE)
-                
-            return price_scaled, price_usd
+            return self._apply_lighter_slippage(float(price_str), is_ask, market_details)
 
         except Exception as e:
             self.logger.error(f"Failed to get Lighter market price for {market_index}: {e}")
             return None
             
     async def _get_pacifica_market_price(self, symbol: str, side: str) -> Optional[float]:
-        """Get current market price from Pacifica using WebSocket"""
-        try:
-            # Try WebSocket price subscription first
-            price = await self._get_pacifica_price_from_websocket(symbol)
-            if price:
-                self.logger.debug(f"Pacifica price for {symbol} ({side}): ${price:.2f} (WebSocket)")
-                return price
-            
-            # Fallback to mock prices if WebSocket fails
-            self.logger.warning(f"WebSocket price failed for {symbol}, using fallback")
-            mock_prices = {
-                "BTC": 65000.0,
-                "ETH": 3500.0,
-                "HYPE": 0.25,
-                "SOL": 150.0,
-                "BNB": 600.0
-            }
+        """Get current market price from the Pacifica price stream cache"""
+        price = self.pacifica_price_stream.get_price(symbol, PACIFICA_PRICE_MAX_AGE)
+        if price is None:
+            quote = self.pacifica_price_stream.get_quote(symbol)
+            if quote is None:
+                self.logger.warning(f"No Pacifica price received for {symbol}")
+            else:
+                age = time.monotonic() - quote.received_at
+                self.logger.warning(f"Pacifica price for {symbol} is stale ({age:.1f}s old), rejecting")
+            return None
             
-            price = mock_prices.get(symbol, 100.0)
-            self.logger.debug(f"Pacifica price for {symbol} ({side}): ${price:.2f} (mock)")
-            return price
+        self.logger.debug(f"Pacifica price for {symbol} ({side}): ${price:.2f} (stream)")
+        return price
             
-        except Exception as e:
-            self.logger.error(f"Failed to get Pacifica market price for {symbol}: {e}")
-            return 100.0  # Fallback price
+    def _get_pacifica_balance(self) -> Optional[Tuple[float, float]]:
+        """Get the cached Pacifica account value and its age in seconds, None if missing or stale"""
+        cached = self.pacifica_account_state.get_account_info(PACIFICA_ACCOUNT_MAX_AGE)
+        if cached is None:
+            age = self.pacifica_account_state.age()
+            if age is None:
+                self.logger.warning("Pacifica account state not loaded yet")
+            else:
+                self.logger.warning(f"Pacifica account state is stale ({age:.1f}s old), ignoring balance")
+            return None
+            
+        account_info, updated_at = cached
+        return account_info.account_equity, time.monotonic() - updated_at
+            
+    async def _timed(self, coro) -> Tuple[object, QuoteTiming]:
+        """Await a quote input and record when it arrived and how long it took"""
+        started_at = time.monotonic()
+        value = await coro
+        received_at = time.monotonic()
+        return value, QuoteTiming(received_at, received_at - started_at)
+            
+    async def _gather_quotes(self, symbol: str, lighter_side: str, pacifica_side: str) -> Optional[QuoteSnapshot]:
+        """Fetch prices from both venues concurrently under one deadline, balance from the account cache"""
+        market = self._get_lighter_market(symbol)
+        if not market:
+            self.logger.error(f"❌ Market {symbol} not found on Lighter")
+            return None
+            
+        market_details = self._get_lighter_market_details(market['index'])
+        if not market_details:
+            self.logger.error(f"❌ Could not get market details for {symbol}")
+            return None
             
-    async def _get_pacifica_price_from_websocket(self, symbol: str) -> Optional[float]:
-        """Get real-time price from Pacifica WebSocket"""
+        lighter_is_ask = lighter_side == "sell"
+        started_at = time.monotonic()
         try:
-            import websockets
-            import json
-            import ssl
-            
-            # Create SSL context that doesn't verify certificates
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            # Connect to Pacifica WebSocket with SSL context
-            async with websockets.connect("wss://ws.pacifica.fi/ws", ping_interval=30, ssl=ssl_context) as websocket:
-                # Subscribe to prices
-                ws_message = {"method": "subscribe", "params": {"source": "prices"}}
-                await websocket.send(json.dumps(ws_message))
-                
-                # Wait for subscription confirmation first
-                try:
-                    confirm_message = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                    confirm_data = json.loads(confirm_message)
-                    self.logger.debug(f"WebSocket subscription confirmed: {confirm_data}")
-                    
-                    # Now wait for actual price data
-                    price_message = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                    data = json.loads(price_message)
-                    
-                    # Look for the symbol in the price data
-                    if isinstance(data, dict) and 'data' in data:
-                        price_list = data['data']
-                        if isinstance(price_list, list):
-                            for price_item in price_list:
-                                if isinstance(price_item, dict) and price_item.get('symbol') == symbol:
-                                    # Use oracle price as the most accurate
-                                    oracle_price = price_item.get('oracle')
-                                    if oracle_price:
-                                        return float(oracle_price)
-                                
-                except asyncio.TimeoutError:
-                    self.logger.debug(f"WebSocket timeout for {symbol}")
-                    return None
-                    
-        except Exception as e:
-            self.logger.debug(f"WebSocket price fetch failed for {symbol}: {e}")
-            self.logger.debug(f"WebSocket error type: {type(e).__name__}")
+            (lighter_result, lighter_timing), (pacifica_price, pacifica_timing) = await asyncio.wait_for(
+                asyncio.gather(
+                    self._timed(self._get_lighter_market_price(market['index'], lighter_is_ask, market_details)),
+                    self._timed(self._get_pacifica_market_price(symbol, pacifica_side)),
+                ),
+                timeout=QUOTE_DEADLINE,
+            )
+        except asyncio.TimeoutError:
+            self.logger.error(f"❌ Quote acquisition for {symbol} exceeded {QUOTE_DEADLINE}s deadline")
+            return None
+            
+        if lighter_result is None:
+            self.logger.error(f"❌ Failed to get Lighter market price")
             return None
+        if pacifica_price is None:
+            self.logger.error(f"❌ Failed to get Pacifica market price")
+            return None
+            
+        lighter_price_scaled, lighter_price = lighter_result
+        balance, balance_age = self._get_pacifica_balance() or (None, None)
+        snapshot = QuoteSnapshot(
+            symbol=symbol,
+            lighter_market_index=market['index'],
+            lighter_details=MappingProxyType(dict(market_details)),
+            lighter_price_scaled=lighter_price_scaled,
+            lighter_price=lighter_price,
+            pacifica_price=pacifica_price,
+            pacifica_balance=balance,
+            pacifica_balance_age=balance_age,
+            started_at=started_at,
+            lighter_timing=lighter_timing,
+            pacifica_timing=pacifica_timing,
+        )
+        self.logger.debug(
+            f"Quotes for {symbol} in {snapshot.time_to_quote * 1000:.0f}ms "
+            f"(Lighter {lighter_timing.latency * 1000:.0f}ms, Pacifica {pacifica_timing.latency * 1000:.0f}ms)"
+        )
+        return snapshot
             
-    def _calculate_hedged_position_sizes(self, symbol: str, lighter_price: float, pacifica_price: float) -> tuple[float, float]:
+    def _calculate_hedged_position_sizes(self, symbol: str, lighter_price: float, pacifica_price: float,
+                                         pacifica_balance: Optional[float] = None) -> Optional[tuple[float, float]]:
         """Calculate hedged position sizes with equal notional values - Pacifica rounded first, Lighter matched"""
+        if pacifica_balance is None:
+            self.logger.warning(f"⚠️ No fresh Pacifica balance, not sizing a {symbol} hedge")
+            return None
+            
         try:
             # Random percentage between min and max
             risk_percent = random.uniform(MIN_POSITION_PERCENT, MAX_POSITION_PERCENT)
@@ -521,19 +721,9 @@ class DualDexTradingBot:
             # Calculate target notional value
             target_notional = risk_amount * leverage
             
-            # Get Pacifica account balance to cap the notional
-            # Conservative fallback based on typical account balance (~$100-200)
-            pacifica_cap = 150.0 * leverage  # Conservative fallback: $150 * leverage
-            try:
-                success, account_info = self._make_pacifica_request("/api/v1/account/info", {})
-                if success and account_info and 'account_value' in account_info:
-                    actual_balance = float(account_info['account_value'])
-                    pacifica_cap = actual_balance * leverage * 0.9  # 90% of actual balance with leverage
-                    self.logger.debug(f"Pacifica actual balance: ${actual_balance:.2f}, cap: ${pacifica_cap:.2f}")
-                else:
-                    self.logger.debug(f"Using conservative Pacifica cap: ${pacifica_cap:.2f}")
-            except Exception as e:
-                self.logger.debug(f"Using conservative Pacifica cap: ${pacifica_cap:.2f}")
+            # Cap the notional by the Pacifica account balance
+            pacifica_cap = pacifica_balance * leverage * 0.9  # 90% of actual balance with leverage
+            self.logger.debug(f"Pacifica actual balance: ${pacifica_balance:.2f}, cap: ${pacifica_cap:.2f}")
             
             # Use the smaller of target notional or Pacifica cap
             hedged_notional = min(target_notional, pacifica_cap)
@@ -548,17 +738,7 @@ class DualDexTradingBot:
             pacifica_size_raw = hedged_notional / pacifica_price
             
             # Apply Pacifica lot size rounding
-            lot_sizes = {
-                "BTC": 0.00001,
-                "ETH": 0.01,
-                "HYPE": 1.0,
-                "SOL": 0.01,
-                "BNB": 0.01,
-            }
-            lot_size = lot_sizes.get(symbol, 0.01)
-            pacifica_size = round(pacifica_size_raw / lot_size) * lot_size
-            pacifica_size = round(pacifica_size, 8)
-            pacifica_size = max(pacifica_size, lot_size)  # Ensure minimum lot size
+            pacifica_size = self.market_registry.round_pacifica_amount(symbol, pacifica_size_raw)
             
             # STEP 2: Calculate actual notional value after Pacifica rounding
             actual_notional = pacifica_size * pacifica_price
@@ -581,70 +761,118 @@ class DualDexTradingBot:
             return 0.001, 0.001  # Fallback minimums
             
     async def _check_and_close_existing_positions(self):
-        """Check and close existing positions on both DEXes"""
+        """Close existing positions on both DEXes concurrently under one deadline"""
         if not CLOSE_EXISTING_POSITIONS_ON_START:
             self.logger.info("⏭️ Skipping position cleanup (CLOSE_EXISTING_POSITIONS_ON_START=False)")
             return
             
         self.logger.info("🔍 Checking for existing positions on both DEXes...")
         
-        # Close Lighter positions
-        await self._close_lighter_positions()
+        lighter_positions, pacifica_positions = await asyncio.gather(
+            self._get_open_lighter_positions(),
+            self._get_open_pacifica_positions(),
+        )
+        if not lighter_positions and not pacifica_positions:
+            self.logger.info("✅ No open positions found")
+            return
+            
+        self.logger.info(f"🔍 Found {len(lighter_positions)} open Lighter and {len(pacifica_positions)} open Pacifica positions")
         
-        # Close Pacifica positions  
-        await self._close_pacifica_positions()
+        # Bound concurrent closes to stay inside venue rate limits
+        semaphore = asyncio.Semaphore(STARTUP_CLOSE_CONCURRENCY)
+        started_at = time.monotonic()
         
-        self.logger.info("✅ Position cleanup completed")
+        async def close_one(close, position) -> Tuple[bool, float]:
+            async with semaphore:
+                closed = await close(position)
+                return closed, time.monotonic() - started_at
+                
+        # Every Lighter close goes out in one transaction batch under the same deadline, the tasks
+        # wait for it outside the semaphore and then confirm or retry per market
+        lighter_batch = asyncio.create_task(self._send_lighter_close_batch(lighter_positions)) if lighter_positions else None
         
-    async def _close_lighter_positions(self):
-        """Close existing Lighter positions"""
-        try:
-            self.logger.info("🔍 Checking Lighter positions...")
-            
-            # Get account details including positions
-            account_api = lighter.AccountApi(self.lighter_api_client)
-            account_response = await account_api.account(by="index", value=str(LIGHTER_ACCOUNT_INDEX))
-            
-            if hasattr(account_response, 'accounts') and account_response.accounts:
-                account = account_response.accounts[0]
-                if hasattr(account, 'positions') and account.positions:
-                    # Filter for positions with non-zero size
-                    open_positions = [pos for pos in account.positions if abs(float(pos.position)) > 1e-6]
-                    
-                    if open_positions:
-                        self.logger.info(f"🔍 Found {len(open_positions)} open Lighter positions")
-                        
-                        for pos in open_positions:
-                            await self._close_lighter_position(pos)
-                    else:
-                        self.logger.info("✅ No open Lighter positions found")
-                else:
-                    self.logger.info("✅ No Lighter positions found")
+        async def confirm_lighter(pos: LighterPosition) -> Tuple[bool, float]:
+            try:
+                order_sent = (await lighter_batch)[pos.market_id]
+            except Exception as e:
+                self.logger.error(f"❌ Failed to send Lighter close batch: {e}")
+                order_sent = False
+                
+            async def confirm(position: LighterPosition) -> bool:
+                return await self._confirm_lighter_close(position, order_sent)
+                
+            return await close_one(confirm, pos)
+            
+        jobs = {}
+        for pos in lighter_positions:
+            task = asyncio.create_task(confirm_lighter(pos))
+            jobs[task] = ("Lighter", pos.symbol, f"{pos.size:.8f}")
+        for pos in pacifica_positions:
+            task = asyncio.create_task(close_one(self._close_pacifica_position, pos))
+            jobs[task] = ("Pacifica", pos.symbol, f"{pos.side.upper()} {pos.amount}")
+            
+        done, pending = await asyncio.wait(jobs, timeout=STARTUP_CLOSE_TIMEOUT)
+        if lighter_batch is not None and not lighter_batch.done():
+            pending.add(lighter_batch)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        
+        # Per-position summary
+        closed_count = 0
+        for task, (venue, symbol, size) in jobs.items():
+            if task in pending:
+                self.logger.warning(f"⏱️ {venue} {symbol} ({size}): not closed within {STARTUP_CLOSE_TIMEOUT}s deadline")
+                continue
+            closed, seconds = task.result()
+            if closed:
+                closed_count += 1
+                self.logger.info(f"✅ {venue} {symbol} ({size}): closed in {seconds:.2f}s")
             else:
-                self.logger.info("✅ No Lighter account found")
+                self.logger.warning(f"⚠️ {venue} {symbol} ({size}): still open after {seconds:.2f}s")
                 
+        total = len(jobs)
+        self.logger.info(f"✅ Position cleanup completed: {closed_count}/{total} closed in {time.monotonic() - started_at:.2f}s")
+        
+    async def _get_open_lighter_positions(self) -> List[LighterPosition]:
+        """Open Lighter positions from the account stream, resynced if it is not live"""
+        try:
+            if not self.lighter_account_stream.connected:
+                await self.lighter_account_stream.resync()
+            return self.lighter_account_stream.open_positions()
         except Exception as e:
             self.logger.error(f"❌ Failed to check Lighter positions: {e}")
+            return []
             
-    async def _close_lighter_position(self, position):
+    async def _get_open_pacifica_positions(self) -> List[PacificaPosition]:
+        """Open Pacifica positions from a fresh positions query"""
+        try:
+            await self.pacifica_account_state.refresh()
+            return list(self.pacifica_account_state.positions)
+        except Exception as e:
+            self.logger.error(f"❌ Failed to check Pacifica positions: {e}")
+            return []
+            
+    async def _close_lighter_position(self, position: LighterPosition) -> bool:
         """Close a specific Lighter position - simple approach with opposite direction retry"""
         try:
             market_id = position.market_id
-            position_size_float = float(position.position)
+            position_size_float = position.size
             
             self.logger.info(f"🔍 Closing Lighter position: {position.symbol} (size: {position_size_float})")
             
             max_attempts = 15
             attempt = 0
+            started_at = time.monotonic()
             
             while attempt < max_attempts:
                 attempt += 1
                 
                 # Get market details
-                market_details = await self._get_lighter_market_details(market_id)
+                market_details = self._get_lighter_market_details(market_id)
                 if not market_details:
                     self.logger.error(f"Could not get market details for market {market_id}")
-                    return
+                    return False
                     
                 # Determine close direction - SIMPLE: positive = long, negative = short
                 is_ask = position_size_float > 0  # Positive = long -> sell to close
@@ -652,7 +880,7 @@ class DualDexTradingBot:
                 
                 if not price_result:
                     self.logger.error(f"Could not get market price for {position.symbol}")
-                    return
+                    return False
                     
                 # Extract price_scaled and price_usd from result
                 price_scaled, price_usd = price_result
@@ -686,81 +914,117 @@ class DualDexTradingBot:
                 else:
                     self.logger.info(f"✅ Lighter close order placed (attempt {attempt}): {tx_hash}")
                     
-                    # Wait for order to process
-                    await asyncio.sleep(POSITION_VERIFICATION_DELAY)
-                    
-                    # Check if position still exists
-                    account_api = lighter.AccountApi(self.lighter_api_client)
-                    account_response = await account_api.account(by="index", value=str(LIGHTER_ACCOUNT_INDEX))
-                    
-                    position_still_exists = False
-                    if hasattr(account_response, 'accounts') and account_response.accounts:
-                        account = account_response.accounts[0]
-                        if hasattr(account, 'positions') and account.positions:
-                            for pos in account.positions:
-                                if pos.market_id == market_id:
-                                    current_size = float(pos.position)
-                                    if abs(current_size) > 1e-6:
-                                        position_still_exists = True
-                                        # Update position size for next attempt
-                                        position_size_float = current_size
-                                        self.logger.warning(f"⚠️ Lighter position still open: {current_size:.8f} (attempt {attempt})")
-                                        
-                                        # If position still exists after a few attempts, try OPPOSITE direction
-                                        if attempt >= 3:
-                                            self.logger.info(f"🔄 Trying OPPOSITE direction to close position...")
-                                            await self._close_lighter_position_opposite(pos)
-                                            await asyncio.sleep(2)
-                                        break
+                    # Wait for the account stream to report the position flat
+                    if await self.lighter_account_stream.wait_for_flat(market_id, FILL_CONFIRMATION_TIMEOUT):
+                        close_latency = time.monotonic() - started_at
+                        self.stats.record_close_latency('lighter', close_latency)
+                        self.logger.info(f"✅ Lighter position fully closed for {position.symbol} in {close_latency:.2f}s")
+                        return True
                     
-                    if not position_still_exists:
-                        self.logger.info(f"✅ Lighter position fully closed for {position.symbol}")
-                        return
+                    # Update position size for next attempt
+                    position_size_float = self.lighter_account_stream.position_size(market_id)
+                    self.logger.warning(f"⚠️ Lighter position still open: {position_size_float:.8f} (attempt {attempt})")
                     
-                    await asyncio.sleep(1)
+                    # If position still exists after a few attempts, try OPPOSITE direction
+                    if attempt >= 3:
+                        self.logger.info(f"🔄 Trying OPPOSITE direction to close position...")
+                        await self._close_lighter_position_opposite(position._replace(size=position_size_float))
             
             self.logger.warning(f"⚠️ Reached max attempts ({max_attempts}) for closing Lighter position")
+            return False
             
         except Exception as e:
             self.logger.error(f"❌ Failed to close Lighter position: {e}")
+            return False
+            
+    async def _send_lighter_close_batch(self, positions: List[LighterPosition]) -> Dict[int, bool]:
+        """Send one reduce-only close order per position in a single transaction batch, True per market if accepted"""
+        sent = {position.market_id: False for position in positions}
+        prices = await asyncio.gather(*(
+            self._get_lighter_market_price(
+                position.market_id, position.size > 0, self._get_lighter_market_details(position.market_id) or {}
+            )
+            for position in positions
+        ))
+        
+        batch = self.lighter_client.batch()
+        batched = {}
+        base_client_order_index = int(time.time() * 1000) % 1000000
+        for offset, (position, price_result) in enumerate(zip(positions, prices)):
+            market_details = self._get_lighter_market_details(position.market_id)
+            if not market_details or not price_result:
+                self.logger.error(f"Could not price close order for {position.symbol}")
+                continue
+                
+            # Positive = long -> sell to close, 1% buffer so the reduce-only order covers the whole position
+            base_amount_scaled = int(abs(position.size) * (10 ** market_details['size_decimals']) * 1.01)
+            slot = batch.create_market_order(
+                market_index=position.market_id,
+                client_order_index=(base_client_order_index + offset) % 1000000,
+                base_amount=base_amount_scaled,
+                avg_execution_price=price_result[0],
+                is_ask=position.size > 0,
+                reduce_only=True,
+            )
+            batched[slot] = position
+            
+        if not batched:
+            return sent
             
+        results = await batch.send()
+        for slot, position in batched.items():
+            _, tx_hash, error = results[slot]
+            if error:
+                self.logger.error(f"❌ Failed to place Lighter close order for {position.symbol}: {error}")
+            else:
+                self.logger.info(f"✅ Lighter close order placed for {position.symbol}: {tx_hash}")
+                sent[position.market_id] = True
+        return sent
+        
+    async def _confirm_lighter_close(self, position: LighterPosition, order_sent: bool) -> bool:
+        """Wait for a batched close to fill, falling back to per-order retries for whatever is left"""
+        started_at = time.monotonic()
+        if order_sent and await self.lighter_account_stream.wait_for_flat(position.market_id, FILL_CONFIRMATION_TIMEOUT):
+            close_latency = time.monotonic() - started_at
+            self.stats.record_close_latency('lighter', close_latency)
+            self.logger.info(f"✅ Lighter position fully closed for {position.symbol} in {close_latency:.2f}s")
+            return True
+            
+        if not order_sent:
+            return await self._close_lighter_position(position)
+            
+        # The batched order may have filled after the wait, never re-close more than what is still open
+        remaining = self.lighter_account_stream.get_position(position.market_id)
+        if remaining is None or abs(remaining.size) <= LighterAccountStream.FLAT_TOLERANCE:
+            self.logger.info(f"✅ Lighter position fully closed for {position.symbol}")
+            return True
+        return await self._close_lighter_position(remaining)
+        
     async def _verify_lighter_position_closed(self, market_id: int, original_size: float):
         """Verify that a Lighter position is actually closed"""
         try:
-            # Get updated account details
-            account_api = lighter.AccountApi(self.lighter_api_client)
-            account_response = await account_api.account(by="index", value=str(LIGHTER_ACCOUNT_INDEX))
-            
-            if hasattr(account_response, 'accounts') and account_response.accounts:
-                account = account_response.accounts[0]
-                if hasattr(account, 'positions') and account.positions:
-                    # Find the position for this market
-                    for pos in account.positions:
-                        if pos.market_id == market_id:
-                            current_size = float(pos.position)
-                            if abs(current_size) > 1e-6:
-                                self.logger.warning(f"⚠️ Lighter position still open: {current_size} (original: {original_size})")
-                                # Try opposite direction
-                                await self._close_lighter_position_opposite(pos)
-            else:
+            if await self.lighter_account_stream.wait_for_flat(market_id, FILL_CONFIRMATION_TIMEOUT):
                 self.logger.info(f"✅ Lighter position verified closed")
                 return
-                            
-            self.logger.info(f"✅ Lighter position verified closed (no position found)")
+                
+            current_size = self.lighter_account_stream.position_size(market_id)
+            self.logger.warning(f"⚠️ Lighter position still open: {current_size} (original: {original_size})")
+            # Try opposite direction
+            await self._close_lighter_position_opposite(self.lighter_account_stream.get_position(market_id))
             
         except Exception as e:
             self.logger.error(f"❌ Failed to verify Lighter position closure: {e}")
             
-    async def _close_lighter_position_opposite(self, position):
+    async def _close_lighter_position_opposite(self, position: LighterPosition):
         """Close Lighter position with opposite direction"""
         try:
             market_id = position.market_id
-            position_size_float = float(position.position)
+            position_size_float = position.size
             
             self.logger.info(f"🔄 Retrying Lighter close with opposite direction: {position.symbol}")
             
             # Get market details
-            market_details = await self._get_lighter_market_details(market_id)
+            market_details = self._get_lighter_market_details(market_id)
             if not market_details:
                 return
                 
@@ -803,159 +1067,55 @@ class DualDexTradingBot:
         except Exception as e:
             self.logger.error(f"❌ Failed to close Lighter position with opposite direction: {e}")
             
-    async def _close_pacifica_positions(self):
-        """Close existing Pacifica positions - continues until all fully closed"""
+    async def _close_pacifica_position(self, position: PacificaPosition, max_attempts: int = 3) -> bool:
+        """Close an open Pacifica position with one reduce-only order for its exact size"""
+        symbol = position.symbol
+        started_at = time.monotonic()
         try:
-            self.logger.info("🔍 Checking Pacifica positions...")
-            
-            # Since Pacifica doesn't have a direct "get positions" endpoint,
-            # we'll attempt to close common position types
-            common_symbols = ALLOWED_TRADING_PAIRS.copy()
-            test_amounts = ["10.0", "5.0", "1.0", "0.5", "0.1", "0.01", "0.001"]
-            
-            positions_found = 0
-            
-            for symbol in common_symbols:
+            for attempt in range(1, max_attempts + 1):
+                # Longs are bids, so sell (ask) to close them
+                close_side = "ask" if position.side == "bid" else "bid"
+                self.logger.info(f"🔒 Closing Pacifica position: {position.side.upper()} {position.amount} {symbol} (attempt {attempt})")
                 try:
-                    self.logger.debug(f"🔍 Testing {symbol} for existing positions...")
+                    await self.pacifica_client.create_market_order({
+                        "symbol": symbol,
+                        "side": close_side,
+                        "amount": position.amount,
+                        "slippage_percent": str(DEFAULT_SLIPPAGE),
+                        "reduce_only": True,
+                        "client_order_id": str(uuid.uuid4())
+                    })
+                except PacificaApiError as e:
+                    self.logger.warning(f"⚠️ Pacifica close order for {symbol} rejected: {e.body}")
                     
-                    # Close long positions (sell to close) - continue until fully closed
-                    long_closed_count = await self._fully_close_pacifica_position(symbol, "ask", test_amounts)
-                    if long_closed_count > 0:
-                        positions_found += long_closed_count
-                        self.logger.info(f"✅ Fully closed Pacifica long position: {symbol} ({long_closed_count} attempts)")
-                            
-                    # Close short positions (buy to close) - continue until fully closed
-                    short_closed_count = await self._fully_close_pacifica_position(symbol, "bid", test_amounts)
-                    if short_closed_count > 0:
-                        positions_found += short_closed_count
-                        self.logger.info(f"✅ Fully closed Pacifica short position: {symbol} ({short_closed_count} attempts)")
-                
-                except Exception as e:
-                    self.logger.debug(f"Error testing {symbol}: {e}")
-                    
-            if positions_found == 0:
-                self.logger.info("✅ No open Pacifica positions found")
-            else:
-                self.logger.info(f"✅ Closed Pacifica positions with {positions_found} total closes")
-                
-        except Exception as e:
-            self.logger.error(f"❌ Failed to check Pacifica positions: {e}")
-            
-    async def _fully_close_pacifica_position(self, symbol: str, side: str, test_amounts: list) -> int:
-        """Fully close a Pacifica position - continues until nothing remains"""
-        close_count = 0
-        max_attempts = 20
-        
-        while close_count < max_attempts:
-            position_found = False
-            
-            for amount in test_amounts:
-                if await self._attempt_close_pacifica_position(symbol, side, amount):
-                    close_count += 1
-                    self.logger.debug(f"🔍 Pacifica close #{close_count} for {symbol} {side} (amount: {amount})")
-                    position_found = True
-                    await asyncio.sleep(2)  # Wait before next attempt
-                    break  # Start over with larger amounts
-            
-            # If no position found with any amount, it's fully closed
-            if not position_found:
-                break
-        
-        return close_count
-            
-    async def _attempt_close_pacifica_position(self, symbol: str, side: str, amount: str) -> bool:
-        """Attempt to close a Pacifica position"""
-        try:
-            close_params = {
-                "symbol": symbol,
-                "side": side,
-                "amount": amount,
-                "slippage_percent": str(DEFAULT_SLIPPAGE),
-                "reduce_only": True,
-                "client_order_id": str(uuid.uuid4())
-            }
-            
-            # Use silent request for position detection
-            success, response = self._make_pacifica_silent_request("/orders/create_market", close_params)
-            
-            if success:
-                order_id = close_params['client_order_id']
-                self.logger.debug(f"🔍 Pacifica close order placed for {symbol} {side} (amount: {amount}): {order_id}")
-                
-                # Wait and verify
-                await asyncio.sleep(3)
-                
-                # Test if position is actually closed
-                test_params = close_params.copy()
-                test_params['amount'] = "0.001"  # Small test amount
-                
-                test_success, test_response = self._make_pacifica_silent_request("/orders/create_market", test_params)
-                
-                if not test_success and test_response and "No position found" in str(test_response):
-                    # Position was successfully closed
+                if await self.pacifica_account_state.wait_for(
+                    lambda state: state.position_amount(symbol) == 0, FILL_CONFIRMATION_TIMEOUT
+                ):
+                    close_latency = time.monotonic() - started_at
+                    self.stats.record_close_latency('pacifica', close_latency)
+                    self.logger.info(f"✅ Pacifica position fully closed for {symbol} in {close_latency:.2f}s")
                     return True
-                elif test_success:
-                    # Position still exists, try opposite direction
-                    opposite_side = "ask" if side == "bid" else "bid"
-                    opposite_params = close_params.copy()
-                    opposite_params['side'] = opposite_side
                     
-                    opposite_success, opposite_response = self._make_pacifica_silent_request("/orders/create_market", opposite_params)
-                    if opposite_success:
-                        self.logger.info(f"✅ Pacifica position closed with opposite direction: {symbol}")
-                        return True
-                        
+                # Retry with whatever the venue still reports as open, or the last known size if the
+                # cache has no position (a successful refresh without one would have confirmed the close)
+                position = self.pacifica_account_state.get_position(symbol) or position
+                self.logger.warning(f"⚠️ Pacifica position for {symbol} still open after close: {position.amount} (attempt {attempt})")
+                
+            self.logger.warning(f"⚠️ Reached max attempts ({max_attempts}) for closing Pacifica {symbol}")
             return False
             
         except Exception as e:
-            self.logger.debug(f"Error attempting to close Pacifica position {symbol}: {e}")
+            self.logger.error(f"❌ Failed to close Pacifica position {symbol}: {e}")
             return False
             
-    def _make_pacifica_silent_request(self, endpoint: str, payload: Dict) -> Tuple[bool, Optional[Dict]]:
-        """Make authenticated request to Pacifica API without logging errors"""
-        try:
-            url = f"{PACIFICA_MAINNET_URL}{endpoint}"
-            
-            # Generate timestamp and signature
-            timestamp = int(time.time() * 1_000)
-            
-            signature_header = {
-                "timestamp": timestamp,
-                "expiry_window": 5_000,
-                "type": "create_market_order",
-            }
-            
-            # Sign the message
-            message, signature = sign_message(signature_header, payload, self.pacifica_keypair)
-            
-            # Construct request
-            request_data = {
-                "account": self.pacifica_wallet_address,
-                "signature": signature,
-                "timestamp": timestamp,
-                "expiry_window": 5_000,
-                **payload
-            }
-            
-            headers = {
-                "Content-Type": "application/json",
-                "User-Agent": "DualDexBot/1.0"
-            }
-            
-            response = self.pacifica_session.post(url, json=request_data, headers=headers, timeout=ORDER_TIMEOUT)
-
-            if response.status_code == 200:
-                return True, response.json()
-            else:
-                return False, response.json() if response.text else None
-                
-        except Exception as e:
-            return False, None
-            
     async def run_trading_cycle(self):
         """Run a complete trading cycle"""
         try:
+            # Never open a new hedge while an earlier one is still (partly) open
+            if self.position_manager.has_positions() and not await self._close_all_positions():
+                self.logger.error("❌ Positions from an earlier cycle are still open, skipping this cycle")
+                return
+                
             self.logger.info("🚀 Starting new trading cycle...")
             self.position_manager.start_cycle()
             self.stats.record_cycle(False)  # Will update to True if successful
@@ -967,413 +1127,356 @@ class DualDexTradingBot:
             # Step 2: Randomly assign buy/sell to each DEX
             lighter_side = random.choice(["buy", "sell"])
             pacifica_side = "sell" if lighter_side == "buy" else "buy"
+            self.last_cycle = {
+                'symbol': symbol,
+                'lighter_side': lighter_side,
+                'started_at': self.position_manager.cycle_start_time.isoformat(),
+                'status': 'started'
+            }
             
             self.logger.info(f"📊 Order assignment: Lighter={lighter_side.upper()}, Pacifica={pacifica_side.upper()}")
             
-            # Step 3: Get market prices
-            # Find Lighter market
-            market = None
-            for m in self.lighter_available_markets:
-                if m['symbol'] == symbol:
-                    market = m
-                    break
-                    
-            if not market:
-                self.logger.error(f"❌ Market {symbol} not found on Lighter")
+            # Step 3: Get market prices and balance from both venues concurrently
+            quotes = await self._gather_quotes(symbol, lighter_side, pacifica_side)
+            if quotes is None:
                 return
                 
-            # Get market details
-            market_details = await self._get_lighter_market_details(market['index'])
-            if not market_details:
-                self.logger.error(f"❌ Could not get market details for {symbol}")
-                return
-                
-            # Get Lighter price
-            lighter_is_ask = lighter_side == "sell"
-            lighter_price_result = await self._get_lighter_market_price(market['index'], lighter_is_ask, market_details)
-            if lighter_price_result is None:
-                self.logger.error(f"❌ Failed to get Lighter market price")
-                return
-            lighter_price_scaled, lighter_price = lighter_price_result
-            
-            # Get Pacifica price
-            pacifica_price = await self._get_pacifica_market_price(symbol, pacifica_side)
-            if pacifica_price is None:
-                self.logger.error(f"❌ Failed to get Pacifica market price")
-                return
-                
-            self.logger.info(f"💰 Prices: Lighter=${lighter_price:.2f}, Pacifica=${pacifica_price:.2f}")
+            self.logger.info(f"💰 Prices: Lighter=${quotes.lighter_price:.2f}, Pacifica=${quotes.pacifica_price:.2f} "
+                             f"({quotes.time_to_quote * 1000:.0f}ms)")
             
             # Step 4: Calculate hedged position sizes (equal notional values)
-            lighter_size, pacifica_size = self._calculate_hedged_position_sizes(symbol, lighter_price, pacifica_price)
+            sizes = self._calculate_hedged_position_sizes(
+                symbol, quotes.lighter_price, quotes.pacifica_price, quotes.pacifica_balance
+            )
+            if sizes is None:
+                return
+            lighter_size, pacifica_size = sizes
             
             self.logger.info(f"📏 Position sizes: Lighter={lighter_size:.6f}, Pacifica={pacifica_size:.6f}")
             
             # Step 5: Place orders simultaneously
-            lighter_success = await self._place_lighter_order(symbol, lighter_side, lighter_size)
-            pacifica_success = await self._place_pacifica_order(symbol, pacifica_side, pacifica_size)
+            lighter_order = self._prepare_lighter_order(quotes, lighter_side, lighter_size)
+            pacifica_order = self._prepare_pacifica_order(symbol, pacifica_side, pacifica_size)
+            lighter_leg, pacifica_leg = await self._execute_hedge(lighter_order, pacifica_order)
             
-            if lighter_success and pacifica_success:
+            if lighter_leg.success and pacifica_leg.success:
                 self.logger.info("✅ Both orders placed successfully!")
                 
+                # Checkpoint the open hedge so a restart during the hold can close it
+                self.last_cycle['status'] = 'open'
+                self._save_state_snapshot()
+                
                 # Step 6: Wait for dynamic hold time
                 hold_minutes = random.uniform(MIN_POSITION_HOLD_MINUTES, MAX_POSITION_HOLD_MINUTES)
                 self.logger.info(f"⏳ Holding positions for {hold_minutes:.1f} minutes...")
                 await asyncio.sleep(hold_minutes * 60)
                 
                 # Step 7: Close positions
-                await self._close_all_positions()
-                
+                if not await self._close_all_positions():
+                    self.last_cycle['status'] = 'failed'
+                    self.logger.error("❌ Trading cycle ended with open positions")
+                    return
+                    
                 self.stats.record_cycle(True)
+                self.last_cycle['status'] = 'completed'
                 self.logger.info("✅ Trading cycle completed successfully!")
                 
             else:
                 self.logger.error("❌ Failed to place orders on one or both DEXes")
-                # Clean up any partial positions
+                self.last_cycle['status'] = 'failed'
+                # Clean up anything the unwind could not close
                 await self._close_all_positions()
             
         except Exception as e:
             self.logger.error(f"❌ Trading cycle failed: {e}")
+            if self.last_cycle:
+                self.last_cycle['status'] = 'failed'
             await self._close_all_positions()
+        finally:
+            self._save_state_snapshot()
             
-    async def _place_lighter_order(self, symbol: str, side: str, size: float) -> bool:
-        """Place order on Lighter"""
-        try:
-            # Find market
-            market = None
-            for m in self.lighter_available_markets:
-                if m['symbol'] == symbol:
-                    market = m
-                    break
-                    
-            if not market:
-                return False
-                
-            # Get market details
-            market_details = await self._get_lighter_market_details(market['index'])
-            if not market_details:
-                return False
-                
-            # Determine order parameters
-            is_ask = (side == "sell")
-            price_result = await self._get_lighter_market_price(market['index'], is_ask, market_details)
-            
-            if not price_result:
-                return False
-            
-            # Extract price_scaled and price_usd from result
-            price_scaled, price_usd = price_result
-                
-            # Calculate scaled amounts
-            size_decimals = market_details['size_decimals']
-            
-            base_amount_scaled = int(size * (10 ** size_decimals))
-            
+    def _prepare_lighter_order(self, quotes: QuoteSnapshot, side: str, size: float) -> Dict:
+        """Build Lighter order parameters from a quote snapshot without I/O"""
+        # Calculate scaled amounts
+        size_decimals = quotes.lighter_details['size_decimals']
+        
+        return {
+            'symbol': quotes.symbol,
+            'side': side,
+            'size': size,
+            'market_index': quotes.lighter_market_index,
+            'base_amount': int(size * (10 ** size_decimals)),
+            'price_scaled': quotes.lighter_price_scaled,
+            'price_usd': quotes.lighter_price,
+            'is_ask': side == "sell",
             # Generate unique client order index
-            client_order_index = int(time.time() * 1000) % 1000000
+            'client_order_index': int(time.time() * 1000) % 1000000,
+        }
+            
+    def _prepare_pacifica_order(self, symbol: str, side: str, size: float) -> Dict:
+        """Build Pacifica order parameters without I/O"""
+        # Round amount to lot size (matches Pacifica SDK implementation)
+        rounded_amount = self.market_registry.round_pacifica_amount(symbol, size)
+        
+        return {
+            'symbol': symbol,
+            'side': side,
+            'amount': rounded_amount,
+            'params': {
+                "symbol": symbol,
+                "side": "ask" if side == "sell" else "bid",
+                "amount": str(rounded_amount),
+                "slippage_percent": str(DEFAULT_SLIPPAGE),
+                "reduce_only": False,
+                "client_order_id": str(uuid.uuid4())
+            },
+        }
             
-            # Place order using correct method signature
+    async def _place_lighter_order(self, order: Dict) -> LegResult:
+        """Place a prepared order on Lighter"""
+        sent_at = time.monotonic()
+        try:
             created_order, tx_hash, error = await self.lighter_client.create_market_order(
-                market_index=market['index'],
-                client_order_index=client_order_index,
-                base_amount=base_amount_scaled,
-                avg_execution_price=price_scaled,
-                is_ask=is_ask,
+                market_index=order['market_index'],
+                client_order_index=order['client_order_index'],
+                base_amount=order['base_amount'],
+                avg_execution_price=order['price_scaled'],
+                is_ask=order['is_ask'],
                 reduce_only=False
             )
+            acked_at = time.monotonic()
             
             if error:
                 self.logger.error(f"❌ Failed to place Lighter order: {error}")
                 self.stats.record_lighter_trade(False)
-                return False
-            else:
-                self.logger.info(f"✅ Lighter order placed: {side.upper()} {size:.6f} {symbol} @ ${price_usd:.2f}")
-                self.position_manager.record_lighter_position(symbol, side, size, tx_hash)
-                self.stats.record_lighter_trade(True)
-                return True
+                return LegResult("lighter", False, sent_at, acked_at, str(error))
+                
+            self.logger.info(f"✅ Lighter order placed: {order['side'].upper()} {order['size']:.6f} {order['symbol']} @ ${order['price_usd']:.2f}")
+            self.position_manager.record_lighter_position(order['symbol'], order['side'], order['size'], tx_hash)
+            self.stats.record_lighter_trade(True)
+            return LegResult("lighter", True, sent_at, acked_at)
                 
         except Exception as e:
             self.logger.error(f"❌ Failed to place Lighter order: {e}")
             self.stats.record_lighter_trade(False)
-            return False
+            return LegResult("lighter", False, sent_at, time.monotonic(), str(e))
             
-    async def _place_pacifica_order(self, symbol: str, side: str, size: float) -> bool:
-        """Place order on Pacifica"""
+    async def _place_pacifica_order(self, order: Dict) -> LegResult:
+        """Place a prepared order on Pacifica"""
+        sent_at = time.monotonic()
         try:
-            # Convert side to Pacifica format
-            pacifica_side = "ask" if side == "sell" else "bid"
-            
-            # Round amount to lot size (matches Pacifica SDK implementation)
-            lot_sizes = {
-                "BTC": 0.00001,  # Match API requirement for BTC lot size
-                "ETH": 0.01,     # ETH standard lot size
-                "HYPE": 1.0,     # HYPE might have larger lot size (low price)
-                "SOL": 0.01,     # SOL standard lot size  
-                "BNB": 0.01,     # BNB standard lot size
-            }
-            
-            lot_size = lot_sizes.get(symbol, 0.01)  # Default to 0.01
-            # Fix floating-point precision issues
-            rounded_amount = round(size / lot_size) * lot_size
-            rounded_amount = round(rounded_amount, 8)  # Round to 8 decimal places
-            rounded_amount = max(rounded_amount, lot_size)  # Ensure minimum lot size
-            
-            # Create order parameters
-            order_params = {
-                "symbol": symbol,
-                "side": pacifica_side,
-                "amount": str(rounded_amount),
-                "slippage_percent": str(DEFAULT_SLIPPAGE),
-                "reduce_only": False,
-                "client_order_id": str(uuid.uuid4())
-            }
-            
-            # Place order
-            success, response = self._make_pacifica_request("/orders/create_market", order_params)
-
-            if success:
-                order_id = order_params['client_order_id']
-                self.logger.info(f"✅ Pacifica order placed: {side.upper()} {rounded_amount:.2f} {symbol}")
-                self.position_manager.record_pacifica_position(symbol, side, str(rounded_amount), order_id)
-                self.stats.record_pacifica_trade(True)
-                return True
-            else:
-                self.logger.error(f"❌ Failed to place Pacifica order: {response}")
+            order_params = order['params']
+            try:
+                result = await self.pacifica_client.create_market_order(order_params)
+            except PacificaApiError as e:
+                self.logger.error(f"❌ Failed to place Pacifica order: {e.body}")
                 self.stats.record_pacifica_trade(False)
-                return False
+                return LegResult("pacifica", False, sent_at, time.monotonic(), str(e.body))
+            acked_at = time.monotonic()
+            
+            # Record what actually filled so the close can send one exact-size order
+            filled_amount = await self._get_pacifica_filled_amount(result, order_params['amount'])
+                
+            self.logger.info(f"✅ Pacifica order placed: {order['side'].upper()} {filled_amount} {order['symbol']}")
+            self.position_manager.record_pacifica_position(
+                order['symbol'], order['side'], filled_amount,
+                result.order_id if result.order_id is not None else order_params['client_order_id']
+            )
+            self.stats.record_pacifica_trade(True)
+            return LegResult("pacifica", True, sent_at, acked_at)
                 
         except Exception as e:
             self.logger.error(f"❌ Failed to place Pacifica order: {e}")
             self.stats.record_pacifica_trade(False)
-            return False
-            
-    def _make_pacifica_request(self, endpoint: str, payload: Dict) -> Tuple[bool, Optional[Dict]]:
-        """Make authenticated request to Pacifica API"""
-        try:
-            url = f"{PACIFICA_MAINNET_URL}{endpoint}"
-            
-            # Generate timestamp and signature
-            timestamp = int(time.time() * 1_000)
+            return LegResult("pacifica", False, sent_at, time.monotonic(), str(e))
             
-            signature_header = {
-                "timestamp": timestamp,
-                "expiry_window": 5_000,
-                "type": "create_market_order",
-            }
-            
-            # Sign the message
-            message, signature = sign_message(signature_header, payload, self.pacifica_keypair)
-            
-            # Construct request
-            request_data = {
-                "account": self.pacifica_wallet_address,
-                "signature": signature,
-                "timestamp": timestamp,
-                "expiry_window": 5_000,
-                **payload
-            }
-            
-            headers = {
-                "Content-Type": "application/json",
-                "User-Agent": "DualDexBot/1.0"
-            }
-            
-            response = self.pacifica_session.post(url, json=request_data, headers=headers, timeout=ORDER_TIMEOUT)
-            
-            if response.status_code == 200:
-                return True, response.json()
-            else:
-                self.logger.error(f"Pacifica API request failed: {response.status_code} - {response.text}")
-                return False, response.json() if response.text else None
-                
-        except Exception as e:
-            self.logger.error(f"Pacifica API request error: {e}")
-            return False, None
+    async def _get_pacifica_filled_amount(self, result: PacificaOrderResult, requested_amount: str) -> str:
+        """Filled amount from the order response, then the order history, else the requested amount"""
+        if result.filled_amount is not None:
+            return result.filled_amount
+        if result.order_id is not None:
+            try:
+                filled_amount = await self.pacifica_client.get_filled_amount(result.order_id)
+                if filled_amount is not None:
+                    return filled_amount
+            except Exception as e:
+                self.logger.debug(f"Pacifica order status lookup failed for {result.order_id}: {e}")
+        self.logger.debug(f"Pacifica fill amount unavailable, recording requested amount {requested_amount}")
+        return requested_amount
+            
+    async def _execute_hedge(self, lighter_order: Dict, pacifica_order: Dict) -> Tuple[LegResult, LegResult]:
+        """Submit both prepared legs concurrently and unwind if only one of them fills"""
+        lighter_leg, pacifica_leg = await asyncio.gather(
+            self._place_lighter_order(lighter_order),
+            self._place_pacifica_order(pacifica_order),
+        )
+        
+        exposure = abs(lighter_leg.acked_at - pacifica_leg.acked_at)
+        self.logger.info(
+            f"⏱️ Legs acked: Lighter {lighter_leg.latency * 1000:.0f}ms, Pacifica {pacifica_leg.latency * 1000:.0f}ms, "
+            f"one-leg exposure {exposure * 1000:.0f}ms"
+        )
+        
+        if lighter_leg.success != pacifica_leg.success:
+            await self._unwind_leg(lighter_leg if lighter_leg.success else pacifica_leg)
+            
+        return lighter_leg, pacifica_leg
+            
+    async def _unwind_leg(self, leg: LegResult):
+        """Close the only filled leg of a hedge whose other leg failed, the record is kept until the close is confirmed"""
+        self.logger.warning(f"⚠️ Only the {leg.venue} leg filled, unwinding it")
+        started_at = time.monotonic()
+        closed = False
+        if leg.venue == "lighter" and self.position_manager.lighter_position:
+            closed = await self._close_lighter_position_by_info(self.position_manager.lighter_position)
+            if closed:
+                self.position_manager.lighter_position = None
+        elif leg.venue == "pacifica" and self.position_manager.pacifica_position:
+            closed = await self._close_pacifica_position_by_info(self.position_manager.pacifica_position)
+            if closed:
+                self.position_manager.pacifica_position = None
+        if closed:
+            self.logger.info(f"✅ Unwound {leg.venue} leg in {time.monotonic() - started_at:.1f}s")
+        else:
+            self.logger.error(f"❌ Could not unwind {leg.venue} leg after {time.monotonic() - started_at:.1f}s, keeping it for cleanup")
             
-    async def _close_all_positions(self):
-        """Close all open positions on both DEXes"""
+    async def _close_all_positions(self) -> bool:
+        """Close all open positions on both DEXes, a position stays recorded until its close is confirmed"""
         try:
             self.logger.info("🔒 Closing all positions...")
             
             # Close Lighter position
             if self.position_manager.lighter_position:
-                await self._close_lighter_position_by_info(self.position_manager.lighter_position)
-                
+                if await self._close_lighter_position_by_info(self.position_manager.lighter_position):
+                    self.position_manager.lighter_position = None
+                    
             # Close Pacifica position
             if self.position_manager.pacifica_position:
-                await self._close_pacifica_position_by_info(self.position_manager.pacifica_position)
+                if await self._close_pacifica_position_by_info(self.position_manager.pacifica_position):
+                    self.position_manager.pacifica_position = None
+                    
+            if self.position_manager.has_positions():
+                self.logger.error("❌ Some positions could not be closed, they will be retried")
+                return False
                 
-            # Clear position manager
-            self.position_manager.clear_positions()
-            
             self.logger.info("✅ All positions closed")
+            return True
             
         except Exception as e:
             self.logger.error(f"❌ Failed to close positions: {e}")
+            return False
             
-    async def _close_lighter_position_by_info(self, position_info: Dict):
-        """Close Lighter position using stored info - continues until fully closed"""
+    async def _close_lighter_position_by_info(self, position_info: Dict) -> bool:
+        """Close Lighter position using stored info - batched close order, then confirm or retry, True once flat"""
         try:
             symbol = position_info['symbol']
             side = position_info['side']
             
             self.logger.info(f"🔒 Closing Lighter position: {side.upper()} {symbol}")
             
-            # Find market
-            market = None
-            for m in self.lighter_available_markets:
-                if m['symbol'] == symbol:
-                    market = m
-                    break
-                    
+            market = self._get_lighter_market(symbol)
             if not market:
                 self.logger.error(f"Market not found for {symbol}")
-                return
-            
-            max_attempts = 20  # Increased attempts
-            attempt = 0
-            
-            # Track current position size (starts with original, updates each iteration)
-            current_position_size = position_info['amount']
-            
-            while attempt < max_attempts:
-                attempt += 1
-                
-                # Get market details
-                market_details = await self._get_lighter_market_details(market['index'])
-                if not market_details:
-                    return
-                    
-                # Determine close direction (opposite of open)
-                is_ask = (side == "buy")  # If we bought, we need to sell to close
-                price_result = await self._get_lighter_market_price(market['index'], is_ask, market_details)
-                
-                if not price_result:
-                    return
-                    
-                # Extract price_scaled and price_usd from result
-                price_scaled, price_usd = price_result
-                    
-                # Calculate scaled amounts using CURRENT position size
-                size_decimals = market_details['size_decimals']
-                
-                base_amount_scaled = int(current_position_size * (10 ** size_decimals))
-                
-                # Add 2% buffer to ensure full close
-                base_amount_scaled = int(base_amount_scaled * 1.02)
-                
-                # Generate unique client order index
-                client_order_index = int(time.time() * 1000) % 1000000
-                
-                self.logger.info(f"🔄 Attempting to close {current_position_size:.8f} {symbol} (attempt {attempt})")
+                return False
                 
-                # Place close order using correct method signature
-                created_order, tx_hash, error = await self.lighter_client.create_market_order(
-                    market_index=market['index'],
-                    client_order_index=client_order_index,
-                    base_amount=base_amount_scaled,
-                    avg_execution_price=price_scaled,
-                    is_ask=is_ask,
-                    reduce_only=True
-                )
+            # Prefer the streamed size, the recorded fill covers a stream that has not caught up yet
+            position = self.lighter_account_stream.get_position(market['index'])
+            if position is None or abs(position.size) <= LighterAccountStream.FLAT_TOLERANCE:
+                amount = position_info['amount']
+                position = LighterPosition(market['index'], symbol, amount if side == "buy" else -amount, time.monotonic())
                 
-                if error:
-                    self.logger.error(f"❌ Failed to close Lighter position (attempt {attempt}): {error}")
-                    await asyncio.sleep(2)
-                    continue
-                else:
-                    self.logger.info(f"✅ Lighter close order placed (attempt {attempt}): {tx_hash}")
-                    
-                    # Verify position is closed
-                    await asyncio.sleep(POSITION_VERIFICATION_DELAY)
-                    
-                    # Check remaining position and UPDATE current_position_size
-                    account_api = lighter.AccountApi(self.lighter_api_client)
-                    account_response = await account_api.account(by="index", value=str(LIGHTER_ACCOUNT_INDEX))
-                    
-                    position_still_exists = False
-                    remaining_size = 0.0
-                    
-                    if hasattr(account_response, 'accounts') and account_response.accounts:
-                        account = account_response.accounts[0]
-                        if hasattr(account, 'positions') and account.positions:
-                            for pos in account.positions:
-                                if pos.market_id == market['index']:
-                                    remaining_size = abs(float(pos.position))
-                                    if remaining_size > 1e-6:
-                                        position_still_exists = True
-                                        # UPDATE the current position size for next attempt
-                                        current_position_size = remaining_size
-                                        self.logger.warning(f"⚠️ Lighter position still open: {remaining_size:.8f} (attempt {attempt})")
-                                        break
-                    
-                    if not position_still_exists:
-                        self.logger.info(f"✅ Lighter position fully closed for {symbol}")
-                        return
-                    
-                    # Brief wait before retry with updated size
-                    await asyncio.sleep(1)
+            # A batch that fails to go out falls back to per-order retries, as on startup
+            try:
+                order_sent = (await self._send_lighter_close_batch([position])).get(position.market_id, False)
+            except Exception as e:
+                self.logger.error(f"❌ Failed to send Lighter close batch for {symbol}: {e}")
+                order_sent = False
+            return await self._confirm_lighter_close(position, order_sent)
             
-            self.logger.warning(f"⚠️ Reached max attempts ({max_attempts}) for closing Lighter {symbol}")
-                
         except Exception as e:
             self.logger.error(f"❌ Failed to close Lighter position: {e}")
+            return False
             
-    async def _close_pacifica_position_by_info(self, position_info: Dict):
-        """Close Pacifica position using stored info - continues until fully closed"""
-        try:
-            symbol = position_info['symbol']
-            side = position_info['side']
-            original_amount = position_info['amount']
-            
-            self.logger.info(f"🔒 Closing Pacifica position: {side.upper()} {symbol}")
-            
-            # Determine close direction (opposite of open)
-            close_side = "ask" if side == "buy" else "bid"
-            
-            # Keep trying to close with progressively smaller amounts
-            # Start with large amounts and work down
-            close_amounts = [original_amount, "100.0", "50.0", "20.0", "10.0", "5.0", "1.0", "0.5", "0.1", "0.01"]
+    async def _close_pacifica_position_by_info(self, position_info: Dict) -> bool:
+        """Close Pacifica position using the recorded fill amount - one exact-size order in the common case, True once flat"""
+        position = PacificaPosition(
+            symbol=position_info['symbol'],
+            side="bid" if position_info['side'] == "buy" else "ask",
+            amount=position_info['amount'],
+            entry_price=0.0,
+        )
+        return await self._close_pacifica_position(position)
             
-            max_total_attempts = 50  # Maximum number of total close attempts
-            total_attempts = 0
-            consecutive_failures = 0
-            max_consecutive_failures = len(close_amounts)  # If all amounts fail, position is closed
+    @staticmethod
+    def _snapshot_identity() -> Dict:
+        """Accounts the state snapshot belongs to, a snapshot written for other accounts is never loaded"""
+        try:
+            pacifica_public_key = str(Keypair.from_base58_string(PACIFICA_PRIVATE_KEY).pubkey())
+        except Exception:
+            pacifica_public_key = None
+        return {
+            'lighter_account_index': LIGHTER_ACCOUNT_INDEX,
+            'lighter_api_key_index': LIGHTER_API_KEY_INDEX,
+            'pacifica_public_key': pacifica_public_key,
+        }
+        
+    def _is_valid_warm_state(self, state: Dict) -> bool:
+        """Check that markets, nonces and positions in a snapshot can be restored before anything uses them"""
+        try:
+            MarketRegistry.parse_snapshot(state['markets'], ALLOWED_TRADING_PAIRS)
+            PositionManager().restore(state.get('positions') or {})
+            {int(api_key): int(nonce) for api_key, nonce in (state.get('nonces') or {}).items()}
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            self.logger.warning(f"⚠️ State snapshot is malformed or outdated, doing a cold start: {e!r}")
+            return False
+        return True
+        
+    async def _validate_warm_start(self):
+        """Check a warm-start snapshot against both venues in the background"""
+        try:
+            err = await asyncio.to_thread(self.lighter_client.check_client)
+            if err:
+                self.logger.error(f"❌ Lighter client verification failed: {err}")
+                self._warm_start_failed = True
+                return
+                
+            await self.market_registry.load()
             
-            self.logger.info(f"🔄 Starting continuous close loop for {symbol}...")
+            lighter_positions, pacifica_positions = await asyncio.gather(
+                self._get_open_lighter_positions(),
+                self._get_open_pacifica_positions(),
+            )
             
-            while total_attempts < max_total_attempts:
-                # Try each amount
-                for amount in close_amounts:
-                    total_attempts += 1
-                    
-                    if total_attempts > max_total_attempts:
-                        self.logger.warning(f"⚠️ Reached max total attempts ({max_total_attempts}) for closing {symbol}")
-                        return
-                    
-                    # Attempt to close with this amount
-                    close_result = await self._attempt_close_pacifica_position(symbol, close_side, amount)
+            # Positions the snapshot does not know about are closed before the next cycle
+            known_lighter = self.position_manager.lighter_position
+            for pos in lighter_positions:
+                if known_lighter is None or known_lighter['symbol'] != pos.symbol:
+                    self.logger.warning(f"⚠️ Lighter {pos.symbol} position ({pos.size:.8f}) is not in the state snapshot")
+                    self._reconcile_needed = True
+            known_pacifica = self.position_manager.pacifica_position
+            for pos in pacifica_positions:
+                if known_pacifica is None or known_pacifica['symbol'] != pos.symbol:
+                    self.logger.warning(f"⚠️ Pacifica {pos.symbol} position ({pos.side.upper()} {pos.amount}) is not in the state snapshot")
+                    self._reconcile_needed = True
                     
-                    if close_result:
-                        # Successfully placed and filled an order
-                        self.logger.info(f"✅ Pacifica closed {amount} {symbol} (attempt {total_attempts})")
-                        consecutive_failures = 0  # Reset failure counter
-                        await asyncio.sleep(1)  # Brief pause between successful closes
-                        break  # Start over with larger amounts
-                    else:
-                        # This amount didn't work, try next smaller amount
-                        self.logger.debug(f"🔍 Amount {amount} {symbol} didn't fill (attempt {total_attempts})")
-                        consecutive_failures += 1
-                
-                # If all amounts failed consecutively, position is fully closed
-                if consecutive_failures >= max_consecutive_failures:
-                    self.logger.info(f"✅ Pacifica position fully closed for {symbol} (all amounts failed)")
-                    return
+            self.logger.info("✅ Warm-start state validated against both DEXes")
             
-            self.logger.warning(f"⚠️ Reached max attempts ({max_total_attempts}) for closing {symbol}")
-                
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            self.logger.error(f"❌ Failed to close Pacifica position: {e}")
+            self.logger.warning(f"⚠️ Warm-start validation failed, reconciling positions before the next cycle: {e}")
+            self._reconcile_needed = True
+            
+    def _save_state_snapshot(self):
+        """Write the warm-start snapshot (markets, nonces, open positions, last cycle)"""
+        if self.market_registry is None or self.lighter_client is None:
+            return
+        self.state_snapshot.save({
+            'markets': self.market_registry.snapshot(),
+            'nonces': dict(self.lighter_client.nonce_manager.nonce),
+            'positions': self.position_manager.to_dict(),
+            'last_cycle': self.last_cycle,
+        })
             
     async def run(self):
         """Main trading loop"""
@@ -1384,8 +1487,12 @@ class DualDexTradingBot:
             # Initialize connections
             await self.initialize()
             
-            # Check and close existing positions
-            await self._check_and_close_existing_positions()
+            # Check and close existing positions - a warm start only closes what the snapshot
+            # recorded and leaves anything else to the background validation
+            if not self.warm_start:
+                await self._check_and_close_existing_positions()
+            elif CLOSE_EXISTING_POSITIONS_ON_START and self.position_manager.has_positions():
+                await self._close_all_positions()
             
             self.running = True
             self.logger.info("✅ Bot initialized and ready for trading!")
@@ -1393,6 +1500,15 @@ class DualDexTradingBot:
             # Main trading loop
             while self.running:
                 try:
+                    if self._warm_start_failed:
+                        self.logger.error("❌ Warm-start validation failed, stopping")
+                        break
+                        
+                    # Close positions found by the warm-start validation before trading again
+                    if self._reconcile_needed:
+                        self._reconcile_needed = False
+                        await self._check_and_close_existing_positions()
+                        
                     # Run trading cycle
                     await self.run_trading_cycle()
                         
@@ -1424,12 +1540,38 @@ class DualDexTradingBot:
             # Close any remaining positions
             await self._close_all_positions()
             
+            # Persist state for a fast restart
+            self._save_state_snapshot()
+            
+            # Stop background tasks
+            if self._warm_start_task:
+                self._warm_start_task.cancel()
+                await asyncio.gather(self._warm_start_task, return_exceptions=True)
+                
+            if self.lighter_client:
+                await self.lighter_client.nonce_manager.stop()
+                
+            if self.market_registry:
+                await self.market_registry.stop()
+                
+            if self.lighter_book_stream:
+                await self.lighter_book_stream.stop()
+                
+            if self.lighter_account_stream:
+                await self.lighter_account_stream.stop()
+                
+            if self.pacifica_price_stream:
+                await self.pacifica_price_stream.stop()
+                
+            if self.pacifica_account_state:
+                await self.pacifica_account_state.stop()
+                
             # Close API clients
             if self.lighter_api_client:
                 await self.lighter_api_client.close()
                 
-            if self.pacifica_session:
-                self.pacifica_session.close()
+            if self.pacifica_client:
+                await self.pacifica_client.close()
                 
             self.logger.info("✅ Cleanup completed")
             
@@ -48,6 +48,7 @@ class AccountApi:
         if api_client is None:
             api_client = ApiClient.get_default()
         self.api_client = api_client
+        api_client.bind_api_methods(self)
 
 
     @validate_call
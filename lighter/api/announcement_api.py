@@ -34,6 +34,7 @@ class AnnouncementApi:
         if api_client is None:
             api_client = ApiClient.get_default()
         self.api_client = api_client
+        api_client.bind_api_methods(self)
 
 
     @validate_call
@@ -38,6 +38,7 @@ class CandlestickApi:
         if api_client is None:
             api_client = ApiClient.get_default()
         self.api_client = api_client
+        api_client.bind_api_methods(self)
 
 
     @validate_call
@@ -12,23 +12,34 @@
 """  # noqa: E501
 
 
+import contextlib
+from contextvars import ContextVar
 import datetime
+import functools
 from dateutil.parser import parse
 from enum import Enum
-import json
+from lighter import json_codec
 import mimetypes
 import os
 import re
 import tempfile
+import types
 
 from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict, Union
-from pydantic import SecretStr
+from typing import Any, Callable, Iterable, Tuple, Optional, List, Dict, Union
+from pydantic import BaseModel, SecretStr
 
 from lighter.configuration import Configuration
 from lighter.api_response import ApiResponse, T as ApiResponseT
 import lighter.models
 from lighter import rest
+from lighter.records import (
+    ModelRecord,
+    RESPONSE_MODE_DICT,
+    RESPONSE_MODE_MODEL,
+    RESPONSE_MODE_RECORD,
+    RESPONSE_MODES,
+)
 from lighter.exceptions import (
     ApiValueError,
     ApiException,
@@ -41,6 +52,41 @@ from lighter.exceptions import (
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
+# Turns one parsed JSON value into the declared response type
+Deserializer = Callable[[Any], Any]
+
+# Response mode for calls made inside ApiClient.fast_responses(), overrides the client setting
+_response_mode_override: ContextVar[Optional[str]] = ContextVar("lighter_response_mode", default=None)
+
+# Per generated API class: method name -> function without the @validate_call wrapper
+_raw_api_function_cache: Dict[type, Dict[str, types.FunctionType]] = {}
+
+
+def _raw_api_functions(api_class: type) -> Dict[str, types.FunctionType]:
+    functions = _raw_api_function_cache.get(api_class)
+    if functions is None:
+        functions = {
+            name: member.raw_function
+            for name, member in vars(api_class).items()
+            if getattr(member, "raw_function", None) is not None
+        }
+        _raw_api_function_cache[api_class] = functions
+    return functions
+
+
+@functools.lru_cache(maxsize=64)
+def _response_encoding(content_type: str) -> str:
+    """Charset named in a content-type header, utf-8 if there is none"""
+    match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
+    return match.group(1) if match else "utf-8"
+
+
+def _none_safe(deserializer: Deserializer) -> Deserializer:
+    def deserialize(data):
+        return None if data is None else deserializer(data)
+    return deserialize
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -55,6 +101,15 @@ class ApiClient:
         the API.
     :param cookie: a cookie to include in the header when making calls
         to the API
+    :param response_mode: "model" validates responses into pydantic models,
+        "record" returns lightweight ModelRecord views that build the model
+        on demand and "dict" returns the parsed JSON.
+    :param fast_response_types: response type names that use response_mode,
+        other types are always validated into models. None applies
+        response_mode to every response type.
+    :param trusted: API objects built on this client call their methods
+        without pydantic argument validation. Only for callers that already
+        pass correctly typed arguments.
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, str, int)
@@ -75,7 +130,10 @@ class ApiClient:
         configuration=None,
         header_name=None,
         header_value=None,
-        cookie=None
+        cookie=None,
+        response_mode=RESPONSE_MODE_MODEL,
+        fast_response_types: Optional[Iterable[str]] = None,
+        trusted: bool = False,
     ) -> None:
         # use default configuration if none is provided
         if configuration is None:
@@ -90,6 +148,13 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
         self.client_side_validation = configuration.client_side_validation
+        if response_mode not in RESPONSE_MODES:
+            raise ApiValueError(f"Invalid response mode {response_mode!r}, expected one of {RESPONSE_MODES}")
+        self.response_mode = response_mode
+        self.fast_response_types = set(fast_response_types) if fast_response_types is not None else None
+        self.trusted = trusted
+        # Compiled deserializers per (response type, response mode)
+        self._deserializers: Dict[Tuple[str, str], Deserializer] = {}
 
     async def __aenter__(self):
         return self
@@ -112,6 +177,39 @@ class ApiClient:
     def set_default_header(self, header_name, header_value):
         self.default_headers[header_name] = header_value
 
+    @staticmethod
+    @contextlib.contextmanager
+    def fast_responses(mode=RESPONSE_MODE_RECORD):
+        """Deserialize responses of calls made inside this block with `mode`.
+
+        The setting is scoped to the current task, so concurrent calls
+        elsewhere keep their client's response mode.
+        """
+        if mode not in RESPONSE_MODES:
+            raise ApiValueError(f"Invalid response mode {mode!r}, expected one of {RESPONSE_MODES}")
+        token = _response_mode_override.set(mode)
+        try:
+            yield
+        finally:
+            _response_mode_override.reset(token)
+
+    def response_mode_for(self, response_type: str) -> str:
+        """Response mode that applies to `response_type` in the current context"""
+        override = _response_mode_override.get()
+        if override is not None:
+            return override
+        if self.fast_response_types is None or response_type in self.fast_response_types:
+            return self.response_mode
+        return RESPONSE_MODE_MODEL
+
+
+    def bind_api_methods(self, api) -> None:
+        """Bind the unvalidated versions of the @validate_call methods of `api` when this client is trusted"""
+        if not self.trusted:
+            return
+        for name, function in _raw_api_functions(type(api)).items():
+            setattr(api, name, types.MethodType(function, api))
+
 
     _default = None
 
@@ -311,11 +409,8 @@ class ApiClient:
             elif response_type == "file":
                 return_data = self.__deserialize_file(response_data)
             elif response_type is not None:
-                match = None
                 content_type = response_data.getheader('content-type')
-                if content_type is not None:
-                    match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
-                encoding = match.group(1) if match else "utf-8"
+                encoding = _response_encoding(content_type) if content_type is not None else "utf-8"
                 response_text = response_data.data.decode(encoding)
                 return_data = self.deserialize(response_text, response_type, content_type)
         finally:
@@ -399,14 +494,14 @@ class ApiClient:
         # fetch data from response object
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = json_codec.loads(response_text)
             except ValueError:
                 data = response_text
         elif content_type.startswith("application/json"):
             if response_text == "":
                 data = ""
             else:
-                data = json.loads(response_text)
+                data = json_codec.loads(response_text)
         elif content_type.startswith("text/plain"):
             data = response_text
         else:
@@ -415,33 +510,50 @@ class ApiClient:
                 reason="Unsupported content type: {0}".format(content_type)
             )
 
-        return self.__deserialize(data, response_type)
+        mode = self.response_mode_for(response_type)
+        if data is None or mode == RESPONSE_MODE_DICT:
+            return data
+        return self.__deserializer_for(response_type, mode)(data)
 
-    def __deserialize(self, data, klass):
-        """Deserializes dict, list, str into an object.
+    def __deserializer_for(self, response_type: str, mode: str) -> Deserializer:
+        """Deserializer for a response type string, compiled on first use.
 
-        :param data: dict, list or str.
-        :param klass: class literal, or string of class name.
+        :param response_type: string of class name, e.g. "List[SimpleOrder]".
+        :param mode: "model" or "record".
 
-        :return: object.
+        :return: callable that deserializes parsed JSON.
         """
-        if data is None:
-            return None
+        key = (response_type, mode)
+        deserializer = self._deserializers.get(key)
+        if deserializer is None:
+            deserializer = self.__compile_deserializer(response_type, mode)
+            self._deserializers[key] = deserializer
+        return deserializer
+
+    def __compile_deserializer(self, klass, mode: str) -> Deserializer:
+        """Resolves a type once into a tree of deserializer callables.
+
+        Type strings are parsed and class names looked up here, so
+        deserializing a response only calls the compiled tree.
 
+        :param klass: class literal, or string of class name.
+        :param mode: "model" validates into models, "record" wraps model
+            objects in ModelRecord views.
+
+        :return: callable that deserializes parsed JSON, None stays None.
+        """
         if isinstance(klass, str):
             if klass.startswith('List['):
                 m = re.match(r'List\[(.*)]', klass)
                 assert m is not None, "Malformed List type definition"
-                sub_kls = m.group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                item = self.__compile_deserializer(m.group(1), mode)
+                return _none_safe(lambda data: [item(sub_data) for sub_data in data])
 
             if klass.startswith('Dict['):
                 m = re.match(r'Dict\[([^,]*), (.*)]', klass)
                 assert m is not None, "Malformed Dict type definition"
-                sub_kls = m.group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in data.items()}
+                value = self.__compile_deserializer(m.group(2), RESPONSE_MODE_MODEL)
+                return _none_safe(lambda data: {k: value(v) for k, v in data.items()})
 
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
@@ -450,17 +562,21 @@ class ApiClient:
                 klass = getattr(lighter.models, klass)
 
         if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+            return _none_safe(lambda data: self.__deserialize_primitive(data, klass))
         elif klass == object:
-            return self.__deserialize_object(data)
+            return _none_safe(self.__deserialize_object)
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            return _none_safe(self.__deserialize_date)
         elif klass == datetime.datetime:
-            return self.__deserialize_datetime(data)
+            return _none_safe(self.__deserialize_datetime)
         elif issubclass(klass, Enum):
-            return self.__deserialize_enum(data, klass)
+            return _none_safe(lambda data: self.__deserialize_enum(data, klass))
+        elif mode == RESPONSE_MODE_RECORD and issubclass(klass, BaseModel):
+            return _none_safe(
+                lambda data: ModelRecord(data, klass) if isinstance(data, dict) else klass.from_dict(data)
+            )
         else:
-            return self.__deserialize_model(data, klass)
+            return _none_safe(klass.from_dict)
 
     def parameters_to_tuples(self, params, collection_formats):
         """Get parameters as list of tuples, formatting collections.
@@ -508,7 +624,7 @@ class ApiClient:
             if isinstance(v, (int, float)):
                 v = str(v)
             if isinstance(v, dict):
-                v = json.dumps(v)
+                v = json_codec.dumps(v)
 
             if k in collection_formats:
                 collection_format = collection_formats[k]
@@ -772,13 +888,3 @@ class ApiClient:
                     .format(data, klass)
                 )
             )
-
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-
-        return klass.from_dict(data)
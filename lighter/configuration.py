@@ -186,6 +186,14 @@ conf = lighter.Configuration(
         """This value is passed to the aiohttp to limit simultaneous connections.
            Default values is 100, None means no-limit.
         """
+        self.connection_pool_maxsize_per_host = 0
+        """This value is passed to the aiohttp to limit simultaneous connections
+           to one host. Default value is 0, which means no-limit.
+        """
+        self.keepalive_timeout = 15.0
+        """Seconds an idle connection is kept in the pool for reuse.
+           Default value is 15, the aiohttp default.
+        """
 
         self.proxy: Optional[str] = None
         """Proxy URL
@@ -0,0 +1,51 @@
+"""
+JSON codec used by every JSON path in the SDK
+
+Uses orjson when it is installed and the standard library otherwise. Both
+backends write compact JSON, and values orjson cannot serialize (integers
+wider than 64 bits, non-string keys) fall back to the standard library.
+orjson reads integers wider than 64 bits as floats; the Lighter API does not
+send any.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKENDS = ("orjson", "json")
+
+backend = "orjson" if orjson is not None else "json"
+
+
+def set_backend(name: str) -> None:
+    """Select the JSON backend, "orjson" (if installed) or "json" """
+    global backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend {name!r}, expected one of {BACKENDS}")
+    if name == "orjson" and orjson is None:
+        raise ValueError("orjson is not installed")
+    backend = name
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse a JSON document"""
+    if backend == "orjson":
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize to a compact JSON string"""
+    if backend == "orjson":
+        try:
+            return orjson.dumps(obj, default=default).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, default=default, separators=(",", ":"))
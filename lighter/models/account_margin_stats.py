@@ -15,12 +15,12 @@
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
 
 from pydantic import BaseModel, ConfigDict, StrictStr
 from typing import Any, ClassVar, Dict, List
 from typing import Optional, Set
 from typing_extensions import Self
+from lighter import json_codec
 
 class AccountMarginStats(BaseModel):
     """
@@ -49,12 +49,12 @@ class AccountMarginStats(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of AccountMarginStats from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -1,6 +1,8 @@
 import abc
+import asyncio
 import enum
-from typing import Optional, Tuple
+import logging
+from typing import Dict, Optional, Set, Tuple
 
 import requests
 
@@ -9,17 +11,29 @@ from lighter.api import transaction_api
 from lighter.errors import ValidationError
 
 
+# Keeps connections alive between blocking nonce fetches
+_session = requests.Session()
+
+
 def get_nonce_from_api(client: api_client.ApiClient, account_index: int, api_key_index: int) -> int:
     #  uses request to avoid async initialization
-    req = requests.get(
-        client.configuration.host + "/api/v1/nextNonce",
+    configuration = client.configuration
+    req = _session.get(
+        configuration.host + "/api/v1/nextNonce",
         params={"account_index": account_index, "api_key_index": api_key_index},
+        proxies={"http": configuration.proxy, "https": configuration.proxy} if configuration.proxy else None,
+        verify=(configuration.ssl_ca_cert or True) if configuration.verify_ssl else False,
     )
     if req.status_code != 200:
         raise Exception(f"couldn't get nonce {req.content}")
     return req.json()["nonce"]
 
 
+async def get_nonce_from_api_async(tx_api: transaction_api.TransactionApi, account_index: int, api_key_index: int) -> int:
+    response = await tx_api.next_nonce(account_index=account_index, api_key_index=api_key_index)
+    return response.nonce
+
+
 class NonceManager(abc.ABC):
     def __init__(
         self,
@@ -37,9 +51,12 @@ class NonceManager(abc.ABC):
         self.current_api_key = end_api_key  # start will be used for the first tx
         self.account_index = account_index
         self.api_client = api_client
-        self.nonce = {
-            api_key_index: get_nonce_from_api(api_client, account_index, api_key_index) - 1
-            for api_key_index in range(start_api_key, end_api_key + 1)
+        self.nonce = self._fetch_initial_nonces()
+
+    def _fetch_initial_nonces(self) -> Dict[int, int]:
+        return {
+            api_key_index: get_nonce_from_api(self.api_client, self.account_index, api_key_index) - 1
+            for api_key_index in range(self.start_api_key, self.end_api_key + 1)
         }
 
     def hard_refresh_nonce(self, api_key: int):
@@ -49,9 +66,33 @@ class NonceManager(abc.ABC):
     def next_nonce(self) -> Tuple[int, int]:
         pass
 
-    def acknowledge_failure(self, api_key_index: int) -> None:
+    @abc.abstractmethod
+    def next_nonces(self, count: int) -> Tuple[int, int]:
+        """
+        Reserve `count` consecutive nonces on a single api key.
+        Returns the api key and the first reserved nonce.
+        """
         pass
 
+    async def ready(self) -> None:
+        """Wait until nonces can be handed out, signing paths await this before reserving"""
+        return None
+
+    def acknowledge_failure(self, api_key_index: int, count: int = 1) -> None:
+        pass
+
+    def release(self, api_key_index: int, first_nonce: int, count: int = 1) -> bool:
+        """
+        Return `count` unused nonces starting at `first_nonce`, the newest ones reserved on the key.
+        Returns False if the key handed out later nonces since, the caller then resyncs the key.
+        """
+        return True
+
+    def release_or_refresh(self, api_key_index: int, first_nonce: int, count: int = 1) -> None:
+        """Release unused nonces, or resync the key if they can no longer be returned without a gap"""
+        if count > 0 and not self.release(api_key_index, first_nonce, count):
+            self.hard_refresh_nonce(api_key_index)
+
 
 def increment_circular(idx: int, start_idx: int, end_idx: int) -> int:
     idx += 1
@@ -75,8 +116,22 @@ class OptimisticNonceManager(NonceManager):
         self.nonce[self.current_api_key] += 1
         return (self.current_api_key, self.nonce[self.current_api_key])
 
-    def acknowledge_failure(self, api_key_index: int) -> None:
-        self.nonce[api_key_index] -= 1
+    def next_nonces(self, count: int) -> Tuple[int, int]:
+        self.current_api_key = increment_circular(self.current_api_key, self.start_api_key, self.end_api_key)
+        first_nonce = self.nonce[self.current_api_key] + 1
+        self.nonce[self.current_api_key] += count
+        return (self.current_api_key, first_nonce)
+
+    def acknowledge_failure(self, api_key_index: int, count: int = 1) -> None:
+        self.nonce[api_key_index] -= count
+
+    def release(self, api_key_index: int, first_nonce: int, count: int = 1) -> bool:
+        # Only the newest reservation can be rolled back, otherwise nonces handed out
+        # in the meantime would be issued twice
+        if self.nonce[api_key_index] != first_nonce + count - 1:
+            return False
+        self.nonce[api_key_index] = first_nonce - 1
+        return True
 
 
 class ApiNonceManager(NonceManager):
@@ -99,13 +154,157 @@ class ApiNonceManager(NonceManager):
         self.nonce[self.current_api_key] = get_nonce_from_api(self.api_client, self.account_index, self.current_api_key)
         return (self.current_api_key, self.nonce[self.current_api_key])
 
+    def next_nonces(self, count: int) -> Tuple[int, int]:
+        self.current_api_key = increment_circular(self.current_api_key, self.start_api_key, self.end_api_key)
+        first_nonce = get_nonce_from_api(self.api_client, self.account_index, self.current_api_key)
+        self.nonce[self.current_api_key] = first_nonce + count - 1
+        return (self.current_api_key, first_nonce)
+
     def refresh_nonce(self, api_key_index: int) -> int:
         self.nonce[api_key_index] = get_nonce_from_api(self.api_client, self.start_api_key, self.end_api_key)
 
 
+class AsyncNonceManager(OptimisticNonceManager):
+    """
+    Optimistic nonce manager whose nonces are fetched with the shared async
+    ApiClient instead of blocking requests calls.
+
+    Nothing is fetched on construction: `await start()` loads every api key
+    concurrently and keeps them in sync in the background, so next_nonce()
+    never waits on I/O.
+
+    Restored nonces may be ahead of the API (a rejected tx) or behind it
+    (another process used the key), so they are checked by one forced refresh
+    in each direction before anything is signed with them: `await ready()`
+    waits for it, and next_nonce() must not be called before that.
+    """
+
+    def __init__(
+        self,
+        account_index: int,
+        api_client: api_client.ApiClient,
+        start_api_key: int,
+        end_api_key: Optional[int] = None,
+        refresh_interval: float = 30.0,
+    ) -> None:
+        super().__init__(account_index, api_client, start_api_key, end_api_key)
+        self.refresh_interval = refresh_interval
+        # Bumped whenever a key hands out nonces, a refresh that raced with signing is discarded
+        self._generation = {api_key: 0 for api_key in range(self.start_api_key, self.end_api_key + 1)}
+        self._task: Optional[asyncio.Task] = None
+        self._verify_task: Optional[asyncio.Task] = None
+        # Hard refreshes in flight, referenced so they are not garbage collected while running
+        self._hard_refresh_tasks: Set[asyncio.Task] = set()
+        self.tx_api = transaction_api.TransactionApi(api_client)
+
+    def _fetch_initial_nonces(self) -> Dict[int, int]:
+        return {}
+
+    def restore(self, nonces: Dict[int, int]) -> None:
+        """Seed nonce high-water marks (e.g. from a saved snapshot) for this manager's api keys"""
+        for api_key, nonce in nonces.items():
+            if int(api_key) in self._generation:
+                self.nonce[int(api_key)] = int(nonce)
+
+    async def start(self, initial_fetch: bool = True) -> None:
+        """
+        Fetch nonces for every api key concurrently and start background refreshes.
+        With `initial_fetch=False` restored nonces are verified in the background,
+        and ready() waits for that before the first nonce is handed out.
+        """
+        if initial_fetch or len(self.nonce) < len(self._generation):
+            await asyncio.gather(*(
+                self.refresh_nonce(api_key, force=True)
+                for api_key in range(self.start_api_key, self.end_api_key + 1)
+            ))
+        elif self._verify_task is None:
+            self._verify_task = asyncio.create_task(self._verify_restored(), name="lighter-nonce-verify")
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop(), name="lighter-nonce-refresh")
+
+    async def ready(self) -> None:
+        if self._verify_task is not None:
+            # Shielded so a cancelled caller does not cancel the check for everyone else
+            await asyncio.shield(self._verify_task)
+
+    async def _verify_restored(self) -> None:
+        results = await asyncio.gather(
+            *(self.refresh_nonce(api_key, force=True) for api_key in self._generation),
+            return_exceptions=True,
+        )
+        for api_key, result in zip(self._generation, results):
+            if isinstance(result, Exception):
+                logging.warning(f"could not verify restored nonce for api key {api_key}, keeping it: {result}")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._verify_task is not None:
+            self._verify_task.cancel()
+            await asyncio.gather(self._verify_task, return_exceptions=True)
+            self._verify_task = None
+        for task in list(self._hard_refresh_tasks):
+            task.cancel()
+        await asyncio.gather(*self._hard_refresh_tasks, return_exceptions=True)
+
+    async def refresh_nonce(self, api_key_index: int, force: bool = False) -> None:
+        """
+        Sync one api key with the API. Unless forced, the nonce only moves forward
+        and is left alone if the key was used while the request was in flight.
+        """
+        generation = self._generation[api_key_index]
+        nonce = await get_nonce_from_api_async(self.tx_api, self.account_index, api_key_index) - 1
+        if force:
+            self.nonce[api_key_index] = nonce
+        elif self._generation[api_key_index] == generation and nonce > self.nonce[api_key_index]:
+            self.nonce[api_key_index] = nonce
+
+    def hard_refresh_nonce(self, api_key: int):
+        # Called from sync code after an invalid nonce, resync without blocking the event loop
+        task = asyncio.ensure_future(self._hard_refresh(api_key))
+        self._hard_refresh_tasks.add(task)
+        task.add_done_callback(self._hard_refresh_tasks.discard)
+
+    async def _hard_refresh(self, api_key: int) -> None:
+        try:
+            await self.refresh_nonce(api_key, force=True)
+        except Exception as e:
+            logging.warning(f"nonce hard refresh failed for api key {api_key}: {e}")
+
+    def next_nonce(self) -> Tuple[int, int]:
+        return self._reserve(super().next_nonce)
+
+    def next_nonces(self, count: int) -> Tuple[int, int]:
+        return self._reserve(lambda: super(AsyncNonceManager, self).next_nonces(count))
+
+    def _reserve(self, reserve) -> Tuple[int, int]:
+        if not self.nonce:
+            raise ValidationError("nonce manager not started, await start() first")
+        api_key, nonce = reserve()
+        self._generation[api_key] += 1
+        return api_key, nonce
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            results = await asyncio.gather(
+                *(self.refresh_nonce(api_key) for api_key in self._generation),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logging.warning(f"nonce refresh failed: {result}")
+
+
 class NonceManagerType(enum.Enum):
     OPTIMISTIC = 1
     API = 2
+    ASYNC = 3
 
 
 def nonce_manager_factory(
@@ -129,4 +328,11 @@ def nonce_manager_factory(
             start_api_key=start_api_key,
             end_api_key=end_api_key,
         )
+    elif nonce_manager_type == NonceManagerType.ASYNC:
+        return AsyncNonceManager(
+            account_index=account_index,
+            api_client=api_client,
+            start_api_key=start_api_key,
+            end_api_key=end_api_key,
+        )
     raise ValidationError("invalid nonce manager type")
@@ -0,0 +1,113 @@
+from bisect import bisect_left, insort
+from typing import Dict, Iterator, List, Optional
+
+
+class OrderBookSide:
+    """
+    One side of an order book keyed by integer-scaled price.
+
+    Keys are kept in a sorted list so the best level is always at index 0
+    (bid keys are negated). Best price is O(1) and finding a level is
+    O(log n), but inserting or deleting a level shifts the list, so updates
+    are O(n) in the number of stored levels. The shift is a memmove of machine
+    words and stays below the cost of parsing the level up to ~10k levels,
+    which is simpler than a balanced tree for the book sizes Lighter sends.
+
+    The side keeps every level it is sent, `max_depth` only bounds the sorted
+    views (`levels()` and iteration), so deleting the best levels never leaves
+    the side empty while deeper levels still exist. Memory is therefore bounded
+    by the depth the venue publishes, not by `max_depth`.
+
+    `price_decimals` should be the market's price decimals. When it is not
+    given it is inferred from the first price, and a later price with more
+    decimals rescales the stored keys instead of failing.
+    """
+
+    def __init__(self, is_bid: bool, price_decimals: Optional[int] = None, max_depth: Optional[int] = None):
+        self.is_bid = is_bid
+        self.price_decimals = price_decimals
+        self.max_depth = max_depth
+        self._keys: List[int] = []
+        self._levels: Dict[int, Dict[str, str]] = {}
+
+    def scale_price(self, price) -> int:
+        """Convert a decimal price string to an integer in units of 10**-price_decimals"""
+        whole, _, frac = str(price).partition(".")
+        if self.price_decimals is None:
+            self.price_decimals = len(frac)
+        if len(frac) > self.price_decimals:
+            frac = frac.rstrip("0")
+            if len(frac) > self.price_decimals:
+                self._rescale(len(frac))
+        return int(whole + frac.ljust(self.price_decimals, "0"))
+
+    def _rescale(self, price_decimals: int) -> None:
+        """Re-key every level for a finer price precision, sort order is unchanged"""
+        factor = 10 ** (price_decimals - self.price_decimals)
+        self._keys = [key * factor for key in self._keys]
+        self._levels = {key * factor: level for key, level in self._levels.items()}
+        self.price_decimals = price_decimals
+
+    def update(self, levels) -> None:
+        """Apply price levels, a level with zero size removes that price"""
+        for level in levels:
+            scaled = self.scale_price(level["price"])
+            key = -scaled if self.is_bid else scaled
+            if float(level["size"]) == 0:
+                if self._levels.pop(key, None) is not None:
+                    del self._keys[bisect_left(self._keys, key)]
+                continue
+
+            if key not in self._levels:
+                insort(self._keys, key)
+            self._levels[key] = {"price": level["price"], "size": level["size"]}
+
+    def best(self) -> Optional[Dict[str, str]]:
+        """Best level or None if the side is empty"""
+        if not self._keys:
+            return None
+        return self._levels[self._keys[0]]
+
+    def best_price(self) -> Optional[float]:
+        level = self.best()
+        return float(level["price"]) if level is not None else None
+
+    def levels(self, depth: Optional[int] = None) -> List[Dict[str, str]]:
+        """Levels sorted best first, limited to `depth` (default `max_depth`)"""
+        if depth is None:
+            depth = self.max_depth
+        keys = self._keys if depth is None else self._keys[:depth]
+        return [self._levels[key] for key in keys]
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        return iter(self.levels())
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class OrderBook:
+    """Local order book for a single market"""
+
+    def __init__(self, price_decimals: Optional[int] = None, max_depth: Optional[int] = None):
+        self.asks = OrderBookSide(is_bid=False, price_decimals=price_decimals, max_depth=max_depth)
+        self.bids = OrderBookSide(is_bid=True, price_decimals=price_decimals, max_depth=max_depth)
+
+    def apply(self, order_book) -> None:
+        """Apply a snapshot or delta message payload with `asks` and `bids` levels"""
+        self.asks.update(order_book.get("asks", []))
+        self.bids.update(order_book.get("bids", []))
+
+    def best_ask(self) -> Optional[Dict[str, str]]:
+        return self.asks.best()
+
+    def best_bid(self) -> Optional[Dict[str, str]]:
+        return self.bids.best()
+
+    def __getitem__(self, side: str) -> List[Dict[str, str]]:
+        # Keeps `state["asks"]` / `state["bids"]` working for existing callbacks
+        if side == "asks":
+            return self.asks.levels()
+        if side == "bids":
+            return self.bids.levels()
+        raise KeyError(side)
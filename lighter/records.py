@@ -0,0 +1,90 @@
+"""
+Lightweight response records
+
+A ModelRecord is a read-only view over a parsed JSON object that exposes the
+fields of an OpenAPI model as attributes without running pydantic validation.
+Nested objects are wrapped on access, and the full model is only built when
+to_model() is called.
+"""
+
+import typing
+from typing import Any, Dict, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+# Response modes supported by ApiClient
+RESPONSE_MODE_MODEL = "model"
+RESPONSE_MODE_RECORD = "record"
+RESPONSE_MODE_DICT = "dict"
+RESPONSE_MODES = (RESPONSE_MODE_MODEL, RESPONSE_MODE_RECORD, RESPONSE_MODE_DICT)
+
+# Per model class: attribute name -> (json key, nested model class or None)
+_field_plans: Dict[type, Dict[str, Tuple[str, Optional[type]]]] = {}
+
+
+def _nested_model(annotation) -> Optional[type]:
+    """Model class inside an annotation such as Optional[List[Model]], if any"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in typing.get_args(annotation):
+        nested = _nested_model(arg)
+        if nested is not None:
+            return nested
+    return None
+
+
+def _field_plan(klass: type) -> Dict[str, Tuple[str, Optional[type]]]:
+    plan = _field_plans.get(klass)
+    if plan is None:
+        plan = {
+            name: (field.alias or name, _nested_model(field.annotation))
+            for name, field in klass.model_fields.items()
+            if name != "additional_properties"
+        }
+        _field_plans[klass] = plan
+    return plan
+
+
+def _wrap(value, klass: Optional[type]):
+    if klass is None or value is None:
+        return value
+    if isinstance(value, dict):
+        return ModelRecord(value, klass)
+    if isinstance(value, list):
+        return [_wrap(item, klass) for item in value]
+    return value
+
+
+class ModelRecord:
+    """Attribute access to a response object as `klass` would expose it, without validation"""
+
+    __slots__ = ("_data", "_klass", "_model")
+
+    def __init__(self, data: Dict[str, Any], klass: Type[BaseModel]):
+        self._data = data
+        self._klass = klass
+        self._model = None
+
+    def __getattr__(self, name: str):
+        field = _field_plan(self._klass).get(name)
+        if field is None:
+            if name == "additional_properties":
+                plan = _field_plan(self._klass)
+                keys = {key for key, _ in plan.values()}
+                return {key: value for key, value in self._data.items() if key not in keys}
+            raise AttributeError(f"{self._klass.__name__} has no field {name!r}")
+        key, nested = field
+        return _wrap(self._data.get(key), nested)
+
+    def __repr__(self) -> str:
+        return f"{self._klass.__name__}Record({self._data!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The underlying JSON object"""
+        return self._data
+
+    def to_model(self) -> BaseModel:
+        """Validate into the full model, built once on first use"""
+        if self._model is None:
+            self._model = self._klass.from_dict(self._data)
+        return self._model
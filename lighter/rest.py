@@ -13,7 +13,6 @@
 
 
 import io
-import json
 import re
 import ssl
 from typing import Optional, Union
@@ -21,6 +20,7 @@ from typing import Optional, Union
 import aiohttp
 import aiohttp_retry
 
+from lighter import json_codec
 from lighter.exceptions import ApiException, ApiValueError
 
 RESTResponseType = aiohttp.ClientResponse
@@ -70,6 +70,8 @@ class RESTClientObject:
 
         connector = aiohttp.TCPConnector(
             limit=maxsize,
+            limit_per_host=configuration.connection_pool_maxsize_per_host,
+            keepalive_timeout=configuration.keepalive_timeout,
             ssl=ssl_context
         )
 
@@ -165,7 +167,7 @@ class RESTClientObject:
         if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
             if re.search('json', headers['Content-Type'], re.IGNORECASE):
                 if body is not None:
-                    body = json.dumps(body)
+                    body = json_codec.dumps(body)
                 args["data"] = body
             elif headers['Content-Type'] == 'application/x-www-form-urlencoded':
                 args["data"] = aiohttp.FormData(post_params)
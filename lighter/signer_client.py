@@ -1,22 +1,24 @@
+import asyncio
 import ctypes
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
 import inspect
-import json
 import platform
 import logging
 import os
+import threading
 import time
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from eth_account import Account
-from eth_account.messages import encode_defunct
 from pydantic import StrictInt
 import lighter
 from lighter.configuration import Configuration
 from lighter.errors import ValidationError
 from lighter.models import TxHash
+from lighter import json_codec
 from lighter import nonce_manager
 from lighter.models.resp_send_tx import RespSendTx
+from lighter.models.resp_send_tx_batch import RespSendTxBatch
 from lighter.transactions import CreateOrder, CancelOrder, Withdraw
 
 logging.basicConfig(level=logging.DEBUG)
@@ -32,7 +34,57 @@ class StrOrErr(ctypes.Structure):
     _fields_ = [("str", ctypes.c_char_p), ("err", ctypes.c_char_p)]
 
 
-def _initialize_signer():
+# argtypes and restype of every signer export, bound once when the library is loaded
+_SIGNER_PROTOTYPES = {
+    "GenerateAPIKey": ([ctypes.c_char_p], ApiKeyResponse),
+    "CreateClient": ([ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_int, ctypes.c_longlong], ctypes.c_char_p),
+    "CheckClient": ([ctypes.c_int, ctypes.c_longlong], ctypes.c_char_p),
+    "SwitchAPIKey": ([ctypes.c_int], ctypes.c_char_p),
+    "CreateAuthToken": ([ctypes.c_longlong], StrOrErr),
+    "SignChangePubKey": ([ctypes.c_char_p, ctypes.c_longlong], StrOrErr),
+    "SignCreateOrder": (
+        [
+            ctypes.c_int,
+            ctypes.c_longlong,
+            ctypes.c_longlong,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_longlong,
+            ctypes.c_longlong,
+        ],
+        StrOrErr,
+    ),
+    "SignCancelOrder": ([ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong], StrOrErr),
+    "SignWithdraw": ([ctypes.c_longlong, ctypes.c_longlong], StrOrErr),
+    "SignCreateSubAccount": ([ctypes.c_longlong], StrOrErr),
+    "SignCancelAllOrders": ([ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong], StrOrErr),
+    "SignModifyOrder": (
+        [ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong],
+        StrOrErr,
+    ),
+    "SignTransfer": ([ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong, ctypes.c_char_p, ctypes.c_longlong], StrOrErr),
+    "SignCreatePublicPool": ([ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong], StrOrErr),
+    "SignUpdatePublicPool": (
+        [ctypes.c_longlong, ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong],
+        StrOrErr,
+    ),
+    "SignMintShares": ([ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong], StrOrErr),
+    "SignBurnShares": ([ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong], StrOrErr),
+    "SignUpdateLeverage": ([ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_longlong], StrOrErr),
+}
+
+# The signer library keeps a single process-wide current api key, so switching
+# keys and signing with it must happen under one lock
+_signer_lock = threading.RLock()
+_signer = None
+_signer_executor = None
+
+
+def _load_signer():
     is_linux = platform.system() == "Linux"
     is_mac = platform.system() == "Darwin"
     is_x64 = platform.machine().lower() in ("amd64", "x86_64")
@@ -53,12 +105,46 @@ def _initialize_signer():
         )
 
 
+def _initialize_signer():
+    """Load the signer library and bind its prototypes, once per process"""
+    global _signer
+    with _signer_lock:
+        if _signer is None:
+            signer = _load_signer()
+            for name, (argtypes, restype) in _SIGNER_PROTOTYPES.items():
+                func = getattr(signer, name)
+                func.argtypes = argtypes
+                func.restype = restype
+            _signer = signer
+        return _signer
+
+
+def _get_signer_executor() -> ThreadPoolExecutor:
+    """Dedicated signing thread, ctypes releases the GIL so the event loop keeps running while it signs"""
+    global _signer_executor
+    with _signer_lock:
+        if _signer_executor is None:
+            _signer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lighter-signer")
+        return _signer_executor
+
+
+def _decode_str_or_err(result: StrOrErr) -> Tuple[Optional[str], Optional[str]]:
+    tx_info = result.str.decode("utf-8") if result.str else None
+    error = result.err.decode("utf-8") if result.err else None
+    return tx_info, error
+
+
+def _sign_l1_message(eth_private_key, message_text: str) -> str:
+    """Sign a message with the Ethereum key, eth_account is only imported when an L1 signature is needed"""
+    from eth_account import Account
+    from eth_account.messages import encode_defunct
+
+    signature = Account.from_key(eth_private_key).sign_message(encode_defunct(text=message_text))
+    return signature.signature.to_0x_hex()
+
+
 def create_api_key(seed=""):
     signer = _initialize_signer()
-    signer.GenerateAPIKey.argtypes = [
-        ctypes.c_char_p,
-    ]
-    signer.GenerateAPIKey.restype = ApiKeyResponse
     result = signer.GenerateAPIKey(ctypes.c_char_p(seed.encode("utf-8")))
 
     private_key_str = result.privateKey.decode("utf-8") if result.privateKey else None
@@ -73,37 +159,46 @@ def trim_exc(exception_body: str):
 
 
 def process_api_key_and_nonce(func):
+    # Resolve the parameter layout once: nonce and api_key_index must be the last two parameters,
+    # so the wrapper can pick them out of args/kwargs without binding the signature on every call
+    params = list(inspect.signature(func).parameters.values())[1:]  # skip self
+    if [p.name for p in params[-2:]] != ["nonce", "api_key_index"]:
+        raise TypeError(f"{func.__name__} must end with nonce and api_key_index parameters")
+    nonce_position = len(params) - 2
+    default_nonce = params[-2].default
+    default_api_key_index = params[-1].default
+
     @wraps(func)
     async def wrapper(self, *args, **kwargs):
-        # Get the signature
-        sig = inspect.signature(func)
-
-        # Bind args and kwargs to the function's signature
-        bound_args = sig.bind(self, *args, **kwargs)
-        bound_args.apply_defaults()
-        # Extract api_key_index and nonce from kwargs or use defaults
-        api_key_index = bound_args.arguments.get("api_key_index", -1)
-        nonce = bound_args.arguments.get("nonce", -1)
-        if api_key_index == -1 and nonce == -1:
+        # Extract api_key_index and nonce from args or kwargs or use defaults
+        if len(args) > nonce_position:
+            nonce = args[nonce_position]
+            if len(args) > nonce_position + 1:
+                api_key_index = args[nonce_position + 1]
+            else:
+                api_key_index = kwargs.pop("api_key_index", default_api_key_index)
+            args = args[:nonce_position]
+        else:
+            nonce = kwargs.pop("nonce", default_nonce)
+            api_key_index = kwargs.pop("api_key_index", default_api_key_index)
+        reserved = api_key_index == -1 and nonce == -1
+        if reserved:
+            await self.nonce_manager.ready()
             api_key_index, nonce = self.nonce_manager.next_nonce()
-        err = self.switch_api_key(api_key_index)
-        if err != None:
-            raise Exception(f"error switching api key: {err}")
 
-        # Call the original function with modified kwargs
+        # Call the original function with the resolved nonce and api key. Other coroutines may
+        # reserve nonces while it awaits, so an unused nonce is only returned if it is still the newest
         ret: TxHash
         try:
-            partial_arguments = {k: v for k, v in bound_args.arguments.items() if k not in ("self", "nonce", "api_key_index")}
-            created_tx, ret, err = await func(self, **partial_arguments, nonce=nonce, api_key_index=api_key_index)
-            if ret.code != CODE_OK:
-                self.nonce_manager.acknowledge_failure(api_key_index)
+            created_tx, ret, err = await func(self, *args, nonce=nonce, api_key_index=api_key_index, **kwargs)
+            if reserved and (ret is None or ret.code != CODE_OK):
+                self.nonce_manager.release_or_refresh(api_key_index, nonce)
         except lighter.exceptions.BadRequestException as e:
             if "invalid nonce" in str(e):
                 self.nonce_manager.hard_refresh_nonce(api_key_index)
-                return None, None, trim_exc(str(e))
-            else:
-                self.nonce_manager.acknowledge_failure(api_key_index)
-                return None, None, trim_exc(str(e))
+            elif reserved:
+                self.nonce_manager.release_or_refresh(api_key_index, nonce)
+            return None, None, trim_exc(str(e))
 
         return created_tx, ret, err
 
@@ -161,10 +256,17 @@ class SignerClient:
         max_api_key_index=-1,
         private_keys: Optional[Dict[int, str]] = None,
         nonce_management_type=nonce_manager.NonceManagerType.OPTIMISTIC,
+        api_client: Optional[lighter.ApiClient] = None,
     ):
         """
         First private key needs to be passed separately for backwards compatibility.
         This may get deprecated in a future version.
+
+        `api_client` is an already configured ApiClient (proxy, SSL, pool
+        settings) shared with the caller's other APIs. The transaction and
+        order APIs and the nonce manager all use it, and the caller keeps
+        ownership: close() leaves it open. Without one the client builds
+        and owns a default ApiClient for `url`.
         """
         chain_id = 304 if "mainnet" in url else 300
 
@@ -185,7 +287,8 @@ class SignerClient:
         self.api_key_dict = self.build_api_key_dict(private_key, private_keys)
         self.account_index = account_index
         self.signer = _initialize_signer()
-        self.api_client = lighter.ApiClient(configuration=Configuration(host=url))
+        self._owns_api_client = api_client is None
+        self.api_client = api_client if api_client is not None else lighter.ApiClient(configuration=Configuration(host=url))
         self.tx_api = lighter.TransactionApi(self.api_client)
         self.order_api = lighter.OrderApi(self.api_client)
         self.nonce_manager = nonce_manager.nonce_manager_factory(
@@ -215,22 +318,15 @@ class SignerClient:
         return private_keys
 
     def create_client(self, api_key_index=None):
-        self.signer.CreateClient.argtypes = [
-            ctypes.c_char_p,
-            ctypes.c_char_p,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_longlong,
-        ]
         api_key_index = api_key_index or self.api_key_index
-        self.signer.CreateClient.restype = ctypes.c_char_p
-        err = self.signer.CreateClient(
-            self.url.encode("utf-8"),
-            self.api_key_dict[api_key_index].encode("utf-8"),
-            self.chain_id,
-            api_key_index,
-            self.account_index,
-        )
+        with _signer_lock:
+            err = self.signer.CreateClient(
+                self.url.encode("utf-8"),
+                self.api_key_dict[api_key_index].encode("utf-8"),
+                self.chain_id,
+                api_key_index,
+                self.account_index,
+            )
 
         if err is None:
             return
@@ -240,43 +336,37 @@ class SignerClient:
 
     # check_client verifies that the given API key associated with (api_key_index, account_index) matches the one on Lighter
     def check_client(self):
-        self.signer.CheckClient.argtypes = [
-            ctypes.c_int,
-            ctypes.c_longlong,
-        ]
-        self.signer.CheckClient.restype = ctypes.c_char_p
-
         for api_key in range(self.api_key_index, self.end_api_key_index + 1):
-            result = self.signer.CheckClient(api_key, self.account_index)
+            with _signer_lock:
+                result = self.signer.CheckClient(api_key, self.account_index)
             if result:
                 return result.decode("utf-8") + f" on api key {self.api_key_index}"
         return result.decode("utf-8") if result else None
 
     def switch_api_key(self, api_key: int):
-        self.signer.SwitchAPIKey.argtypes = [ctypes.c_int]
-        self.signer.CheckClient.restype = ctypes.c_char_p
-        result = self.signer.SwitchAPIKey(api_key)
+        with _signer_lock:
+            result = self.signer.SwitchAPIKey(api_key)
         return result.decode("utf-8") if result else None
 
     def create_api_key(self, seed=""):
-        self.signer.GenerateAPIKey.argtypes = [
-            ctypes.c_char_p,
-        ]
-        self.signer.GenerateAPIKey.restype = ApiKeyResponse
-        result = self.signer.GenerateAPIKey(ctypes.c_char_p(seed.encode("utf-8")))
-
-        private_key_str = result.str.decode("utf-8") if result.privateKey else None
-        public_key_str = result.str.decode("utf-8") if result.publicKey else None
-        error = result.err.decode("utf-8") if result.err else None
-
-        return private_key_str, public_key_str, error
+        return create_api_key(seed)
+
+    def _sign_with_api_key(self, api_key_index: int, sign, *args):
+        """Switch to `api_key_index` and call `sign(*args)` without another thread switching keys in between"""
+        with _signer_lock:
+            err = self.switch_api_key(api_key_index)
+            if err is not None:
+                raise Exception(f"error switching api key: {err}")
+            return sign(*args)
+
+    async def _sign_async(self, api_key_index: int, sign, *args):
+        """Run `sign(*args)` for `api_key_index` on the signing thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_signer_executor(), partial(self._sign_with_api_key, api_key_index, sign, *args)
+        )
 
     def sign_change_api_key(self, eth_private_key, new_pubkey: str, nonce: int):
-        self.signer.SignChangePubKey.argtypes = [
-            ctypes.c_char_p,
-            ctypes.c_longlong,
-        ]
-        self.signer.SignChangePubKey.restype = StrOrErr
         result = self.signer.SignChangePubKey(ctypes.c_char_p(new_pubkey.encode("utf-8")), nonce)
 
         tx_info_str = result.str.decode("utf-8") if result.str else None
@@ -285,16 +375,13 @@ class SignerClient:
             return None, error
 
         # fetch message to sign
-        tx_info = json.loads(tx_info_str)
+        tx_info = json_codec.loads(tx_info_str)
         msg_to_sign = tx_info["MessageToSign"]
         del tx_info["MessageToSign"]
 
         # sign the message
-        acct = Account.from_key(eth_private_key)
-        message = encode_defunct(text=msg_to_sign)
-        signature = acct.sign_message(message)
-        tx_info["L1Sig"] = signature.signature.to_0x_hex()
-        return json.dumps(tx_info), None
+        tx_info["L1Sig"] = _sign_l1_message(eth_private_key, msg_to_sign)
+        return json_codec.dumps(tx_info), None
 
     def get_api_key_nonce(self, api_key_index: int, nonce: int) -> Tuple[int, int]:
         if api_key_index != -1 and nonce != -1:
@@ -320,21 +407,6 @@ class SignerClient:
         order_expiry=DEFAULT_28_DAY_ORDER_EXPIRY,
         nonce=-1,
     ):
-        self.signer.SignCreateOrder.argtypes = [
-            ctypes.c_int,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-        ]
-        self.signer.SignCreateOrder.restype = StrOrErr
-
         result = self.signer.SignCreateOrder(
             market_index,
             client_order_index,
@@ -348,91 +420,29 @@ class SignerClient:
             order_expiry,
             nonce,
         )
-
-        tx_info = result.str.decode("utf-8") if result.str else None
-        error = result.err.decode("utf-8") if result.err else None
-
-        return tx_info, error
+        return _decode_str_or_err(result)
 
     def sign_cancel_order(self, market_index, order_index, nonce=-1):
-        self.signer.SignCancelOrder.argtypes = [
-            ctypes.c_int,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-        ]
-        self.signer.SignCancelOrder.restype = StrOrErr
-
         result = self.signer.SignCancelOrder(market_index, order_index, nonce)
-
-        tx_info = result.str.decode("utf-8") if result.str else None
-        error = result.err.decode("utf-8") if result.err else None
-
-        return tx_info, error
+        return _decode_str_or_err(result)
 
     def sign_withdraw(self, usdc_amount, nonce=-1):
-        self.signer.SignWithdraw.argtypes = [ctypes.c_longlong, ctypes.c_longlong]
-        self.signer.SignWithdraw.restype = StrOrErr
-
         result = self.signer.SignWithdraw(usdc_amount, nonce)
-
-        tx_info = result.str.decode("utf-8") if result.str else None
-        error = result.err.decode("utf-8") if result.err else None
-
-        return tx_info, error
+        return _decode_str_or_err(result)
 
     def sign_create_sub_account(self, nonce=-1):
-        self.signer.SignCreateSubAccount.argtypes = [ctypes.c_longlong]
-        self.signer.SignCreateSubAccount.restype = StrOrErr
-
         result = self.signer.SignCreateSubAccount(nonce)
-
-        tx_info = result.str.decode("utf-8") if result.str else None
-        error = result.err.decode("utf-8") if result.err else None
-
-        return tx_info, error
+        return _decode_str_or_err(result)
 
     def sign_cancel_all_orders(self, time_in_force, time, nonce=-1):
-        self.signer.SignCancelAllOrders.argtypes = [
-            ctypes.c_int,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-        ]
-        self.signer.SignCancelAllOrders.restype = StrOrErr
-
         result = self.signer.SignCancelAllOrders(time_in_force, time, nonce)
-
-        tx_info = result.str.decode("utf-8") if result.str else None
-        error = result.err.decode("utf-8") if result.err else None
-
-        return tx_info, error
+        return _decode_str_or_err(result)
 
     def sign_modify_order(self, market_index, order_index, base_amount, price, trigger_price, nonce=-1):
-        self.signer.SignModifyOrder.argtypes = [
-            ctypes.c_int,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-        ]
-        self.signer.SignModifyOrder.restype = StrOrErr
-
         result = self.signer.SignModifyOrder(market_index, order_index, base_amount, price, trigger_price, nonce)
-
-        tx_info = result.str.decode("utf-8") if result.str else None
-        error = result.err.decode("utf-8") if result.err else None
-
-        return tx_info, error
+        return _decode_str_or_err(result)
 
     def sign_transfer(self, eth_private_key, to_account_index, usdc_amount, fee, memo, nonce=-1):
-        self.signer.SignTransfer.argtypes = [
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-            ctypes.c_char_p,
-            ctypes.c_longlong,
-        ]
-        self.signer.SignTransfer.restype = StrOrErr
         result = self.signer.SignTransfer(to_account_index, usdc_amount, fee, ctypes.c_char_p(memo.encode("utf-8")), nonce)
 
         tx_info_str = result.str.decode("utf-8") if result.str else None
@@ -442,106 +452,42 @@ class SignerClient:
             return tx_info_str, error
         
         # fetch message to sign
-        tx_info = json.loads(tx_info_str)
+        tx_info = json_codec.loads(tx_info_str)
         msg_to_sign = tx_info["MessageToSign"]
         del tx_info["MessageToSign"]
 
         # sign the message
-        acct = Account.from_key(eth_private_key)
-        message = encode_defunct(text=msg_to_sign)
-        signature = acct.sign_message(message)
-        tx_info["L1Sig"] = signature.signature.to_0x_hex()
-        return json.dumps(tx_info), None
+        tx_info["L1Sig"] = _sign_l1_message(eth_private_key, msg_to_sign)
+        return json_codec.dumps(tx_info), None
 
     def sign_create_public_pool(self, operator_fee, initial_total_shares, min_operator_share_rate, nonce=-1):
-        self.signer.SignCreatePublicPool.argtypes = [
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-        ]
-        self.signer.SignCreatePublicPool.restype = StrOrErr
-
         result = self.signer.SignCreatePublicPool(operator_fee, initial_total_shares, min_operator_share_rate, nonce)
-
-        tx_info = result.str.decode("utf-8") if result.str else None
-        error = result.err.decode("utf-8") if result.err else None
-
-        return tx_info, error
+        return _decode_str_or_err(result)
 
     def sign_update_public_pool(self, public_pool_index, status, operator_fee, min_operator_share_rate, nonce=-1):
-        self.signer.SignUpdatePublicPool.argtypes = [
-            ctypes.c_longlong,
-            ctypes.c_int,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-        ]
-        self.signer.SignUpdatePublicPool.restype = StrOrErr
-
         result = self.signer.SignUpdatePublicPool(
             public_pool_index, status, operator_fee, min_operator_share_rate, nonce
         )
-
-        tx_info = result.str.decode("utf-8") if result.str else None
-        error = result.err.decode("utf-8") if result.err else None
-
-        return tx_info, error
+        return _decode_str_or_err(result)
 
     def sign_mint_shares(self, public_pool_index, share_amount, nonce=-1):
-        self.signer.SignMintShares.argtypes = [
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-        ]
-        self.signer.SignMintShares.restype = StrOrErr
-
         result = self.signer.SignMintShares(public_pool_index, share_amount, nonce)
-
-        tx_info = result.str.decode("utf-8") if result.str else None
-        error = result.err.decode("utf-8") if result.err else None
-
-        return tx_info, error
+        return _decode_str_or_err(result)
 
     def sign_burn_shares(self, public_pool_index, share_amount, nonce=-1):
-        self.signer.SignBurnShares.argtypes = [
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-            ctypes.c_longlong,
-        ]
-        self.signer.SignBurnShares.restype = StrOrErr
-
         result = self.signer.SignBurnShares(public_pool_index, share_amount, nonce)
-
-        tx_info = result.str.decode("utf-8") if result.str else None
-        error = result.err.decode("utf-8") if result.err else None
-
-        return tx_info, error
+        return _decode_str_or_err(result)
 
     def sign_update_leverage(self, market_index, fraction, margin_mode, nonce=-1):
-        self.signer.SignUpdateLeverage.argtypes = [
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_longlong,
-        ]
-        self.signer.SignUpdateLeverage.restype = StrOrErr
         result = self.signer.SignUpdateLeverage(market_index, fraction, margin_mode, nonce)
-
-        tx_info = result.str.decode("utf-8") if result.str else None
-        error = result.err.decode("utf-8") if result.err else None
-        return tx_info, error
+        return _decode_str_or_err(result)
 
     def create_auth_token_with_expiry(self, deadline: int = DEFAULT_10_MIN_AUTH_EXPIRY):
         if deadline == SignerClient.DEFAULT_10_MIN_AUTH_EXPIRY:
             deadline = int(time.time() + 10 * SignerClient.MINUTE)
-        self.signer.CreateAuthToken.argtypes = [ctypes.c_longlong]
-        self.signer.CreateAuthToken.restype = StrOrErr
-        result = self.signer.CreateAuthToken(deadline)
-
-        auth = result.str.decode("utf-8") if result.str else None
-        error = result.err.decode("utf-8") if result.err else None
-        return auth, error
+        with _signer_lock:
+            result = self.signer.CreateAuthToken(deadline)
+        return _decode_str_or_err(result)
 
     async def change_api_key(self, eth_private_key: str, new_pubkey: str, nonce=-1):
         tx_info, error = self.sign_change_api_key(eth_private_key, new_pubkey, nonce)
@@ -570,7 +516,9 @@ class SignerClient:
         nonce=-1,
         api_key_index=-1,
     ) -> (CreateOrder, TxHash, str):
-        tx_info, error = self.sign_create_order(
+        tx_info, error = await self._sign_async(
+            api_key_index,
+            self.sign_create_order,
             market_index,
             client_order_index,
             base_amount,
@@ -700,7 +648,7 @@ class SignerClient:
 
     @process_api_key_and_nonce
     async def cancel_order(self, market_index, order_index, nonce=-1, api_key_index=-1) -> (CancelOrder, TxHash, str):
-        tx_info, error = self.sign_cancel_order(market_index, order_index, nonce)
+        tx_info, error = await self._sign_async(api_key_index, self.sign_cancel_order, market_index, order_index, nonce)
         if error is not None:
             return None, None, error
         logging.debug(f"Cancel Order Tx Info: {tx_info}")
@@ -777,7 +725,7 @@ class SignerClient:
     async def withdraw(self, usdc_amount, nonce=-1, api_key_index=-1) -> (Withdraw, TxHash):
         usdc_amount = int(usdc_amount * self.USDC_TICKER_SCALE)
 
-        tx_info, error = self.sign_withdraw(usdc_amount, nonce)
+        tx_info, error = await self._sign_async(api_key_index, self.sign_withdraw, usdc_amount, nonce)
         if error is not None:
             return None, None, error
         logging.debug(f"Withdraw Tx Info: {tx_info}")
@@ -798,7 +746,7 @@ class SignerClient:
 
     @process_api_key_and_nonce
     async def cancel_all_orders(self, time_in_force, time, nonce=-1, api_key_index=-1):
-        tx_info, error = self.sign_cancel_all_orders(time_in_force, time, nonce)
+        tx_info, error = await self._sign_async(api_key_index, self.sign_cancel_all_orders, time_in_force, time, nonce)
         if error is not None:
             return None, None, error
         logging.debug(f"Cancel All Orders Tx Info: {tx_info}")
@@ -811,7 +759,9 @@ class SignerClient:
     async def modify_order(
         self, market_index, order_index, base_amount, price, trigger_price, nonce=-1, api_key_index=-1
     ):
-        tx_info, error = self.sign_modify_order(market_index, order_index, base_amount, price, trigger_price, nonce)
+        tx_info, error = await self._sign_async(
+            api_key_index, self.sign_modify_order, market_index, order_index, base_amount, price, trigger_price, nonce
+        )
         if error is not None:
             return None, None, error
         logging.debug(f"Modify Order Tx Info: {tx_info}")
@@ -824,7 +774,9 @@ class SignerClient:
     async def transfer(self, eth_private_key: str, to_account_index, usdc_amount, fee, memo, nonce=-1, api_key_index=-1):
         usdc_amount = int(usdc_amount * self.USDC_TICKER_SCALE)
 
-        tx_info, error = self.sign_transfer(eth_private_key, to_account_index, usdc_amount, fee, memo, nonce)
+        tx_info, error = await self._sign_async(
+            api_key_index, self.sign_transfer, eth_private_key, to_account_index, usdc_amount, fee, memo, nonce
+        )
         if error is not None:
             return None, None, error
         logging.debug(f"Transfer Tx Info: {tx_info}")
@@ -837,8 +789,8 @@ class SignerClient:
     async def create_public_pool(
         self, operator_fee, initial_total_shares, min_operator_share_rate, nonce=-1, api_key_index=-1
     ):
-        tx_info, error = self.sign_create_public_pool(
-            operator_fee, initial_total_shares, min_operator_share_rate, nonce
+        tx_info, error = await self._sign_async(
+            api_key_index, self.sign_create_public_pool, operator_fee, initial_total_shares, min_operator_share_rate, nonce
         )
         if error is not None:
             return None, None, error
@@ -852,8 +804,8 @@ class SignerClient:
     async def update_public_pool(
         self, public_pool_index, status, operator_fee, min_operator_share_rate, nonce=-1, api_key_index=-1
     ):
-        tx_info, error = self.sign_update_public_pool(
-            public_pool_index, status, operator_fee, min_operator_share_rate, nonce
+        tx_info, error = await self._sign_async(
+            api_key_index, self.sign_update_public_pool, public_pool_index, status, operator_fee, min_operator_share_rate, nonce
         )
         if error is not None:
             return None, None, error
@@ -865,7 +817,7 @@ class SignerClient:
 
     @process_api_key_and_nonce
     async def mint_shares(self, public_pool_index, share_amount, nonce=-1, api_key_index=-1):
-        tx_info, error = self.sign_mint_shares(public_pool_index, share_amount, nonce)
+        tx_info, error = await self._sign_async(api_key_index, self.sign_mint_shares, public_pool_index, share_amount, nonce)
         if error is not None:
             return None, None, error
         logging.debug(f"Mint Shares Tx Info: {tx_info}")
@@ -876,7 +828,7 @@ class SignerClient:
 
     @process_api_key_and_nonce
     async def burn_shares(self, public_pool_index, share_amount, nonce=-1, api_key_index=-1):
-        tx_info, error = self.sign_burn_shares(public_pool_index, share_amount, nonce)
+        tx_info, error = await self._sign_async(api_key_index, self.sign_burn_shares, public_pool_index, share_amount, nonce)
         if error is not None:
             return None, None, error
         logging.debug(f"Burn Shares Tx Info: {tx_info}")
@@ -888,7 +840,7 @@ class SignerClient:
     @process_api_key_and_nonce
     async def update_leverage(self, market_index, margin_mode, leverage, nonce=-1, api_key_index=-1):
         imf = int(10_000 / leverage)
-        tx_info, error = self.sign_update_leverage(market_index, imf, margin_mode, nonce)
+        tx_info, error = await self._sign_async(api_key_index, self.sign_update_leverage, market_index, imf, margin_mode, nonce)
 
         if error is not None:
             return None, None, error
@@ -904,8 +856,19 @@ class SignerClient:
             raise Exception(tx_info)
         return await self.tx_api.send_tx(tx_type=tx_type, tx_info=tx_info)
 
+    async def send_tx_batch(self, tx_types: List[int], tx_infos: List[str]) -> RespSendTxBatch:
+        for tx_info in tx_infos:
+            if tx_info[0] != "{":
+                raise Exception(tx_info)
+        return await self.tx_api.send_tx_batch(tx_types=json_codec.dumps(tx_types), tx_infos=json_codec.dumps(tx_infos))
+
+    def batch(self) -> "TxBatch":
+        """Start a batch of create, cancel and modify transactions sent with one send_tx_batch call"""
+        return TxBatch(self)
+
     async def close(self):
-        await self.api_client.close()
+        if self._owns_api_client:
+            await self.api_client.close()
 
     @staticmethod
     def are_keys_equal(key1, key2) -> bool:
@@ -915,3 +878,162 @@ class SignerClient:
         if key2.startswith("0x"):
             start_index2 = 2
         return key1[start_index1:] == key2[start_index2:]
+
+
+class TxBatch:
+    """
+    Collects create, cancel and modify order transactions, signs them with
+    consecutive nonces from a single api key and submits them in one
+    send_tx_batch call.
+
+    Each add method returns the position of its result in the list returned
+    by send(), where every result is a (tx, tx_hash, error) tuple like the
+    single transaction methods return.
+    """
+
+    def __init__(self, client: SignerClient):
+        self.client = client
+        self._txs = []
+
+    def __len__(self) -> int:
+        return len(self._txs)
+
+    def create_order(
+        self,
+        market_index,
+        client_order_index,
+        base_amount,
+        price,
+        is_ask,
+        order_type,
+        time_in_force,
+        reduce_only=False,
+        trigger_price=SignerClient.NIL_TRIGGER_PRICE,
+        order_expiry=-1,
+    ) -> int:
+        def sign(nonce):
+            tx_info, error = self.client.sign_create_order(
+                market_index,
+                client_order_index,
+                base_amount,
+                price,
+                int(is_ask),
+                order_type,
+                time_in_force,
+                int(reduce_only),
+                trigger_price,
+                order_expiry,
+                nonce,
+            )
+            return tx_info, error, CreateOrder.from_json
+
+        return self._add(SignerClient.TX_TYPE_CREATE_ORDER, sign)
+
+    def create_market_order(
+        self,
+        market_index,
+        client_order_index,
+        base_amount,
+        avg_execution_price,
+        is_ask,
+        reduce_only: bool = False,
+    ) -> int:
+        return self.create_order(
+            market_index,
+            client_order_index,
+            base_amount,
+            avg_execution_price,
+            is_ask,
+            order_type=SignerClient.ORDER_TYPE_MARKET,
+            time_in_force=SignerClient.ORDER_TIME_IN_FORCE_IMMEDIATE_OR_CANCEL,
+            order_expiry=SignerClient.DEFAULT_IOC_EXPIRY,
+            reduce_only=reduce_only,
+        )
+
+    def cancel_order(self, market_index, order_index) -> int:
+        def sign(nonce):
+            tx_info, error = self.client.sign_cancel_order(market_index, order_index, nonce)
+            return tx_info, error, CancelOrder.from_json
+
+        return self._add(SignerClient.TX_TYPE_CANCEL_ORDER, sign)
+
+    def modify_order(self, market_index, order_index, base_amount, price, trigger_price) -> int:
+        def sign(nonce):
+            tx_info, error = self.client.sign_modify_order(
+                market_index, order_index, base_amount, price, trigger_price, nonce
+            )
+            return tx_info, error, None
+
+        return self._add(SignerClient.TX_TYPE_MODIFY_ORDER, sign)
+
+    def _add(self, tx_type: int, sign) -> int:
+        self._txs.append((tx_type, sign))
+        return len(self._txs) - 1
+
+    def _sign_all(self, first_nonce: int, results: List) -> List:
+        # Sign in order and only advance the nonce on success so the batch has no nonce gaps
+        signed = []
+        nonce = first_nonce
+        for position, (tx_type, sign) in enumerate(self._txs):
+            tx_info, error, parse = sign(nonce)
+            if error is not None:
+                results[position] = (None, None, error)
+                continue
+            signed.append((position, tx_type, tx_info, parse))
+            nonce += 1
+        return signed
+
+    async def send(self) -> List[Tuple[Optional[object], Optional[str], Optional[str]]]:
+        results = [(None, None, None)] * len(self._txs)
+        if not self._txs:
+            return results
+
+        # Other coroutines can reserve nonces on the same key while this batch awaits, so unused
+        # nonces are only returned while they are still the newest reservation, otherwise the key is resynced
+        nonce_manager = self.client.nonce_manager
+        await nonce_manager.ready()
+        api_key_index, first_nonce = nonce_manager.next_nonces(len(self._txs))
+        try:
+            signed = await self.client._sign_async(api_key_index, self._sign_all, first_nonce, results)
+        except Exception:
+            nonce_manager.release_or_refresh(api_key_index, first_nonce, len(self._txs))
+            raise
+
+        # Signed transactions hold the first nonces, the tail reserved for failed signatures is unused
+        nonce_manager.release_or_refresh(api_key_index, first_nonce + len(signed), len(self._txs) - len(signed))
+        if not signed:
+            return results
+
+        try:
+            api_response = await self.client.send_tx_batch(
+                [tx_type for _, tx_type, _, _ in signed],
+                [tx_info for _, _, tx_info, _ in signed],
+            )
+            logging.debug(f"Send Tx Batch Response: {api_response}")
+        except lighter.exceptions.BadRequestException as e:
+            if "invalid nonce" in str(e):
+                nonce_manager.hard_refresh_nonce(api_key_index)
+            else:
+                nonce_manager.release_or_refresh(api_key_index, first_nonce, len(signed))
+            for position, _, _, _ in signed:
+                results[position] = (None, None, trim_exc(str(e)))
+            return results
+
+        if api_response.code != CODE_OK:
+            nonce_manager.release_or_refresh(api_key_index, first_nonce, len(signed))
+            for position, _, _, _ in signed:
+                results[position] = (None, None, api_response.message or f"batch rejected with code {api_response.code}")
+            return results
+
+        # Hashes are returned in submission order, transactions without one were not accepted
+        tx_hashes = list(api_response.tx_hash or [])
+        if len(tx_hashes) != len(signed):
+            logging.warning(f"send_tx_batch returned {len(tx_hashes)} tx hashes for {len(signed)} transactions")
+            nonce_manager.hard_refresh_nonce(api_key_index)
+        for index, (position, _, tx_info, parse) in enumerate(signed):
+            if index < len(tx_hashes):
+                tx = parse(tx_info) if parse is not None else tx_info
+                results[position] = (tx, tx_hashes[index], None)
+            else:
+                results[position] = (None, None, "no tx hash returned for transaction in batch")
+        return results
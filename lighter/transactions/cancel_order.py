@@ -1,6 +1,7 @@
-import json
 from typing import Optional
 
+from lighter import json_codec
+
 
 class CancelOrder:
     def __init__(self):
@@ -13,7 +14,7 @@ class CancelOrder:
 
     @classmethod
     def from_json(cls, json_str: str) -> 'CancelOrder':
-        params = json.loads(json_str)
+        params = json_codec.loads(json_str)
         self = cls()
         self.account_index = params.get('AccountIndex')
         self.order_book_index = params.get('OrderBookIndex')
@@ -24,4 +25,4 @@ class CancelOrder:
         return self
 
     def to_json(self) -> str:
-        return json.dumps(self.__dict__, default=str)
+        return json_codec.dumps(self.__dict__, default=str)
@@ -1,6 +1,7 @@
-import json
 from typing import Optional
 
+from lighter import json_codec
+
 
 class CreateOrder:
     def __init__(self):
@@ -16,7 +17,7 @@ class CreateOrder:
 
     @classmethod
     def from_json(cls, json_str: str) -> 'CreateOrder':
-        params = json.loads(json_str)
+        params = json_codec.loads(json_str)
         self = cls()
         self.account_index = params.get('AccountIndex')
         self.order_book_index = params.get('OrderBookIndex')
@@ -30,4 +31,4 @@ class CreateOrder:
         return self
 
     def to_json(self) -> str:
-        return json.dumps(self.__dict__, default=str)
+        return json_codec.dumps(self.__dict__, default=str)
@@ -1,6 +1,7 @@
-import json
 from typing import Optional
 
+from lighter import json_codec
+
 
 class Withdraw:
     def __init__(self):
@@ -12,7 +13,7 @@ class Withdraw:
 
     @classmethod
     def from_json(cls, json_str: str) -> 'Withdraw':
-        params = json.loads(json_str)
+        params = json_codec.loads(json_str)
         instance = cls()
         instance.from_account_index = params.get('FromAccountIndex')
         instance.collateral_amount = params.get('CollateralAmount')
@@ -22,4 +23,4 @@ class Withdraw:
         return instance
 
     def to_json(self) -> str:
-        return json.dumps(self.__dict__, default=str)
+        return json_codec.dumps(self.__dict__, default=str)
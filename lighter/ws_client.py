@@ -1,7 +1,8 @@
-import json
 from websockets.sync.client import connect
-from websockets.client import connect as connect_async
+from websockets.asyncio.client import connect as connect_async
+from lighter import json_codec
 from lighter.configuration import Configuration
+from lighter.order_book import OrderBook
 
 
 class WsClient:
@@ -13,11 +14,16 @@ class WsClient:
         account_ids=[],
         on_order_book_update=print,
         on_account_update=print,
+        order_book_max_depth=None,
+        order_book_price_decimals=None,
+        proxy=None,
     ):
         if host is None:
             host = Configuration.get_default().host.replace("https://", "")
 
         self.base_url = f"wss://{host}{path}"
+        # HTTP(S) proxy URL for the websocket connection, None uses the system proxy settings
+        self.proxy = proxy if proxy is not None else True
 
         self.subscriptions = {
             "order_books": order_book_ids,
@@ -28,6 +34,9 @@ class WsClient:
             raise Exception("No subscriptions provided.")
 
         self.order_book_states = {}
+        self.order_book_max_depth = order_book_max_depth
+        # market id -> price decimals, markets without an entry infer them from the first prices
+        self.order_book_price_decimals = order_book_price_decimals or {}
         self.account_states = {}
 
         self.on_order_book_update = on_order_book_update
@@ -37,7 +46,7 @@ class WsClient:
 
     def on_message(self, ws, message):
         if isinstance(message, str):
-            message = json.loads(message)
+            message = json_codec.loads(message)
 
         message_type = message.get("type")
 
@@ -55,7 +64,7 @@ class WsClient:
             self.handle_unhandled_message(message)
 
     async def on_message_async(self, ws, message):
-        message = json.loads(message)
+        message = json_codec.loads(message)
         message_type = message.get("type")
 
         if message_type == "connected":
@@ -66,11 +75,11 @@ class WsClient:
     def handle_connected(self, ws):
         for market_id in self.subscriptions["order_books"]:
             ws.send(
-                json.dumps({"type": "subscribe", "channel": f"order_book/{market_id}"})
+                json_codec.dumps({"type": "subscribe", "channel": f"order_book/{market_id}"})
             )
         for account_id in self.subscriptions["accounts"]:
             ws.send(
-                json.dumps(
+                json_codec.dumps(
                     {"type": "subscribe", "channel": f"account_all/{account_id}"}
                 )
             )
@@ -78,18 +87,23 @@ class WsClient:
     async def handle_connected_async(self, ws):
         for market_id in self.subscriptions["order_books"]:
             await ws.send(
-                json.dumps({"type": "subscribe", "channel": f"order_book/{market_id}"})
+                json_codec.dumps({"type": "subscribe", "channel": f"order_book/{market_id}"})
             )
         for account_id in self.subscriptions["accounts"]:
             await ws.send(
-                json.dumps(
+                json_codec.dumps(
                     {"type": "subscribe", "channel": f"account_all/{account_id}"}
                 )
             )
 
     def handle_subscribed_order_book(self, message):
         market_id = message["channel"].split(":")[1]
-        self.order_book_states[market_id] = message["order_book"]
+        order_book = OrderBook(
+            price_decimals=self.order_book_price_decimals.get(int(market_id)),
+            max_depth=self.order_book_max_depth,
+        )
+        order_book.apply(message["order_book"])
+        self.order_book_states[market_id] = order_book
         if self.on_order_book_update:
             self.on_order_book_update(market_id, self.order_book_states[market_id])
 
@@ -101,28 +115,14 @@ class WsClient:
 
     def update_order_book_state(self, market_id, order_book):
         self.update_orders(
-            order_book["asks"], self.order_book_states[market_id]["asks"]
+            order_book["asks"], self.order_book_states[market_id].asks
         )
         self.update_orders(
-            order_book["bids"], self.order_book_states[market_id]["bids"]
+            order_book["bids"], self.order_book_states[market_id].bids
         )
 
     def update_orders(self, new_orders, existing_orders):
-        for new_order in new_orders:
-            is_new_order = True
-            for existing_order in existing_orders:
-                if new_order["price"] == existing_order["price"]:
-                    is_new_order = False
-                    existing_order["size"] = new_order["size"]
-                    if float(new_order["size"]) == 0:
-                        existing_orders.remove(existing_order)
-                    break
-            if is_new_order:
-                existing_orders.append(new_order)
-
-        existing_orders = [
-            order for order in existing_orders if float(order["size"]) > 0
-        ]
+        existing_orders.update(new_orders)
 
     def handle_subscribed_account(self, message):
         account_id = message["channel"].split(":")[1]
@@ -146,15 +146,17 @@ class WsClient:
         raise Exception(f"Closed: {close_status_code} {close_msg}")
 
     def run(self):
-        ws = connect(self.base_url)
+        ws = connect(self.base_url, proxy=self.proxy)
         self.ws = ws
 
-        for message in ws:
-            self.on_message(ws, message)
+        with ws:
+            for message in ws:
+                self.on_message(ws, message)
 
     async def run_async(self):
-        ws = await connect_async(self.base_url)
+        ws = await connect_async(self.base_url, proxy=self.proxy)
         self.ws = ws
 
-        async for message in ws:
-            await self.on_message_async(ws, message)
+        async with ws:
+            async for message in ws:
+                await self.on_message_async(ws, message)
@@ -0,0 +1,323 @@
+"""
+Lighter Protocol streaming market and account data
+
+Runs `lighter.ws_client.WsClient` in the background for the traded markets and
+keeps an in-memory top of book per market that can be read without I/O. A
+second stream follows the account channel and keeps per-market positions that
+callers can wait on.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from lighter.ws_client import WsClient
+
+
+class TopOfBook(NamedTuple):
+    """Best bid/ask for a market and when it was received (monotonic seconds)"""
+    best_bid: Optional[float]
+    best_ask: Optional[float]
+    received_at: float
+
+
+class LighterPosition(NamedTuple):
+    """Signed position for a market (positive long, negative short) and when it was updated"""
+    market_id: int
+    symbol: str
+    size: float
+    updated_at: float
+
+
+class LighterOrderBookStream:
+    """Background order book subscription with reconnect and backoff"""
+
+    def __init__(
+        self,
+        host: str,
+        market_ids: Iterable[int],
+        logger: Optional[logging.Logger] = None,
+        price_decimals: Optional[Dict[int, int]] = None,
+        proxy: Optional[str] = None,
+        max_depth: int = 50,
+        min_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        self.host = host.replace("https://", "")
+        self.proxy = proxy
+        self.market_ids = list(market_ids)
+        self.price_decimals = dict(price_decimals or {})
+        self.max_depth = max_depth
+        self.logger = logger or logging.getLogger(__name__)
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+
+        self._books: Dict[int, TopOfBook] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.connected = False
+
+    def start(self):
+        """Start the background subscription task (idempotent)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="lighter-order-book-stream")
+
+    async def stop(self):
+        """Cancel the subscription task and wait for it to exit"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.connected = False
+
+    async def wait_ready(self, timeout: float) -> bool:
+        """Wait until every subscribed market has a top of book"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if all(market_id in self._books for market_id in self.market_ids):
+                return True
+            await asyncio.sleep(0.05)
+        return False
+
+    def get_top_of_book(self, market_id: int, max_age: float) -> Optional[TopOfBook]:
+        """Return the top of book if the stream is connected and it is no older than `max_age` seconds"""
+        if not self.connected:
+            return None
+        book = self._books.get(market_id)
+        if book is None or time.monotonic() - book.received_at > max_age:
+            return None
+        return book
+
+    async def _run(self):
+        backoff = self.min_backoff
+        while True:
+            started_at = time.monotonic()
+            client = WsClient(
+                host=self.host,
+                order_book_ids=self.market_ids,
+                on_order_book_update=self._on_order_book_update,
+                on_account_update=None,
+                order_book_max_depth=self.max_depth,
+                order_book_price_decimals=self.price_decimals,
+                proxy=self.proxy,
+            )
+            try:
+                await client.run_async()
+                self.logger.warning("⚠️ Lighter order book stream closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"⚠️ Lighter order book stream error: {e}")
+            finally:
+                self.connected = False
+
+            # A connection that stayed up for a while resets the backoff
+            if time.monotonic() - started_at > self.max_backoff:
+                backoff = self.min_backoff
+
+            delay = backoff * random.uniform(0.8, 1.2)
+            self.logger.debug(f"Reconnecting Lighter order book stream in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _on_order_book_update(self, market_id, order_book):
+        self._books[int(market_id)] = TopOfBook(
+            order_book.bids.best_price(),
+            order_book.asks.best_price(),
+            time.monotonic(),
+        )
+        self.connected = True
+
+
+class LighterAccountStream:
+    """Background `account_all` subscription keeping per-market positions, REST only to resync"""
+
+    # Position sizes at or below this are treated as flat
+    FLAT_TOLERANCE = 1e-6
+
+    def __init__(
+        self,
+        host: str,
+        account_index: int,
+        account_api,
+        logger: Optional[logging.Logger] = None,
+        proxy: Optional[str] = None,
+        min_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        min_resync_interval: float = 0.1,
+        max_resync_interval: float = 2.0,
+    ):
+        self.host = host.replace("https://", "")
+        self.account_index = account_index
+        self.account_api = account_api
+        self.proxy = proxy
+        self.logger = logger or logging.getLogger(__name__)
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.min_resync_interval = min_resync_interval
+        self.max_resync_interval = max_resync_interval
+
+        self._positions: Dict[int, LighterPosition] = {}
+        self._updated = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.connected = False
+
+    def start(self):
+        """Start the background subscription task (idempotent)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="lighter-account-stream")
+
+    async def stop(self):
+        """Cancel the subscription task and wait for it to exit"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.connected = False
+
+    async def wait_ready(self, timeout: float) -> bool:
+        """Wait until the first account snapshot has been received"""
+        return await self.wait_for(lambda stream: stream.connected, timeout, resync=False)
+
+    def position_size(self, market_id: int) -> float:
+        """Signed position size for a market, 0.0 if there is none"""
+        position = self._positions.get(market_id)
+        return position.size if position is not None else 0.0
+
+    def get_position(self, market_id: int) -> Optional[LighterPosition]:
+        return self._positions.get(market_id)
+
+    def is_flat(self, market_id: int) -> bool:
+        return abs(self.position_size(market_id)) <= self.FLAT_TOLERANCE
+
+    def open_positions(self) -> List[LighterPosition]:
+        """Every position with a non-zero size"""
+        return [p for p in self._positions.values() if abs(p.size) > self.FLAT_TOLERANCE]
+
+    async def wait_for(self, predicate: Callable[["LighterAccountStream"], bool], timeout: float,
+                       resync: bool = True) -> bool:
+        """
+        Wait until `predicate(self)` holds or `timeout` seconds pass.
+
+        Re-evaluated on every account update. While the stream is disconnected
+        positions are resynced over REST instead, backing off exponentially from
+        `min_resync_interval` to `max_resync_interval` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        resync_interval = self.min_resync_interval
+        while True:
+            if predicate(self):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            if resync and not self.connected:
+                try:
+                    await self.resync()
+                except Exception as e:
+                    self.logger.debug(f"Lighter account resync failed: {e}")
+                if predicate(self):
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+
+            if self.connected or not resync:
+                wait = remaining
+            else:
+                wait = min(remaining, resync_interval)
+                resync_interval = min(resync_interval * 2, self.max_resync_interval)
+            updated = self._updated
+            try:
+                await asyncio.wait_for(updated.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+    async def wait_for_flat(self, market_id: int, timeout: float) -> bool:
+        """Wait until the position for `market_id` is zero"""
+        return await self.wait_for(lambda stream: stream.is_flat(market_id), timeout)
+
+    async def resync(self):
+        """Replace all positions with a REST account snapshot"""
+        account_response = await self.account_api.account(by="index", value=str(self.account_index))
+        accounts = getattr(account_response, 'accounts', None) or []
+        positions = accounts[0].positions if accounts and accounts[0].positions else []
+
+        received_at = time.monotonic()
+        self._positions = {
+            pos.market_id: LighterPosition(pos.market_id, pos.symbol, self._signed_size(pos.sign, pos.position), received_at)
+            for pos in positions
+        }
+        self._notify()
+
+    async def _run(self):
+        backoff = self.min_backoff
+        while True:
+            started_at = time.monotonic()
+            client = WsClient(
+                host=self.host,
+                account_ids=[self.account_index],
+                on_order_book_update=None,
+                on_account_update=self._on_account_update,
+                proxy=self.proxy,
+            )
+            try:
+                await client.run_async()
+                self.logger.warning("⚠️ Lighter account stream closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"⚠️ Lighter account stream error: {e}")
+            finally:
+                self.connected = False
+
+            # A connection that stayed up for a while resets the backoff
+            if time.monotonic() - started_at > self.max_backoff:
+                backoff = self.min_backoff
+
+            delay = backoff * random.uniform(0.8, 1.2)
+            self.logger.debug(f"Reconnecting Lighter account stream in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _on_account_update(self, account_id, message):
+        positions = message.get("positions") or {}
+        if isinstance(positions, dict):
+            positions = positions.values()
+
+        received_at = time.monotonic()
+        # The subscription snapshot carries every position, updates only the changed ones
+        updated = {} if message.get("type", "").startswith("subscribed") else dict(self._positions)
+        for pos in positions:
+            try:
+                market_id = int(pos["market_id"])
+                updated[market_id] = LighterPosition(
+                    market_id,
+                    pos.get("symbol", ""),
+                    self._signed_size(pos.get("sign", 1), pos.get("position", 0)),
+                    received_at,
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        self._positions = updated
+        self.connected = True
+        self._notify()
+
+    def _notify(self):
+        # Wake every waiter and arm a fresh event for the next update
+        updated, self._updated = self._updated, asyncio.Event()
+        updated.set()
+
+    @staticmethod
+    def _signed_size(sign, position) -> float:
+        size = abs(float(position))
+        return -size if int(sign) < 0 else size
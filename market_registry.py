@@ -0,0 +1,195 @@
+"""
+Market metadata registry for both DEXes
+
+Loads Lighter order book details and Pacifica market info once, indexes them by
+symbol and market id, and refreshes them in the background on a TTL so trading
+paths can look them up without network calls.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Used when Pacifica market info is unavailable
+DEFAULT_PACIFICA_LOT_SIZES: Dict[str, float] = {
+    "BTC": 0.00001,
+    "ETH": 0.01,
+    "HYPE": 1.0,
+    "SOL": 0.01,
+    "BNB": 0.01,
+}
+DEFAULT_PACIFICA_LOT_SIZE = 0.01
+
+
+class MarketRegistry:
+    """Cached market metadata for Lighter and Pacifica"""
+
+    def __init__(
+        self,
+        order_api,
+        pacifica_info_loader: Callable[[], Awaitable[List[Dict]]],
+        allowed_symbols: List[str],
+        ttl: float,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.order_api = order_api
+        self.pacifica_info_loader = pacifica_info_loader
+        self.allowed_symbols = list(allowed_symbols)
+        self.ttl = ttl
+        self.logger = logger or logging.getLogger(__name__)
+
+        # Lighter markets (all markets indexed, traded markets listed separately)
+        self.lighter_markets: List[Dict] = []
+        self._lighter_by_symbol: Dict[str, Dict] = {}
+        self._lighter_details_by_id: Dict[int, Dict] = {}
+
+        # Pacifica markets
+        self._pacifica_by_symbol: Dict[str, Dict] = {}
+
+        self._task: Optional[asyncio.Task] = None
+
+    async def load(self):
+        """Load metadata for both venues"""
+        await self.load_lighter()
+        await self.load_pacifica()
+
+    async def load_lighter(self):
+        """Load every Lighter market's details with a single order_book_details call"""
+        details_response = await self.order_api.order_book_details()
+
+        details_by_id = {}
+        markets = []
+        by_symbol = {}
+        for details in details_response.order_book_details:
+            details_by_id[details.market_id] = {
+                'symbol': details.symbol,
+                'price_decimals': details.price_decimals,
+                'size_decimals': details.size_decimals,
+                'default_imf': details.default_initial_margin_fraction,
+                'min_imf': details.min_initial_margin_fraction,
+                'default_leverage': 10000 / details.default_initial_margin_fraction,
+                'max_leverage': 10000 / details.min_initial_margin_fraction,
+            }
+
+            market_info = {
+                'index': details.market_id,
+                'symbol': details.symbol,
+                'status': details.status,
+                'min_base_amount': details.min_base_amount,
+                'min_quote_amount': details.min_quote_amount,
+            }
+
+            # Filter by allowed trading pairs and active status
+            if details.symbol in self.allowed_symbols and details.status.lower() == 'active':
+                markets.append(market_info)
+                by_symbol[details.symbol] = market_info
+
+        if not markets:
+            raise Exception("No available Lighter markets found")
+
+        # Swap in complete indexes so readers never see a partial refresh
+        self._lighter_details_by_id = details_by_id
+        self._lighter_by_symbol = by_symbol
+        self.lighter_markets = markets
+
+    async def load_pacifica(self):
+        """Load Pacifica lot and tick sizes, keeping defaults if the venue is unavailable"""
+        try:
+            market_infos = await self.pacifica_info_loader()
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not load Pacifica market info, using default lot sizes: {e}")
+            return
+
+        by_symbol = {}
+        for info in market_infos or []:
+            try:
+                by_symbol[info['symbol']] = {
+                    'symbol': info['symbol'],
+                    'lot_size': float(info['lot_size']),
+                    'tick_size': float(info['tick_size']),
+                    'max_leverage': info.get('max_leverage'),
+                }
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        if by_symbol:
+            self._pacifica_by_symbol = by_symbol
+
+    def snapshot(self) -> Dict:
+        """Cached metadata in a JSON-serialisable form"""
+        return {
+            'lighter_markets': self.lighter_markets,
+            'lighter_details': {str(market_id): details for market_id, details in self._lighter_details_by_id.items()},
+            'pacifica_markets': self._pacifica_by_symbol,
+        }
+
+    @staticmethod
+    def parse_snapshot(snapshot: Dict, allowed_symbols: List[str]) -> Tuple[List[Dict], Dict[int, Dict], Dict[str, Dict]]:
+        """
+        Traded markets, details by market id and Pacifica markets from a snapshot().
+        Raises KeyError, TypeError or ValueError if the snapshot is malformed or outdated.
+        """
+        markets = [m for m in snapshot['lighter_markets'] if m['symbol'] in allowed_symbols]
+        if not markets:
+            raise ValueError("No available Lighter markets in snapshot")
+
+        details_by_id = {int(market_id): details for market_id, details in snapshot['lighter_details'].items()}
+        for market in markets:
+            details = details_by_id[int(market['index'])]
+            int(details['price_decimals']), int(details['size_decimals'])
+        return markets, details_by_id, dict(snapshot.get('pacifica_markets') or {})
+
+    def restore(self, snapshot: Dict):
+        """Load metadata from a snapshot() without network calls"""
+        markets, details_by_id, pacifica_by_symbol = self.parse_snapshot(snapshot, self.allowed_symbols)
+        self._lighter_details_by_id = details_by_id
+        self._lighter_by_symbol = {m['symbol']: m for m in markets}
+        self.lighter_markets = markets
+        self._pacifica_by_symbol = pacifica_by_symbol
+
+    def start(self):
+        """Start background refreshes every `ttl` seconds (idempotent)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop(), name="market-registry-refresh")
+
+    async def stop(self):
+        """Cancel the background refresh task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.ttl)
+            try:
+                await self.load()
+                self.logger.debug("Market registry refreshed")
+            except Exception as e:
+                self.logger.warning(f"⚠️ Market registry refresh failed, keeping cached metadata: {e}")
+
+    def lighter_market(self, symbol: str) -> Optional[Dict]:
+        """Traded Lighter market info by symbol"""
+        return self._lighter_by_symbol.get(symbol)
+
+    def lighter_details(self, market_id: int) -> Optional[Dict]:
+        """Lighter market details (decimals, margin fractions) by market id"""
+        return self._lighter_details_by_id.get(market_id)
+
+    def pacifica_lot_size(self, symbol: str) -> float:
+        """Pacifica lot size for a symbol"""
+        info = self._pacifica_by_symbol.get(symbol)
+        if info is not None:
+            return info['lot_size']
+        return DEFAULT_PACIFICA_LOT_SIZES.get(symbol, DEFAULT_PACIFICA_LOT_SIZE)
+
+    def round_pacifica_amount(self, symbol: str, amount: float) -> float:
+        """Round an amount to the Pacifica lot size, never below one lot"""
+        lot_size = self.pacifica_lot_size(symbol)
+        # Fix floating-point precision issues
+        rounded_amount = round(amount / lot_size) * lot_size
+        rounded_amount = round(rounded_amount, 8)
+        return max(rounded_amount, lot_size)
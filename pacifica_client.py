@@ -0,0 +1,327 @@
+"""
+Pacifica Finance async REST client
+
+Non-blocking client on a pooled keep-alive aiohttp session. Trading endpoints are
+signed with the operation type Pacifica expects for them, read-only endpoints
+are sent unsigned, and responses are returned as typed results.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import aiohttp
+
+from lighter import json_codec
+from pacifica_signing import JsonEncoder, MessageSigner, PreparedPayload, canonical_json
+
+SIGNATURE_EXPIRY_WINDOW = 5_000
+
+
+class PacificaApiError(Exception):
+    """Pacifica returned an error status or an unsuccessful response body"""
+
+    def __init__(self, status: int, body: Any):
+        self.status = status
+        self.body = body
+        super().__init__(f"Pacifica API error {status}: {body}")
+
+
+@dataclass(frozen=True)
+class PacificaAccountInfo:
+    """Pacifica account balance and margin summary"""
+    balance: float
+    account_equity: float
+    available_to_spend: float
+    total_margin_used: float
+
+
+@dataclass(frozen=True)
+class PacificaPosition:
+    """Open Pacifica position, `side` is "bid" for long and "ask" for short"""
+    symbol: str
+    side: str
+    amount: str
+    entry_price: float
+
+
+@dataclass(frozen=True)
+class PacificaOrderResult:
+    """Accepted Pacifica order, `filled_amount` is set when the response reports it"""
+    order_id: Optional[int]
+    client_order_id: Optional[str]
+    raw: Dict
+    filled_amount: Optional[str] = None
+
+
+class PacificaClient:
+    """Async Pacifica REST client with pooled connections and proxy support"""
+
+    # Signature operation type for each signed endpoint
+    OPERATION_TYPES: Dict[str, str] = {
+        "/orders/create_market": "create_market_order",
+        "/orders/create": "create_order",
+        "/orders/cancel": "cancel_order",
+        "/orders/cancel_all": "cancel_all_orders",
+        "/account/leverage": "update_leverage",
+    }
+
+    def __init__(
+        self,
+        base_url: str,
+        keypair,
+        proxy: Optional[str] = None,
+        timeout: float = 30,
+        connection_limit: int = 20,
+        logger: Optional[logging.Logger] = None,
+        json_encoder: JsonEncoder = canonical_json,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.keypair = keypair
+        self.account = str(keypair.pubkey())
+        self.proxy = proxy
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.connection_limit = connection_limit
+        self.logger = logger or logging.getLogger(__name__)
+        self.json_encoder = json_encoder
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._signers: Dict[str, MessageSigner] = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers={"User-Agent": "DualDexBot/1.0"},
+                json_serialize=json_codec.dumps,
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _handle_response(self, response: aiohttp.ClientResponse) -> Any:
+        text = await response.text()
+        try:
+            body = json_codec.loads(text) if text else None
+        except ValueError:
+            body = text
+
+        if response.status != 200 or (isinstance(body, dict) and body.get("success") is False):
+            raise PacificaApiError(response.status, body)
+        if isinstance(body, dict) and "data" in body:
+            return body["data"]
+        return body
+
+    async def get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """Unsigned GET for read-only endpoints"""
+        async with self.session.get(f"{self.base_url}{endpoint}", params=params, proxy=self.proxy) as response:
+            return await self._handle_response(response)
+
+    def _signer(self, endpoint: str) -> MessageSigner:
+        """Message signer for an endpoint, built once per operation type"""
+        signer = self._signers.get(endpoint)
+        if signer is None:
+            operation_type = self.OPERATION_TYPES.get(endpoint)
+            if operation_type is None:
+                raise ValueError(f"No signing operation type registered for {endpoint}")
+            signer = MessageSigner(self.keypair, operation_type, SIGNATURE_EXPIRY_WINDOW, self.json_encoder)
+            self._signers[endpoint] = signer
+        return signer
+
+    def prepare_payload(self, endpoint: str, payload: Dict) -> PreparedPayload:
+        """Serialize a payload once for a request that may be signed and sent more than once"""
+        return self._signer(endpoint).prepare_payload(payload)
+
+    async def signed_post(self, endpoint: str, payload: Union[Dict, PreparedPayload]) -> Any:
+        """Signed POST using the operation type registered for the endpoint"""
+        signer = self._signer(endpoint)
+        timestamp = int(time.time() * 1_000)
+        _, signature = signer.sign(payload, timestamp)
+        if isinstance(payload, PreparedPayload):
+            payload = payload.payload
+
+        request_data = {
+            "account": self.account,
+            "signature": signature,
+            "timestamp": timestamp,
+            "expiry_window": SIGNATURE_EXPIRY_WINDOW,
+            **payload
+        }
+
+        async with self.session.post(f"{self.base_url}{endpoint}", json=request_data, proxy=self.proxy) as response:
+            return await self._handle_response(response)
+
+    async def get_market_info(self) -> List[Dict]:
+        """Market specifications (lot size, tick size, leverage) for every symbol"""
+        return await self.get("/info") or []
+
+    async def get_account_info(self) -> PacificaAccountInfo:
+        """Balance and margin summary for this account"""
+        data = await self.get("/account", {"account": self.account})
+        return PacificaAccountInfo(
+            balance=float(data.get("balance", 0)),
+            account_equity=float(data.get("account_equity", 0)),
+            available_to_spend=float(data.get("available_to_spend", 0)),
+            total_margin_used=float(data.get("total_margin_used", 0)),
+        )
+
+    async def get_positions(self) -> List[PacificaPosition]:
+        """All open positions for this account"""
+        data = await self.get("/positions", {"account": self.account})
+        return [
+            PacificaPosition(
+                symbol=item["symbol"],
+                side=item["side"],
+                amount=str(item["amount"]),
+                entry_price=float(item.get("entry_price", 0)),
+            )
+            for item in data or []
+        ]
+
+    async def create_market_order(self, params: Dict) -> PacificaOrderResult:
+        """Place a market order from prepared order parameters"""
+        data = await self.signed_post("/orders/create_market", params)
+        data = data if isinstance(data, dict) else {}
+        filled_amount = data.get("filled_amount")
+        return PacificaOrderResult(
+            order_id=data.get("order_id"),
+            client_order_id=params.get("client_order_id"),
+            raw=data,
+            filled_amount=str(filled_amount) if filled_amount is not None else None,
+        )
+
+    async def get_order_history(self, order_id: int) -> List[Dict]:
+        """Lifecycle events (placement, fills, cancellation) for one order"""
+        return await self.get("/orders/history_by_id", {"order_id": order_id}) or []
+
+    async def get_filled_amount(self, order_id: int) -> Optional[str]:
+        """Total filled amount of an order from its history, None if it has no fills yet"""
+        events = await self.get_order_history(order_id)
+        filled = [event["filled_amount"] for event in events if event.get("filled_amount") is not None]
+        if not filled:
+            return None
+        filled_amount = max(filled, key=float)
+        return str(filled_amount) if float(filled_amount) > 0 else None
+
+
+class PacificaAccountState:
+    """Account balance, margin and positions kept fresh by a background poller"""
+
+    def __init__(self, client: PacificaClient, poll_interval: float, logger: Optional[logging.Logger] = None):
+        self.client = client
+        self.poll_interval = poll_interval
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.account_info: Optional[PacificaAccountInfo] = None
+        self.positions: List[PacificaPosition] = []
+        self.updated_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start background polling (idempotent)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._poll_loop(), name="pacifica-account-state")
+
+    async def stop(self):
+        """Cancel background polling"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def refresh(self):
+        """Fetch account info and positions concurrently and replace the cached state"""
+        account_info, positions = await asyncio.gather(
+            self.client.get_account_info(),
+            self.client.get_positions(),
+        )
+        self.account_info = account_info
+        self.positions = positions
+        self.updated_at = time.monotonic()
+
+    def age(self) -> Optional[float]:
+        """Seconds since the last successful refresh, None if never refreshed"""
+        if self.updated_at is None:
+            return None
+        return time.monotonic() - self.updated_at
+
+    def get_account_info(self, max_age: float) -> Optional[Tuple[PacificaAccountInfo, float]]:
+        """Cached account info and its refresh time if no older than `max_age` seconds"""
+        age = self.age()
+        if self.account_info is None or age is None or age > max_age:
+            return None
+        return self.account_info, self.updated_at
+
+    def get_position(self, symbol: str) -> Optional[PacificaPosition]:
+        """Cached open position for a symbol"""
+        for position in self.positions:
+            if position.symbol == symbol:
+                return position
+        return None
+
+    def position_amount(self, symbol: str) -> float:
+        """Signed cached position amount for a symbol (long positive, short negative), 0.0 if none"""
+        position = self.get_position(symbol)
+        if position is None:
+            return 0.0
+        amount = float(position.amount)
+        return amount if position.side == "bid" else -amount
+
+    async def wait_for(self, predicate: Callable[["PacificaAccountState"], bool], timeout: float,
+                       min_interval: float = 0.1, max_interval: float = 2.0) -> bool:
+        """
+        Refresh until `predicate(self)` holds or `timeout` seconds pass.
+
+        Polling starts at `min_interval` and backs off exponentially to
+        `max_interval`, so fast fills are confirmed quickly without hammering
+        the API while waiting on slow ones. The predicate is only checked
+        against freshly refreshed state, never against a stale cache.
+        """
+        deadline = time.monotonic() + timeout
+        interval = min_interval
+        refreshed = False
+        last_error = None
+        while True:
+            try:
+                await self.refresh()
+                refreshed = True
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                last_error = e
+                self.logger.debug(f"Pacifica account refresh failed: {e}")
+            else:
+                if predicate(self):
+                    return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if not refreshed:
+                    self.logger.warning(f"⚠️ Pacifica account state could not be refreshed within {timeout}s: {last_error}")
+                return False
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 2, max_interval)
+
+    async def _poll_loop(self):
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"⚠️ Pacifica account refresh failed: {e}")
+            await asyncio.sleep(self.poll_interval)
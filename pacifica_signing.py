@@ -0,0 +1,122 @@
+"""
+Pacifica Finance request signing
+
+Messages are the header merged with the payload under `data`, serialized as
+compact JSON with recursively sorted keys, and signed with the Solana keypair.
+
+`MessageSigner` is the hot path used by the client: it renders the header for
+one operation type once and serializes the payload in a single sorted-keys
+pass, producing the same bytes as `prepare_message`.
+"""
+
+import json
+from typing import Any, Callable, Dict, NamedTuple, Tuple, Union
+
+import base58
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Serializes a value as compact JSON with recursively sorted keys
+JsonEncoder = Callable[[Any], str]
+
+
+def sign_message(header, payload, keypair):
+    """Sign a message using the keypair"""
+    message = prepare_message(header, payload)
+    message_bytes = message.encode("utf-8")
+    signature = keypair.sign_message(message_bytes)
+    return (message, base58.b58encode(bytes(signature)).decode("ascii"))
+
+
+def prepare_message(header, payload):
+    """Prepare message for signing"""
+    if (
+        "type" not in header
+        or "timestamp" not in header
+        or "expiry_window" not in header
+    ):
+        raise ValueError("Header must have type, timestamp, and expiry_window")
+
+    data = {
+        **header,
+        "data": payload,
+    }
+
+    message = sort_json_keys(data)
+    message = json.dumps(message, separators=(",", ":"))
+    return message
+
+
+def sort_json_keys(value):
+    """Sort JSON keys recursively"""
+    if isinstance(value, dict):
+        sorted_dict = {}
+        for key in sorted(value.keys()):
+            sorted_dict[key] = sort_json_keys(value[key])
+        return sorted_dict
+    elif isinstance(value, list):
+        return [sort_json_keys(item) for item in value]
+    else:
+        return value
+
+
+def canonical_json(value: Any) -> str:
+    """Compact JSON with recursively sorted keys in one pass, same bytes as sort_json_keys + json.dumps"""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def orjson_canonical_json(value: Any) -> str:
+    """
+    orjson variant of canonical_json, opt-in only (PACIFICA_ORJSON_SIGNING).
+
+    Byte-identical for ASCII strings, integers within 64 bits, booleans, null
+    and floats printed in plain notation, but it diverges on:
+    - non-ASCII strings, written unescaped ("é" instead of "\\u00e9")
+    - floats in exponent notation (1e16 instead of 1e+16, 1e-7 instead of 1e-07)
+    - NaN and infinity, written as null instead of NaN / Infinity
+    - integers beyond 64 bits, which raise TypeError
+    A diverging message is signed over different bytes than the server checks.
+    """
+    return orjson.dumps(value, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+
+
+class PreparedPayload(NamedTuple):
+    """Payload serialized once, for requests that are signed repeatedly with the same body"""
+    payload: Dict
+    json: str
+
+
+class MessageSigner:
+    """
+    Signs messages for one operation type and expiry window.
+
+    Sorted top-level keys are always data, expiry_window, timestamp and type,
+    so the header is rendered once and each message is the encoded payload
+    spliced into it.
+    """
+
+    def __init__(self, keypair, operation_type: str, expiry_window: int, encoder: JsonEncoder = canonical_json):
+        self.keypair = keypair
+        self.operation_type = operation_type
+        self.expiry_window = expiry_window
+        self.encoder = encoder
+        self._middle = f',"expiry_window":{json.dumps(expiry_window)},"timestamp":'
+        self._suffix = f',"type":{json.dumps(operation_type)}}}'
+
+    def prepare_payload(self, payload: Dict) -> PreparedPayload:
+        """Serialize a payload up front so later signatures only render the header"""
+        return PreparedPayload(payload, self.encoder(payload))
+
+    def prepare(self, payload: Union[Dict, PreparedPayload], timestamp: int) -> str:
+        """Canonical message for a payload, same bytes as prepare_message with this header"""
+        encoded = payload.json if isinstance(payload, PreparedPayload) else self.encoder(payload)
+        return f'{{"data":{encoded}{self._middle}{timestamp}{self._suffix}'
+
+    def sign(self, payload: Union[Dict, PreparedPayload], timestamp: int) -> Tuple[str, str]:
+        """Sign a payload, returns the message and the base58 signature"""
+        message = self.prepare(payload, timestamp)
+        signature = self.keypair.sign_message(message.encode("utf-8"))
+        return message, base58.b58encode(bytes(signature)).decode("ascii")
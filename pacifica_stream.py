@@ -0,0 +1,143 @@
+"""
+Pacifica Finance streaming market data
+
+Keeps a single long-lived subscription to the Pacifica `prices` channel and
+maintains a per-symbol last-price cache, so quote lookups never open a socket.
+"""
+
+import asyncio
+import logging
+import random
+import ssl
+import time
+from typing import Dict, NamedTuple, Optional
+
+import websockets
+
+from lighter import json_codec
+
+
+class PriceQuote(NamedTuple):
+    """Last oracle price seen for a symbol and when it was received (monotonic seconds)"""
+    price: float
+    received_at: float
+
+
+class PacificaPriceStream:
+    """Background subscription to Pacifica `prices` with reconnect and backoff"""
+
+    def __init__(
+        self,
+        url: str,
+        logger: Optional[logging.Logger] = None,
+        proxy: Optional[str] = None,
+        min_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        self.url = url
+        # HTTP(S) proxy URL for the websocket connection, None uses the system proxy settings
+        self.proxy = proxy if proxy is not None else True
+        self.logger = logger or logging.getLogger(__name__)
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+
+        self._quotes: Dict[str, PriceQuote] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._first_quote = asyncio.Event()
+        self.connected = False
+
+        # Pacifica's certificate chain is not verified, matching the previous per-call connect
+        self._ssl_context = ssl.create_default_context()
+        self._ssl_context.check_hostname = False
+        self._ssl_context.verify_mode = ssl.CERT_NONE
+
+    def start(self):
+        """Start the background subscription task (idempotent)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="pacifica-price-stream")
+
+    async def stop(self):
+        """Cancel the subscription task and wait for it to exit"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.connected = False
+
+    async def wait_ready(self, timeout: float) -> bool:
+        """Wait until the first price update has been received"""
+        try:
+            await asyncio.wait_for(self._first_quote.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def get_quote(self, symbol: str) -> Optional[PriceQuote]:
+        """Return the last cached quote for a symbol, regardless of age"""
+        return self._quotes.get(symbol)
+
+    def get_price(self, symbol: str, max_age: float) -> Optional[float]:
+        """Return the cached price if it was received within `max_age` seconds"""
+        quote = self._quotes.get(symbol)
+        if quote is None or time.monotonic() - quote.received_at > max_age:
+            return None
+        return quote.price
+
+    async def _run(self):
+        backoff = self.min_backoff
+        while True:
+            try:
+                async with websockets.connect(
+                    self.url, ping_interval=30, ssl=self._ssl_context, proxy=self.proxy
+                ) as websocket:
+                    await websocket.send(json_codec.dumps({"method": "subscribe", "params": {"source": "prices"}}))
+                    self.connected = True
+                    self.logger.info("📡 Pacifica price stream connected")
+
+                    async for message in websocket:
+                        if self._handle_message(message):
+                            backoff = self.min_backoff
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"⚠️ Pacifica price stream error: {e}")
+            finally:
+                self.connected = False
+
+            delay = backoff * random.uniform(0.8, 1.2)
+            self.logger.debug(f"Reconnecting Pacifica price stream in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _handle_message(self, message) -> bool:
+        """Update the cache from a `prices` message, returns True if any price was stored"""
+        try:
+            data = json_codec.loads(message)
+        except ValueError:
+            return False
+
+        if not isinstance(data, dict) or not isinstance(data.get('data'), list):
+            return False
+
+        received_at = time.monotonic()
+        updated = False
+        for price_item in data['data']:
+            if not isinstance(price_item, dict):
+                continue
+            symbol = price_item.get('symbol')
+            # Use oracle price as the most accurate
+            oracle_price = price_item.get('oracle')
+            if symbol and oracle_price:
+                try:
+                    self._quotes[symbol] = PriceQuote(float(oracle_price), received_at)
+                    updated = True
+                except (TypeError, ValueError):
+                    continue
+
+        if updated:
+            self._first_quote.set()
+        return updated
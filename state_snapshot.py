@@ -0,0 +1,71 @@
+"""
+Warm-start state snapshot
+
+Persists what the bot needs to resume trading quickly - market metadata,
+nonce high-water marks, open-position bookkeeping and the last cycle - as a
+small JSON file that is replaced atomically on shutdown and at checkpoints.
+
+Each snapshot records the accounts that wrote it (Lighter account and api
+key index, Pacifica public key) and is only loaded by a bot running with the
+same accounts, so instances sharing a directory never resume from each
+other's nonces or positions.
+"""
+
+import logging
+import os
+import time
+from typing import Dict, Optional
+
+from lighter import json_codec
+
+SNAPSHOT_VERSION = 2
+
+# How long streams get to deliver their first update on a warm start (seconds)
+WARM_START_READY_TIMEOUT = 1.0
+
+
+class StateSnapshot:
+    """Reads and writes the warm-start snapshot file"""
+
+    def __init__(self, path: str, max_age: float, identity: Dict, logger: Optional[logging.Logger] = None):
+        self.path = path
+        self.max_age = max_age
+        self.identity = identity
+        self.logger = logger or logging.getLogger(__name__)
+
+    def save(self, state: Dict):
+        """Write the snapshot atomically so a crash mid-write never leaves a partial file"""
+        payload = {"version": SNAPSHOT_VERSION, "saved_at": time.time(), "identity": self.identity, **state}
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                f.write(json_codec.dumps(payload, default=str))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"⚠️ Could not write state snapshot: {e}")
+
+    def load(self) -> Optional[Dict]:
+        """Read the snapshot, None if it is missing, unreadable, from another version or written for other accounts"""
+        try:
+            with open(self.path, "rb") as f:
+                state = json_codec.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"⚠️ Ignoring unreadable state snapshot: {e}")
+            return None
+
+        if not isinstance(state, dict) or state.get("version") != SNAPSHOT_VERSION:
+            self.logger.warning("⚠️ Ignoring state snapshot from an incompatible version")
+            return None
+        if state.get("identity") != self.identity:
+            self.logger.warning(f"⚠️ Ignoring state snapshot {self.path} written for other accounts: {state.get('identity')}")
+            return None
+        return state
+
+    def age(self, state: Dict) -> float:
+        """Seconds since the snapshot was written"""
+        return time.time() - state.get("saved_at", 0)
+
+    def is_fresh(self, state: Dict) -> bool:
+        return self.age(state) <= self.max_age
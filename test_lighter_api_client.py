@@ -0,0 +1,237 @@
+"""
+Behaviour tests for lighter.ApiClient: model, record and dict response modes
+must expose the same values, compiled deserializers must match the models, and
+trusted clients must make the same requests as validating ones.
+
+Run with: python -m pytest test_lighter_api_client.py
+Timing: python benchmarks/bench_response_modes.py, python benchmarks/bench_trusted_client.py
+"""
+
+import asyncio
+import json
+
+import pydantic
+import pytest
+
+import lighter
+from lighter.api_client import _raw_api_functions
+from lighter.exceptions import ApiValueError
+from lighter.records import ModelRecord
+
+JSON = "application/json"
+
+ORDER = {
+    "order_index": 7, "order_id": "7", "owner_account_index": 12, "initial_base_amount": "1.50",
+    "remaining_base_amount": "0.75", "price": "3024.12", "order_expiry": 1760000000000,
+}
+ORDER_BOOK = {
+    "code": 200, "total_asks": 2, "total_bids": 1,
+    "asks": [ORDER, {**ORDER, "order_index": 8, "order_id": "8", "price": "3024.50"}],
+    "bids": [{**ORDER, "order_index": 9, "order_id": "9", "price": "3023.90"}],
+}
+POSITION = {
+    "market_id": 0, "symbol": "ETH", "initial_margin_fraction": "20.00", "open_order_count": 0,
+    "pending_order_count": 0, "position_tied_order_count": 0, "sign": -1, "position": "0.5000",
+    "avg_entry_price": "3024.12", "position_value": "1512.06", "unrealized_pnl": "1.20",
+    "realized_pnl": "0.00", "liquidation_price": "3500.00", "margin_mode": 0, "allocated_margin": "0",
+}
+ACCOUNTS = {
+    "code": 200, "total": 1,
+    "accounts": [{
+        "code": 200, "account_type": 0, "index": 12, "l1_address": "0xabc", "cancel_all_time": 0,
+        "total_order_count": 1, "total_isolated_order_count": 0, "pending_order_count": 0,
+        "available_balance": "100.00", "status": 1, "collateral": "150.00", "account_index": 12,
+        "name": "", "description": "", "can_invite": True, "referral_points_percentage": "0",
+        "positions": [POSITION, {**POSITION, "market_id": 1, "symbol": "BTC", "sign": 1}],
+        "total_asset_value": "151.20", "cross_asset_value": "151.20", "pool_info": None, "shares": [],
+    }],
+}
+
+
+@pytest.fixture
+def make_client():
+    # ApiClient opens an aiohttp connector, which needs a running event loop
+    loop = asyncio.new_event_loop()
+    clients = []
+
+    def make(**kwargs) -> lighter.ApiClient:
+        async def build():
+            return lighter.ApiClient(**kwargs)
+        client = loop.run_until_complete(build())
+        clients.append(client)
+        return client
+
+    make.run = loop.run_until_complete
+    yield make
+    for client in clients:
+        loop.run_until_complete(client.close())
+    loop.close()
+
+
+def deserialize(client, payload, response_type):
+    return client.deserialize(json.dumps(payload), response_type, JSON)
+
+
+def test_model_mode_is_the_default(make_client):
+    book = deserialize(make_client(), ORDER_BOOK, "OrderBookOrders")
+    assert isinstance(book, lighter.OrderBookOrders)
+    assert book.asks[0].price == "3024.12"
+
+
+def test_record_mode_reads_the_same_values_as_the_model(make_client):
+    model = deserialize(make_client(), ORDER_BOOK, "OrderBookOrders")
+    record = deserialize(make_client(response_mode="record"), ORDER_BOOK, "OrderBookOrders")
+
+    assert isinstance(record, ModelRecord)
+    assert (record.code, record.total_asks, record.total_bids) == (model.code, model.total_asks, model.total_bids)
+    for side in ("asks", "bids"):
+        for record_order, model_order in zip(getattr(record, side), getattr(model, side)):
+            assert isinstance(record_order, ModelRecord)
+            for field in lighter.SimpleOrder.model_fields:
+                if field != "additional_properties":
+                    assert getattr(record_order, field) == getattr(model_order, field)
+    assert record.to_model() == model
+    assert record.to_dict() == ORDER_BOOK
+
+
+def test_record_mode_wraps_nested_lists(make_client):
+    model = deserialize(make_client(), ACCOUNTS, "DetailedAccounts")
+    record = deserialize(make_client(response_mode="record"), ACCOUNTS, "DetailedAccounts")
+
+    record_positions = record.accounts[0].positions
+    model_positions = model.accounts[0].positions
+    assert [(p.symbol, p.sign, p.position) for p in record_positions] == \
+        [(p.symbol, p.sign, p.position) for p in model_positions]
+    assert record.accounts[0].pool_info is None
+    assert record.to_model() == model
+
+
+def test_record_mode_rejects_unknown_fields(make_client):
+    record = deserialize(make_client(response_mode="record"), ORDER_BOOK, "OrderBookOrders")
+    with pytest.raises(AttributeError):
+        record.not_a_field
+
+
+def test_dict_mode_returns_the_parsed_json(make_client):
+    assert deserialize(make_client(response_mode="dict"), ORDER_BOOK, "OrderBookOrders") == ORDER_BOOK
+
+
+def test_fast_response_types_limit_the_fast_mode(make_client):
+    client = make_client(response_mode="record", fast_response_types=["OrderBookOrders"])
+    assert isinstance(deserialize(client, ORDER_BOOK, "OrderBookOrders"), ModelRecord)
+    assert isinstance(deserialize(client, ACCOUNTS, "DetailedAccounts"), lighter.DetailedAccounts)
+
+
+def test_fast_responses_overrides_the_client_mode(make_client):
+    client = make_client()
+    with lighter.ApiClient.fast_responses("dict"):
+        assert deserialize(client, ORDER_BOOK, "OrderBookOrders") == ORDER_BOOK
+    assert isinstance(deserialize(client, ORDER_BOOK, "OrderBookOrders"), lighter.OrderBookOrders)
+
+
+@pytest.mark.parametrize("mode", ["model", "record"])
+def test_compiled_deserializers_match_the_models(make_client, mode):
+    client = make_client(response_mode=mode)
+    orders = deserialize(client, ORDER_BOOK["asks"], "List[SimpleOrder]")
+    expected = [lighter.SimpleOrder.from_dict(order) for order in ORDER_BOOK["asks"]]
+    assert [order.to_model() if mode == "record" else order for order in orders] == expected
+
+    assert deserialize(client, {"BTC": 1, "ETH": 0}, "Dict[str, int]") == {"BTC": 1, "ETH": 0}
+    assert deserialize(client, {"code": 200, "nonce": 42}, "NextNonce").nonce == 42
+    assert deserialize(client, None, "NextNonce") is None
+    assert deserialize(client, [ORDER, None], "List[SimpleOrder]")[1] is None
+
+
+def test_deserializers_are_compiled_once_per_type_and_mode(make_client):
+    client = make_client(response_mode="record", fast_response_types=["OrderBookOrders"])
+    for _ in range(3):
+        deserialize(client, ORDER_BOOK, "OrderBookOrders")
+        deserialize(client, ACCOUNTS, "DetailedAccounts")
+    compiled = dict(client._deserializers)
+    assert set(compiled) == {("OrderBookOrders", "record"), ("DetailedAccounts", "model")}
+    deserialize(client, ORDER_BOOK, "OrderBookOrders")
+    assert client._deserializers == compiled
+
+
+def test_invalid_response_mode(make_client):
+    with pytest.raises(ApiValueError):
+        make_client(response_mode="fast")
+
+
+class StubResponse:
+    """RESTResponse stand-in answering with a fixed JSON body"""
+
+    def __init__(self, payload, status=200):
+        self.data = json.dumps(payload).encode("utf-8")
+        self.status = status
+
+    async def read(self):
+        return self.data
+
+    def getheader(self, name, default=None):
+        return JSON if name.lower() == "content-type" else default
+
+    def getheaders(self):
+        return {"content-type": JSON}
+
+
+def stub_requests(client, payload):
+    """Record the requests `client` makes and answer each with `payload`"""
+    requests = []
+
+    async def call_api(method, url, header_params=None, body=None, post_params=None, _request_timeout=None):
+        requests.append((method, url, body))
+        return StubResponse(payload)
+
+    client.call_api = call_api
+    return requests
+
+
+@pytest.mark.parametrize("api_class", [lighter.OrderApi, lighter.TransactionApi])
+def test_trusted_client_binds_every_validated_method(make_client, api_class):
+    trusted = api_class(make_client(trusted=True))
+    untrusted = api_class(make_client())
+
+    raw = _raw_api_functions(api_class)
+    assert raw, "generated API methods are no longer wrapped in @validate_call"
+    for name, function in raw.items():
+        assert getattr(trusted, name).__func__ is function
+        assert name not in vars(untrusted)
+
+
+def test_trusted_client_binds_http_info_variants():
+    assert {
+        "order_book_orders", "order_book_orders_with_http_info", "order_book_orders_without_preload_content"
+    } <= set(_raw_api_functions(lighter.OrderApi))
+
+
+def test_trusted_client_makes_the_same_request(make_client):
+    results = []
+    for trusted in (False, True):
+        client = make_client(trusted=trusted)
+        requests = stub_requests(client, ORDER_BOOK)
+        book = make_client.run(lighter.OrderApi(client).order_book_orders(market_id=0, limit=50))
+        results.append((requests, book))
+    assert results[0] == results[1]
+    assert results[0][1].asks[0].price == "3024.12"
+
+
+def test_only_untrusted_clients_validate_arguments(make_client):
+    untrusted = make_client()
+    stub_requests(untrusted, ORDER_BOOK)
+    with pytest.raises(pydantic.ValidationError):
+        make_client.run(lighter.OrderApi(untrusted).order_book_orders(market_id="0", limit=50))
+
+    trusted = make_client(trusted=True)
+    requests = stub_requests(trusted, ORDER_BOOK)
+    make_client.run(lighter.OrderApi(trusted).order_book_orders(market_id="0", limit=50))
+    assert len(requests) == 1
+
+
+def test_response_charset_comes_from_the_content_type(make_client):
+    client = make_client()
+    response = StubResponse({"code": 200, "nonce": 7})
+    response.data = json.dumps({"code": 200, "message": "café", "nonce": 7}).encode("utf-16")
+    response.getheader = lambda name, default=None: "application/json; charset=utf-16"
+    result = client.response_deserialize(response, {"200": "NextNonce"})
+    assert (result.data.nonce, result.data.message) == (7, "café")
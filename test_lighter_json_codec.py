@@ -0,0 +1,59 @@
+"""
+Behaviour tests for lighter.json_codec: both backends parse and write the same
+compact JSON, and values orjson cannot handle fall back to the standard library.
+
+Run with: python -m pytest test_lighter_json_codec.py
+Timing: python benchmarks/bench_json_codec.py
+"""
+
+import json
+
+import pytest
+
+from lighter import json_codec
+
+BACKENDS = [name for name in json_codec.BACKENDS if name != "orjson" or json_codec.orjson is not None]
+
+FRAME = {
+    "type": "update/order_book",
+    "channel": "order_book:0",
+    "order_book": {"asks": [{"price": "3024.12", "size": "1.5000"}], "bids": [], "offset": 41},
+    "nested": {"flag": True, "none": None, "float": 0.25, "list": [1, "two", [3]]},
+}
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = json_codec.backend
+    json_codec.set_backend(request.param)
+    yield request.param
+    json_codec.set_backend(previous)
+
+
+def test_dumps_writes_compact_json(backend):
+    assert json_codec.dumps(FRAME) == json.dumps(FRAME, separators=(",", ":"))
+
+
+def test_loads_round_trips(backend):
+    text = json.dumps(FRAME)
+    assert json_codec.loads(text) == FRAME
+    assert json_codec.loads(text.encode("utf-8")) == FRAME
+
+
+def test_values_orjson_cannot_write_fall_back(backend):
+    assert json_codec.dumps({"nonce": 2 ** 70}) == '{"nonce":1180591620717411303424}'
+    assert json_codec.dumps({1: "a"}) == '{"1":"a"}'
+
+
+def test_default_hook(backend):
+    assert json_codec.dumps({"value": {1, 2}}, default=sorted) == '{"value":[1,2]}'
+
+
+def test_invalid_json_raises_value_error(backend):
+    with pytest.raises(ValueError):
+        json_codec.loads("{not json")
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        json_codec.set_backend("ujson")
@@ -0,0 +1,80 @@
+"""
+Behaviour tests for the lazy attributes of lighter, lighter.api and lighter.models:
+importing the package stays light, and every lazy name resolves to the class
+defined in the module its table points to.
+
+Run with: python -m pytest test_lighter_lazy_imports.py
+Timing: python benchmarks/bench_import.py
+"""
+
+import importlib
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import lighter
+import lighter.api
+import lighter.models
+
+PACKAGES = [lighter, lighter.api, lighter.models]
+
+# Model modules missing from this tree, only AccountApi depends on them
+MISSING_MODULES = {"lighter.models.account_api_keys", "lighter.models.api_key", "lighter.models.req_get_account_api_keys"}
+
+
+def run_isolated(code: str) -> str:
+    """Run `code` in a fresh interpreter, so modules imported by other tests do not leak in"""
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def test_import_lighter_loads_no_apis_models_or_eth_account():
+    loaded = run_isolated("""
+        import sys
+        import lighter
+        print(sorted(name for name in sys.modules if name.startswith(("lighter.api.", "lighter.models.", "eth_account"))))
+    """)
+    assert loaded == "[]"
+
+
+def test_resolving_a_name_loads_only_its_module():
+    loaded = run_isolated("""
+        import sys
+        import lighter
+        lighter.OrderBookOrders
+        print(sorted(name for name in sys.modules if name.startswith("lighter.api.")))
+        print("lighter.models.order_book_orders" in sys.modules, "eth_account" in sys.modules)
+    """)
+    assert loaded.splitlines() == ["[]", "True False"]
+
+
+@pytest.mark.parametrize("package", PACKAGES, ids=lambda package: package.__name__)
+def test_every_lazy_name_resolves_to_its_module(package):
+    for name, module in package._LAZY_ATTRIBUTES.items():
+        try:
+            value = getattr(package, name)
+        except ModuleNotFoundError as e:
+            assert e.name in MISSING_MODULES, f"{package.__name__}.{name}: {e}"
+            continue
+        assert value is getattr(importlib.import_module(module), name)
+        assert vars(package)[name] is value  # cached after the first lookup
+
+
+@pytest.mark.parametrize("package", PACKAGES, ids=lambda package: package.__name__)
+def test_dir_lists_lazy_names(package):
+    assert set(package._LAZY_ATTRIBUTES) <= set(dir(package))
+
+
+def test_submodules_resolve_as_attributes():
+    assert lighter.nonce_manager is importlib.import_module("lighter.nonce_manager")
+    assert lighter.models.simple_order is importlib.import_module("lighter.models.simple_order")
+
+
+@pytest.mark.parametrize("package", PACKAGES, ids=lambda package: package.__name__)
+def test_unknown_names_raise_attribute_error(package):
+    with pytest.raises(AttributeError):
+        package.NotARealName
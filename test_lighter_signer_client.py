@@ -0,0 +1,86 @@
+"""
+Behaviour tests for SignerClient's process_api_key_and_nonce decorator: nonce and
+api key resolution for every call style, and nonce release on failed transactions.
+
+Run with: python -m pytest test_lighter_signer_client.py
+Timing: python benchmarks/bench_signer_decorator.py
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from lighter import nonce_manager
+from lighter.signer_client import CODE_OK, process_api_key_and_nonce
+
+
+def make_nonce_manager(api_key: int = 3, nonce: int = 99) -> nonce_manager.OptimisticNonceManager:
+    # Skips the initial fetch from the API
+    manager = nonce_manager.OptimisticNonceManager.__new__(nonce_manager.OptimisticNonceManager)
+    manager.start_api_key = manager.end_api_key = manager.current_api_key = api_key
+    manager.nonce = {api_key: nonce}
+    return manager
+
+
+class StubClient:
+    def __init__(self, code=CODE_OK):
+        self.nonce_manager = make_nonce_manager()
+        self.code = code
+
+    @process_api_key_and_nonce
+    async def create_order(self, market_index, base_amount, reduce_only=False, nonce=-1, api_key_index=-1):
+        call = dict(market_index=market_index, base_amount=base_amount, reduce_only=reduce_only,
+                    nonce=nonce, api_key_index=api_key_index)
+        ret = SimpleNamespace(code=self.code) if self.code is not None else None
+        return call, ret, None
+
+
+def call(client, *args, **kwargs):
+    created, _, _ = asyncio.run(client.create_order(*args, **kwargs))
+    return created
+
+
+def test_defaults_reserve_the_next_nonce():
+    client = StubClient()
+    assert call(client, 1, 500) == dict(market_index=1, base_amount=500, reduce_only=False, nonce=100, api_key_index=3)
+    assert call(client, 1, 500, reduce_only=True)["nonce"] == 101
+
+
+def test_positional_nonce_and_api_key_pass_through():
+    client = StubClient()
+    assert call(client, 1, 500, True, 7, 4) == dict(market_index=1, base_amount=500, reduce_only=True, nonce=7, api_key_index=4)
+    assert client.nonce_manager.nonce == {3: 99}
+
+
+def test_keyword_nonce_and_api_key_pass_through():
+    client = StubClient()
+    assert call(client, 1, base_amount=500, nonce=7, api_key_index=4) == dict(
+        market_index=1, base_amount=500, reduce_only=False, nonce=7, api_key_index=4)
+    assert client.nonce_manager.nonce == {3: 99}
+
+
+def test_positional_nonce_with_keyword_api_key():
+    client = StubClient()
+    created = call(client, 1, 500, False, 7, api_key_index=4)
+    assert (created["nonce"], created["api_key_index"]) == (7, 4)
+
+
+@pytest.mark.parametrize("code", [None, 400])
+def test_failed_transaction_releases_the_reserved_nonce(code):
+    client = StubClient(code=code)
+    call(client, 1, 500)
+    assert client.nonce_manager.nonce == {3: 99}
+
+
+def test_failed_transaction_with_explicit_nonce_leaves_the_manager_alone():
+    client = StubClient(code=400)
+    call(client, 1, 500, nonce=99, api_key_index=3)
+    assert client.nonce_manager.nonce == {3: 99}
+
+
+def test_methods_must_end_with_nonce_and_api_key_index():
+    with pytest.raises(TypeError):
+        @process_api_key_and_nonce
+        async def create_order(self, market_index, api_key_index=-1, nonce=-1):
+            pass
@@ -0,0 +1,82 @@
+"""
+Golden tests for Pacifica signing: MessageSigner must produce the same bytes
+and signatures as prepare_message / sign_message.
+
+Run with: python -m pytest test_pacifica_signing.py
+"""
+
+import pytest
+from solders.keypair import Keypair
+
+from pacifica_signing import (
+    MessageSigner, canonical_json, orjson, orjson_canonical_json, prepare_message, sign_message
+)
+
+KEYPAIR = Keypair.from_seed(bytes(range(32)))
+TIMESTAMP = 1760000000123
+EXPIRY_WINDOW = 5000
+
+PAYLOADS = {
+    "market_order": {
+        "symbol": "BTC",
+        "reduce_only": False,
+        "amount": "0.00123",
+        "side": "bid",
+        "slippage_percent": "0.5",
+        "client_order_id": "5f2b7c1e-3a4d-4e8f-9b0a-1c2d3e4f5a6b",
+    },
+    "nested": {
+        "z": {"b": [3, {"y": None, "x": True}], "a": {"d": -1, "c": 0}},
+        "list_of_dicts": [{"k2": "v2", "k1": "v1"}, []],
+        "empty": {},
+    },
+    "floats": {"price": 3024.12, "tiny": 1e-07, "huge": 1e16, "neg": -0.5, "whole": 2.0},
+    "unicode": {"label": "café ✓", "symbol": "€", "emoji": "🚀"},
+    "large_int": {"id": 2 ** 70, "zero": 0},
+}
+
+# Payloads where orjson_canonical_json diverges from the stdlib encoder
+ORJSON_DIVERGENT = {"floats", "unicode", "large_int"}
+
+
+def header(operation_type: str) -> dict:
+    return {"type": operation_type, "timestamp": TIMESTAMP, "expiry_window": EXPIRY_WINDOW}
+
+
+@pytest.mark.parametrize("name", sorted(PAYLOADS))
+def test_message_signer_matches_prepare_message(name):
+    payload = PAYLOADS[name]
+    signer = MessageSigner(KEYPAIR, "create_market_order", EXPIRY_WINDOW)
+
+    expected = prepare_message(header("create_market_order"), payload)
+    assert signer.prepare(payload, TIMESTAMP) == expected
+    assert signer.prepare(signer.prepare_payload(payload), TIMESTAMP) == expected
+
+
+@pytest.mark.parametrize("name", sorted(PAYLOADS))
+def test_message_signer_signature_matches_sign_message(name):
+    payload = PAYLOADS[name]
+    signer = MessageSigner(KEYPAIR, "cancel_order", EXPIRY_WINDOW)
+
+    assert signer.sign(payload, TIMESTAMP) == sign_message(header("cancel_order"), payload, KEYPAIR)
+
+
+def test_stdlib_encoder_is_the_default():
+    assert MessageSigner(KEYPAIR, "create_order", EXPIRY_WINDOW).encoder is canonical_json
+
+
+@pytest.mark.skipif(orjson is None, reason="orjson not installed")
+@pytest.mark.parametrize("name", sorted(PAYLOADS))
+def test_orjson_encoder_divergence(name):
+    payload = PAYLOADS[name]
+    expected = prepare_message(header("create_order"), payload)
+    signer = MessageSigner(KEYPAIR, "create_order", EXPIRY_WINDOW, orjson_canonical_json)
+
+    if name not in ORJSON_DIVERGENT:
+        assert signer.prepare(payload, TIMESTAMP) == expected
+        return
+    try:
+        message = signer.prepare(payload, TIMESTAMP)
+    except TypeError:
+        return
+    assert message != expected